@@ -9,6 +9,7 @@ This version is designed to run on a single repository and output
 results to GitHub Actions job output instead of generating HTML files.
 """
 
+import asyncio
 import sys
 import logging
 
@@ -16,7 +17,12 @@ from dotenv import load_dotenv
 from errorhandler import ErrorHandler
 
 from edfi_repo_auditor.config import Configuration, load_configuration
-from edfi_repo_auditor.auditor import run_audit
+from edfi_repo_auditor.auditor import (
+    run_audit,
+    run_audit_async,
+    run_collect,
+    run_compute,
+)
 from edfi_repo_auditor.disable_tls import no_ssl_verification
 
 
@@ -30,6 +36,17 @@ def _configure_logging(config: Configuration) -> None:
     )
 
 
+def _run(config: Configuration) -> None:
+    if config.phase == "collect":
+        run_collect(config)
+    elif config.phase == "compute":
+        run_compute(config)
+    elif config.use_async:
+        asyncio.run(run_audit_async(config))
+    else:
+        run_audit(config)
+
+
 def _main():
     load_dotenv()
     config = load_configuration(sys.argv[1:])
@@ -39,14 +56,14 @@ def _main():
 
     try:
         if config.verify_ssl:
-            run_audit(config)
+            _run(config)
         else:
             logging.getLogger(__name__).warning(
                 "SSL certificate verification is disabled. "
                 "This should only be used in trusted network environments."
             )
             with no_ssl_verification():
-                run_audit(config)
+                _run(config)
     except Exception as e:
         logging.getLogger(__name__).error(e, exc_info=True)
 
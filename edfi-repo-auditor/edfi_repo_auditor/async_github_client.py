@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Asyncio front end for the GitHub client.
+
+Each call is dispatched to a dedicated thread pool that drives the pooled
+session of a regular GitHubClient, while an asyncio.Semaphore caps how many
+calls are in flight at once. Callers can therefore fan out every fetch for
+every repository with asyncio.gather and let the client bound the load placed
+on the GitHub API.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar
+
+from edfi_repo_auditor.github_client import DEFAULT_POOL_SIZE, GitHubClient
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+T = TypeVar("T")
+
+
+class AsyncGitHubClient:
+    def __init__(
+        self,
+        access_token: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        cache_dir: Optional[str] = None,
+        state_db: Optional[str] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        # Size the connection pool so that every in-flight call can hold its
+        # own keep-alive connection.
+        self.client = GitHubClient(
+            access_token,
+            pool_size=max(pool_size, max_concurrency),
+            cache_dir=cache_dir,
+            state_db=state_db,
+        )
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="github-api"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        # Created lazily so that the semaphore binds to the running event loop.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, partial(func, *args, **kwargs)
+            )
+
+    def close(self) -> None:
+        """Release the worker threads and pooled connections."""
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+    def log_run_summary(self) -> None:
+        """Log HTTP usage statistics accumulated over the life of this client."""
+        self.client.log_run_summary()
+
+    async def get_repositories(self, owner: str) -> List[str]:
+        return await self._run(self.client.get_repositories, owner)
+
+    async def get_repository_information(self, owner: str, repository: str) -> dict:
+        return await self._run(
+            self.client.get_repository_information, owner, repository
+        )
+
+    async def prefetch_repository_information(
+        self, owner: str, repositories: List[str]
+    ) -> Dict[str, dict]:
+        return await self._run(
+            self.client.prefetch_repository_information, owner, repositories
+        )
+
+    async def load_organization_dependabot_alerts(self, owner: str) -> bool:
+        return await self._run(self.client.load_organization_dependabot_alerts, owner)
+
+    async def get_actions(self, owner: str, repository: str) -> dict:
+        return await self._run(self.client.get_actions, owner, repository)
+
+    async def get_file_content(
+        self, owner: str, repository: str, path: str
+    ) -> Optional[str]:
+        return await self._run(self.client.get_file_content, owner, repository, path)
+
+    async def get_workflow_files(self, owner: str, repository: str) -> Dict[str, str]:
+        return await self._run(self.client.get_workflow_files, owner, repository)
+
+    async def get_root_file_names(
+        self, owner: str, repository: str
+    ) -> Optional[Set[str]]:
+        return await self._run(self.client.get_root_file_names, owner, repository)
+
+    async def get_workflow_runs(
+        self, owner: str, repository: str, since_days: int = 30, per_page: int = 100
+    ) -> List[dict]:
+        return await self._run(
+            self.client.get_workflow_runs, owner, repository, since_days, per_page
+        )
+
+    async def load_organization_merged_prs(
+        self,
+        owner: str,
+        since_days: int = 30,
+        repositories: Optional[List[str]] = None,
+    ) -> bool:
+        return await self._run(
+            self.client.load_organization_merged_prs, owner, since_days, repositories
+        )
+
+    async def get_merged_prs_with_reviews(
+        self, owner: str, repository: str, since_days: int = 30
+    ) -> List[dict]:
+        return await self._run(
+            self.client.get_merged_prs_with_reviews, owner, repository, since_days
+        )
+
+    async def has_dependabot_enabled(self, owner: str, repository: str) -> bool:
+        return await self._run(self.client.has_dependabot_enabled, owner, repository)
@@ -8,23 +8,39 @@ GitHub Actions auditor that runs on a single repository and outputs
 results to GitHub Actions job summary instead of generating HTML files.
 """
 
+import asyncio
 import logging
 import os
-import re
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Set
 from datetime import datetime, timedelta, timezone
 
 import pandas as pd
+import requests
 
 from edfi_repo_auditor.checklist import (
     CHECKLIST,
     get_message,
 )
 from edfi_repo_auditor.config import Configuration
+from edfi_repo_auditor.async_github_client import AsyncGitHubClient
 from edfi_repo_auditor.github_client import GitHubClient
-from edfi_repo_auditor.job_metrics import get_job_failure_metrics
+from edfi_repo_auditor.job_metrics import (
+    LAST_N_DAYS as JOB_METRICS_DAYS,
+    compute_job_failure_metrics,
+    get_job_failure_metrics,
+)
 from edfi_repo_auditor.ossf_score import get_ossf_score
-from edfi_repo_auditor.pr_metrics import get_pr_metrics
+from edfi_repo_auditor.pr_metrics import (
+    LAST_N_DAYS as PR_METRICS_DAYS,
+    compute_pr_metrics,
+    get_pr_metrics,
+)
+from edfi_repo_auditor.snapshot import Snapshot, read_snapshot, write_snapshot
+from edfi_repo_auditor.task_graph import Task, TaskTimeoutError, run_task_graph
+from edfi_repo_auditor.workflow_scan import WorkflowScan
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -32,62 +48,440 @@ logger: logging.Logger = logging.getLogger(__name__)
 ALERTS_INCLUDED_SEVERITIES = ["CRITICAL", "HIGH"]
 ALERTS_WEEKS_SINCE_CREATED = 3
 
+# Audit steps per repository that call the GitHub API concurrently
+GITHUB_STEPS_PER_REPOSITORY = 5
+
+# Days back the time-windowed snapshot entities are collected for; computing
+# from a snapshot needs at least this much history
+COLLECTION_WINDOWS = {
+    "merged_prs": PR_METRICS_DAYS,
+    "workflow_runs": JOB_METRICS_DAYS,
+}
+
+# Files every repository is expected to contain, in report order
+STANDARD_FILES = [
+    CHECKLIST.NOTICES,
+    CHECKLIST.CODE_OF_CONDUCT,
+    CHECKLIST.LICENSE,
+    CHECKLIST.CONTRIBUTORS,
+    CHECKLIST.SECURITY,
+    CHECKLIST.AGENTS,
+]
+
 
 def run_audit(config: Configuration) -> None:
     """
     Run audit on a single repository and output results to GitHub Actions.
 
+    With config.jobs greater than one, that many repositories are audited at
+    once on a worker pool. Results are still written in repository order, so
+    the job summary and CSV report match a serial run, and a failure in one
+    repository does not stop the others from being audited.
+
     Args:
         config: Configuration with repository details
     """
-    client = GitHubClient(config.personal_access_token)
+    client = GitHubClient(
+        config.personal_access_token,
+        pool_size=max(config.pool_size, config.jobs * GITHUB_STEPS_PER_REPOSITORY),
+        cache_dir=config.cache_dir,
+        state_db=config.state_db,
+    )
+
+    try:
+        organization = config.organization
+
+        whole_organization = len(config.repositories) == 0
+        repositories = (
+            config.repositories
+            if not whole_organization
+            else client.get_repositories(config.organization)
+        )
+
+        if len(repositories) > 1:
+            # Reading every open alert and every PR merged in the organization
+            # only pays off when the whole organization is audited.
+            if whole_organization:
+                client.load_organization_dependabot_alerts(organization)
+            client.load_organization_merged_prs(
+                organization,
+                repositories=None if whole_organization else repositories,
+            )
+            client.prefetch_repository_information(organization, repositories)
+
+        report_data = []
+
+        with ThreadPoolExecutor(
+            max_workers=config.jobs, thread_name_prefix="audit"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _audit_repository,
+                    client,
+                    organization,
+                    repository,
+                    config.task_timeout,
+                )
+                for repository in repositories
+            ]
+
+            # Waiting on the futures in submission order keeps the output
+            # deterministic regardless of which repository finishes first.
+            for repository, future in zip(repositories, futures):
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logger.error(
+                        f"Failed to audit {organization}/{repository}: {e}",
+                        exc_info=True,
+                    )
+                    continue
+
+                output_to_github_actions(repository, results)
+
+                report_data.append({"repository": repository, **results})
+
+        if config.save_results is True:
+            save_to_csv(pd.DataFrame(report_data), config.file_name)
+    finally:
+        client.log_run_summary()
+        client.close()
+
+    logger.info("Audit complete.")
+
+
+def _audit_repository(
+    client: GitHubClient,
+    organization: str,
+    repository: str,
+    task_timeout: Optional[float] = None,
+) -> dict:
+    logger.info(f"Auditing repository {organization}/{repository}")
+    started = time.perf_counter()
+
+    def job_metrics_failed(error: BaseException) -> dict:
+        if not isinstance(error, (RuntimeError, TaskTimeoutError)):
+            raise error
+        logger.warning(
+            f"Failed to compute job failure rate metrics for "
+            f"{organization}/{repository}: {error}"
+        )
+        return {}
+
+    def ossf_score_failed(error: BaseException) -> dict:
+        if not isinstance(error, (requests.RequestException, TaskTimeoutError)):
+            raise error
+        logger.warning(
+            f"Failed to get the OpenSSF score for {organization}/{repository}: "
+            f"{error}"
+        )
+        return {"OSSF Score": None}
+
+    # The audit steps do not depend on each other, so they all run at once;
+    # a slow step no longer holds up the rest of the repository's audit.
+    results = run_task_graph(
+        [
+            Task(
+                "repo_config",
+                partial(get_repo_information, client, organization, repository),
+                timeout=task_timeout,
+            ),
+            Task(
+                "actions",
+                partial(audit_actions, client, organization, repository),
+                timeout=task_timeout,
+            ),
+            Task(
+                "file_review",
+                partial(review_files, client, organization, repository),
+                timeout=task_timeout,
+            ),
+            Task(
+                "pr_metrics",
+                partial(get_pr_metrics, client, organization, repository),
+                timeout=task_timeout,
+            ),
+            Task(
+                "job_metrics",
+                partial(get_job_failure_metrics, client, organization, repository),
+                timeout=task_timeout,
+                on_error=job_metrics_failed,
+            ),
+            Task(
+                "ossf_score",
+                partial(get_ossf_score, organization, repository),
+                timeout=task_timeout,
+                on_error=ossf_score_failed,
+            ),
+        ]
+    )
+
+    for name, result in results.items():
+        logger.debug(f"{name}: {result}")
+
+    logger.info(
+        f"Audited {organization}/{repository} in {time.perf_counter() - started:.2f}s"
+    )
+
+    return _combine_results(
+        results["ossf_score"],
+        results["actions"],
+        results["file_review"],
+        results["repo_config"],
+        results["pr_metrics"],
+        results["job_metrics"],
+    )
+
+
+async def run_audit_async(config: Configuration) -> None:
+    """
+    Run the audit with every per-repository fetch issued concurrently.
 
-    organization = config.organization
+    Every repository's audit is started at once on a worker thread, running
+    the same steps as run_audit; the client's concurrency limit, sized from
+    max_concurrency, bounds how many GitHub API calls are actually in flight.
+    Output is written in the same repository order and with the same content
+    as run_audit.
 
-    repositories = (
-        config.repositories
-        if len(config.repositories) > 0
-        else client.get_repositories(config.organization)
+    Args:
+        config: Configuration with repository details
+    """
+    client = AsyncGitHubClient(
+        config.personal_access_token,
+        max_concurrency=config.max_concurrency,
+        pool_size=config.pool_size,
+        cache_dir=config.cache_dir,
+        state_db=config.state_db,
     )
 
-    report_data = []
+    try:
+        organization = config.organization
 
-    for repository in repositories:
-
-        logger.info(f"Auditing repository {organization}/{repository}")
-
-        # Perform all audits
-        repo_config = get_repo_information(client, organization, repository)
-        logger.debug(f"Repo configuration: {repo_config}")
-        actions = audit_actions(client, organization, repository)
-        logger.debug(f"Actions {actions}")
-        file_review = review_files(client, organization, repository)
-        logger.debug(f"Files: {file_review}")
-        pr_metrics = get_pr_metrics(client, config.organization, repository)
-        logger.debug(f"PR Metrics: {pr_metrics}")
-        try:
-            job_metrics = get_job_failure_metrics(client, organization, repository)
-        except RuntimeError as e:
-            logger.warning(
-                f"Failed to compute job failure rate metrics for "
-                f"{organization}/{repository}: {e}"
+        whole_organization = len(config.repositories) == 0
+        repositories = (
+            config.repositories
+            if not whole_organization
+            else await client.get_repositories(organization)
+        )
+
+        if len(repositories) > 1:
+            # Reading every open alert and every PR merged in the organization
+            # only pays off when the whole organization is audited.
+            if whole_organization:
+                await client.load_organization_dependabot_alerts(organization)
+            await client.load_organization_merged_prs(
+                organization,
+                repositories=None if whole_organization else repositories,
             )
-            job_metrics = {}
-        logger.debug(f"Job Failure Rate Metrics: {job_metrics}")
-        ossf_score = get_ossf_score(organization, repository)
-        logger.debug(f"OpenSSF Score: {ossf_score}")
-
-        results = {
-            **ossf_score,
-            **actions,
-            **file_review,
-            **repo_config,
-            **pr_metrics,
-            **job_metrics,
-        }
+            await client.prefetch_repository_information(organization, repositories)
+
+        # Each repository runs the same task graph as the threaded audit, so
+        # both modes share the step functions, timeouts and error fallbacks.
+        all_results = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    _audit_repository,
+                    client.client,
+                    organization,
+                    repository,
+                    config.task_timeout,
+                )
+                for repository in repositories
+            ),
+            return_exceptions=True,
+        )
 
-        output_to_github_actions(repository, results)
+        report_data = []
+        for repository, results in zip(repositories, all_results):
+            if isinstance(results, BaseException):
+                logger.error(
+                    f"Failed to audit {organization}/{repository}: {results}",
+                    exc_info=results,
+                )
+                continue
+
+            output_to_github_actions(repository, results)
+            report_data.append({"repository": repository, **results})
+
+        if config.save_results is True:
+            save_to_csv(pd.DataFrame(report_data), config.file_name)
+    finally:
+        client.log_run_summary()
+        client.close()
+
+    logger.info("Audit complete.")
+
+
+def run_collect(config: Configuration) -> None:
+    """
+    Collect phase: fetch every raw GitHub result the audit evaluates and write
+    it to a snapshot in config.snapshot_dir, without computing any results.
+
+    Unlike the audit, which stops reading workflow files once every workflow
+    check has passed, collection reads all of them, so that any checklist
+    definition can later be evaluated from the snapshot. A repository that
+    cannot be collected is logged and left out of the snapshot.
+
+    Args:
+        config: Configuration with repository details
+    """
+    if not config.snapshot_dir:
+        raise ValueError("snapshot_dir is required to collect a snapshot")
+
+    collected_at = datetime.now(timezone.utc)
+    client = GitHubClient(
+        config.personal_access_token,
+        pool_size=max(config.pool_size, config.jobs * GITHUB_STEPS_PER_REPOSITORY),
+        cache_dir=config.cache_dir,
+        state_db=config.state_db,
+    )
+
+    try:
+        organization = config.organization
+
+        whole_organization = len(config.repositories) == 0
+        repositories = (
+            config.repositories
+            if not whole_organization
+            else client.get_repositories(config.organization)
+        )
+
+        if len(repositories) > 1:
+            # Reading every open alert and every PR merged in the organization
+            # only pays off when the whole organization is audited.
+            if whole_organization:
+                client.load_organization_dependabot_alerts(organization)
+            client.load_organization_merged_prs(
+                organization,
+                since_days=COLLECTION_WINDOWS["merged_prs"],
+                repositories=None if whole_organization else repositories,
+            )
+            client.prefetch_repository_information(organization, repositories)
+
+        collected: Dict[str, Dict[str, Any]] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=config.jobs, thread_name_prefix="collect"
+        ) as executor:
+            futures = [
+                executor.submit(_collect_repository, client, organization, repository)
+                for repository in repositories
+            ]
+
+            for repository, future in zip(repositories, futures):
+                try:
+                    collected[repository] = future.result()
+                except Exception as e:
+                    logger.error(
+                        f"Failed to collect {organization}/{repository}: {e}",
+                        exc_info=True,
+                    )
+
+        write_snapshot(
+            config.snapshot_dir,
+            organization,
+            collected_at,
+            collected,
+            windows=COLLECTION_WINDOWS,
+        )
+    finally:
+        client.log_run_summary()
+        client.close()
+
+    logger.info("Collection complete.")
+
+
+def _collect_repository(
+    client: GitHubClient, organization: str, repository: str
+) -> Dict[str, Any]:
+    logger.info(f"Collecting repository {organization}/{repository}")
+
+    actions = client.get_actions(organization, repository)
+    workflow_files: Dict[str, Optional[str]] = dict(
+        client.get_workflow_files(organization, repository)
+        if actions["workflows"]
+        else {}
+    )
+    for workflow in actions["workflows"]:
+        if workflow["path"] not in workflow_files:
+            workflow_files[workflow["path"]] = client.get_file_content(
+                organization, repository, workflow["path"]
+            )
+
+    information = client.get_repository_information(organization, repository)
+    dependabot_enabled = information.get("hasVulnerabilityAlertsEnabled")
+    if dependabot_enabled is None:
+        dependabot_enabled = client.has_dependabot_enabled(organization, repository)
+
+    collected: Dict[str, Any] = {
+        "actions": actions,
+        "workflow_files": workflow_files,
+        "repository_information": information,
+        "dependabot_enabled": dependabot_enabled,
+        "root_files": sorted(_find_standard_files(client, organization, repository)),
+        "merged_prs": client.get_merged_prs_with_reviews(
+            organization, repository, since_days=COLLECTION_WINDOWS["merged_prs"]
+        ),
+        "ossf_score": get_ossf_score(organization, repository),
+    }
+
+    try:
+        collected["workflow_runs"] = client.get_workflow_runs(
+            organization, repository, since_days=COLLECTION_WINDOWS["workflow_runs"]
+        )
+    except RuntimeError as e:
+        logger.warning(
+            f"Failed to collect workflow runs for {organization}/{repository}: {e}"
+        )
+
+    return collected
+
+
+def run_compute(config: Configuration) -> None:
+    """
+    Compute phase: rebuild every checklist result and metric from the
+    snapshot in config.snapshot_dir, without calling the GitHub API.
+
+    Time windows (merged PRs, workflow runs, alert age) end at the time the
+    snapshot was collected, so recomputing an old snapshot gives the results
+    of that day. Output matches run_audit; config.repositories, when given,
+    limits it to those repositories.
+
+    Args:
+        config: Configuration with the snapshot directory, and optionally the
+            organization the snapshot is expected to belong to
+
+    Raises:
+        ValueError: when config.organization is given and the snapshot was
+            collected for another organization, or when the snapshot holds
+            less history than a metric's time window needs
+    """
+    if not config.snapshot_dir:
+        raise ValueError("snapshot_dir is required to compute from a snapshot")
+
+    snapshot = read_snapshot(config.snapshot_dir)
+    if (
+        config.organization
+        and config.organization.lower() != snapshot.organization.lower()
+    ):
+        raise ValueError(
+            f"Snapshot in {config.snapshot_dir} was collected for "
+            f"{snapshot.organization}, not {config.organization}"
+        )
+    _check_collection_windows(snapshot, config.snapshot_dir)
+    logger.info(
+        f"Computing results for {len(snapshot.repositories)} repositories in "
+        f"{snapshot.organization} collected at {snapshot.collected_at}"
+    )
 
+    report_data = []
+    for repository in snapshot.repositories:
+        if config.repositories and repository not in config.repositories:
+            continue
+
+        results = evaluate_repository(snapshot, repository)
+
+        output_to_github_actions(repository, results)
         report_data.append({"repository": repository, **results})
 
     if config.save_results is True:
@@ -96,70 +490,125 @@ def run_audit(config: Configuration) -> None:
     logger.info("Audit complete.")
 
 
+def _check_collection_windows(snapshot: Snapshot, directory: str) -> None:
+    for entity, days in COLLECTION_WINDOWS.items():
+        collected = snapshot.windows.get(entity)
+        if collected is None:
+            logger.warning(
+                f"Snapshot in {directory} does not record how many days of "
+                f"{entity} were collected; assuming at least {days}"
+            )
+        elif collected < days:
+            raise ValueError(
+                f"Snapshot in {directory} holds {collected} days of {entity}, "
+                f"but {days} are needed"
+            )
+
+
+def evaluate_repository(snapshot: Snapshot, repository: str) -> dict:
+    """Evaluate all audit results of one repository from a snapshot."""
+    now = snapshot.collected_at
+
+    actions = snapshot.get("actions", repository)
+    workflow_files = snapshot.get("workflow_files", repository) or {}
+    information = snapshot.get("repository_information", repository)
+
+    dependabot_results = evaluate_alerts(
+        information["vulnerabilityAlerts"]["nodes"],
+        snapshot.get("dependabot_enabled", repository),
+        now,
+    )
+    job_metrics = (
+        compute_job_failure_metrics(snapshot.get("workflow_runs", repository), now)
+        if snapshot.has("workflow_runs", repository)
+        else {}
+    )
+
+    return _combine_results(
+        snapshot.get("ossf_score", repository) or {"OSSF Score": None},
+        evaluate_actions(
+            actions,
+            (workflow_files.get(workflow["path"]) for workflow in actions["workflows"]),
+        ),
+        evaluate_files(set(snapshot.get("root_files", repository))),
+        evaluate_repo_information(information, dependabot_results),
+        compute_pr_metrics(snapshot.get("merged_prs", repository), now),
+        job_metrics,
+    )
+
+
+def _combine_results(
+    ossf_score: dict,
+    actions: dict,
+    file_review: dict,
+    repo_config: dict,
+    pr_metrics: dict,
+    job_metrics: dict,
+) -> dict:
+    """Merge the individual audit results in report column order."""
+    return {
+        **ossf_score,
+        **actions,
+        **file_review,
+        **repo_config,
+        **pr_metrics,
+        **job_metrics,
+    }
+
+
 def audit_actions(client: GitHubClient, organization: str, repository: str) -> dict:
     """Audit GitHub Actions configuration."""
-    audit_results: dict = {}
-
     actions = client.get_actions(organization, repository)
 
     logger.debug(f"Got {actions['total_count']} workflow files")
 
-    audit_results[CHECKLIST.HAS_ACTIONS["description"]] = get_message(
-        CHECKLIST.HAS_ACTIONS, actions["total_count"] > 0
+    # One query returns every file in .github/workflows; only workflows it
+    # does not cover (binary, truncated, or defined elsewhere) are fetched
+    # one by one.
+    workflow_files = (
+        client.get_workflow_files(organization, repository)
+        if actions["workflows"]
+        else {}
     )
-
-    ut_pattern = re.compile(r"unit.{0,2}test(s)?", flags=re.IGNORECASE)
-    approved_actions_pattern = re.compile(
-        r"uses:\s*ed-fi-alliance-oss/ed-fi-actions/.github/workflows/repository-scanner\.yml",
-        flags=re.IGNORECASE,
+    # A generator, so files after the point where every check has passed
+    # are never fetched.
+    workflow_contents = (
+        (
+            workflow_files[workflow["path"]]
+            if workflow["path"] in workflow_files
+            else client.get_file_content(organization, repository, workflow["path"])
+        )
+        for workflow in actions["workflows"]
     )
-    workflow_paths = [workflow["path"] for workflow in actions["workflows"]]
 
-    for file_path in workflow_paths:
-        file_content = client.get_file_content(organization, repository, file_path)
-        if not file_content:
-            logger.debug("File not found")
-            continue
+    return evaluate_actions(actions, workflow_contents)
 
-        if (
-            CHECKLIST.APPROVED_ACTIONS["description"] not in audit_results
-            or audit_results[CHECKLIST.APPROVED_ACTIONS["description"]]
-            == CHECKLIST.APPROVED_ACTIONS["fail"]
-        ):
-            audit_results[CHECKLIST.APPROVED_ACTIONS["description"]] = get_message(
-                CHECKLIST.APPROVED_ACTIONS,
-                approved_actions_pattern.search(file_content) is not None,
-            )
 
-        if (
-            CHECKLIST.TEST_REPORTER["description"] not in audit_results
-            or audit_results[CHECKLIST.TEST_REPORTER["description"]]
-            == CHECKLIST.TEST_REPORTER["fail"]
-        ):
-            audit_results[CHECKLIST.TEST_REPORTER["description"]] = get_message(
-                CHECKLIST.TEST_REPORTER,
-                "uses: dorny/test-reporter" in file_content
-                or "uses: EnricoMi/publish-unit-test-result-action" in file_content,
-            )
+def evaluate_actions(actions: dict, workflow_contents: Iterable[Optional[str]]) -> dict:
+    """
+    Evaluate the Actions checklist items from already-fetched data.
 
-        if (
-            CHECKLIST.UNIT_TESTS["description"] not in audit_results
-            or audit_results[CHECKLIST.UNIT_TESTS["description"]]
-            == CHECKLIST.UNIT_TESTS["fail"]
-        ):
-            audit_results[CHECKLIST.UNIT_TESTS["description"]] = get_message(
-                CHECKLIST.UNIT_TESTS, ut_pattern.search(file_content) is not None
-            )
+    Args:
+        actions: Response from the actions/workflows endpoint
+        workflow_contents: Text of each workflow file, None when not found.
+            May be a lazy iterable; it is not advanced once every workflow
+            check has passed.
+    """
+    scan = WorkflowScan()
+    for file_content in workflow_contents:
+        if scan.add(file_content):
+            break
 
-        if (
-            CHECKLIST.CODEQL["description"] not in audit_results
-            or audit_results[CHECKLIST.CODEQL["description"]]
-            == CHECKLIST.CODEQL["fail"]
-        ):
-            audit_results[CHECKLIST.CODEQL["description"]] = get_message(
-                CHECKLIST.CODEQL,
-                "uses: github/codeql-action/analyze" in file_content,
-            )
+    return _actions_results(actions, scan)
+
+
+def _actions_results(actions: dict, scan: WorkflowScan) -> dict:
+    audit_results: dict = {}
+
+    audit_results[CHECKLIST.HAS_ACTIONS["description"]] = get_message(
+        CHECKLIST.HAS_ACTIONS, actions["total_count"] > 0
+    )
+    audit_results.update(scan.results())
 
     return audit_results
 
@@ -216,9 +665,18 @@ def get_repo_information(
     information = client.get_repository_information(organization, repository)
 
     dependabot_results = audit_alerts(
-        client, organization, repository, information["vulnerabilityAlerts"]["nodes"]
+        client,
+        organization,
+        repository,
+        information["vulnerabilityAlerts"]["nodes"],
+        information.get("hasVulnerabilityAlertsEnabled"),
     )
 
+    return evaluate_repo_information(information, dependabot_results)
+
+
+def evaluate_repo_information(information: dict, dependabot_results: dict) -> dict:
+    """Evaluate repository settings and branch rules from already-fetched data."""
     branch_rule_results = _get_main_branch_rule_results(information)
 
     return {
@@ -248,10 +706,34 @@ def get_repo_information(
 
 
 def audit_alerts(
-    client: GitHubClient, organization: str, repository: str, alerts: List[dict]
+    client: GitHubClient,
+    organization: str,
+    repository: str,
+    alerts: List[dict],
+    dependabot_enabled: Optional[bool] = None,
 ) -> dict:
-    """Audit dependabot alerts."""
-    cutoff = datetime.now(timezone.utc) - timedelta(ALERTS_WEEKS_SINCE_CREATED * 7)
+    """
+    Audit dependabot alerts.
+
+    `dependabot_enabled` is the repository's hasVulnerabilityAlertsEnabled
+    value from GraphQL; the REST probe is only made when it is unknown.
+    """
+    if dependabot_enabled is None:
+        dependabot_enabled = client.has_dependabot_enabled(organization, repository)
+
+    return evaluate_alerts(alerts, dependabot_enabled)
+
+
+def evaluate_alerts(
+    alerts: List[dict], dependabot_enabled: bool, now: Optional[datetime] = None
+) -> dict:
+    """
+    Evaluate Dependabot status and open alerts from already-fetched data,
+    counting alert age up to `now` (default: the current time).
+    """
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(
+        ALERTS_WEEKS_SINCE_CREATED * 7
+    )
     vulnerabilities = [
         alert
         for alert in alerts
@@ -263,7 +745,6 @@ def audit_alerts(
     ]
     total_vulnerabilities = len(vulnerabilities)
 
-    dependabot_enabled = client.has_dependabot_enabled(organization, repository)
     return {
         CHECKLIST.DEPENDABOT_ENABLED["description"]: get_message(
             CHECKLIST.DEPENDABOT_ENABLED, dependabot_enabled
@@ -275,34 +756,57 @@ def audit_alerts(
 
 
 def review_files(client: GitHubClient, organization: str, repository: str) -> dict:
-    """Review required files in the repository."""
-    file_audit: dict = {}
-
-    files_to_review = [
-        CHECKLIST.NOTICES,
-        CHECKLIST.CODE_OF_CONDUCT,
-        CHECKLIST.LICENSE,
-        CHECKLIST.CONTRIBUTORS,
-        CHECKLIST.SECURITY,
-        CHECKLIST.AGENTS,
-    ]
+    """
+    Review required files in the repository.
+
+    Presence is checked against the root tree of the default branch with one
+    request; only if the tree cannot be read is each file requested in turn.
+    """
+    return evaluate_files(_find_standard_files(client, organization, repository))
+
+
+def _find_standard_files(
+    client: GitHubClient, organization: str, repository: str
+) -> Set[str]:
+    """
+    Return the names of the files at the root of the repository, or, when the
+    root tree cannot be read, the names of the standard files that exist.
+    """
+    root_files = client.get_root_file_names(organization, repository)
+    if root_files is not None:
+        return root_files
+
+    found_files: Set[str] = set()
+
+    for file in STANDARD_FILES:
+        for filename in _standard_filenames(file):
+            if client.get_file_content(organization, repository, filename) is not None:
+                found_files.add(filename)
+                break
 
-    for file in files_to_review:
-        file_found = (
-            client.get_file_content(organization, repository, file["filename"])
-            is not None
+    return found_files
+
+
+def evaluate_files(found_files: Set[str]) -> dict:
+    """
+    Evaluate the standard-files checklist items.
+
+    Args:
+        found_files: Names of the standard files that exist in the repository
+    """
+    return {
+        file["description"]: get_message(
+            file, any(name in found_files for name in _standard_filenames(file))
         )
-        if not file_found and "alternate_filename" in file:
-            file_found = (
-                client.get_file_content(
-                    organization, repository, file["alternate_filename"]
-                )
-                is not None
-            )
+        for file in STANDARD_FILES
+    }
 
-        file_audit[file["description"]] = get_message(file, file_found)
 
-    return file_audit
+def _standard_filenames(file: dict) -> List[str]:
+    """Return the primary filename of a checklist item followed by any fallback."""
+    if "alternate_filename" in file:
+        return [file["filename"], file["alternate_filename"]]
+    return [file["filename"]]
 
 
 def output_to_github_actions(repository: str, results: dict) -> None:
@@ -0,0 +1,214 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Adaptive limit on the number of GitHub requests in flight.
+
+The ConcurrencyController applies additive-increase/multiplicative-decrease
+(AIMD): while responses come back healthy the limit grows by roughly one
+request per round trip, and on a throttled response (403/429) or a sustained
+rise in latency it is cut in half. This finds the most parallelism GitHub will
+tolerate without tripping its secondary rate limits.
+
+Latency is averaged separately for each class of comparable requests, so that
+a run of multi-second GraphQL queries is not mistaken for congestion by
+comparing it with quick REST calls.
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_INITIAL_LIMIT = 4
+
+# Fraction of the limit kept after a throttled response or a latency spike.
+DECREASE_FACTOR = 0.5
+
+# Latency is "rising" when the recent average exceeds the long-run average by
+# this factor.
+LATENCY_TOLERANCE = 2.0
+
+# Smoothing for the recent and long-run latency averages.
+FAST_LATENCY_WEIGHT = 0.3
+SLOW_LATENCY_WEIGHT = 0.05
+
+# Healthy responses of a class needed before its latency is trusted as a
+# congestion signal.
+MIN_LATENCY_SAMPLES = 20
+
+DEFAULT_LATENCY_CLASS = "default"
+
+
+@dataclass
+class _LatencyStats:
+    fast: float
+    slow: float
+    samples: int = 1
+
+
+class ConcurrencyController:
+    def __init__(
+        self,
+        max_limit: int,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if min_limit < 1:
+            raise ValueError("min_limit must be at least 1")
+        if max_limit < min_limit:
+            raise ValueError("max_limit must be at least min_limit")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._last_decrease = -math.inf
+
+        self._latency: Dict[str, _LatencyStats] = {}
+
+        self._peak_limit = int(self._limit)
+        self._lowest_limit = int(self._limit)
+        self._peak_in_flight = 0
+        self._throttle_events = 0
+        self._latency_events = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent.
+
+        Returns:
+            Start time, to be passed back to `release`.
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            return self._clock()
+
+    def release(
+        self,
+        started: float,
+        throttled: bool = False,
+        failed: bool = False,
+        latency_class: str = DEFAULT_LATENCY_CLASS,
+        hold: bool = False,
+    ) -> None:
+        """
+        Record the outcome of a request started by `acquire`.
+
+        Args:
+            started: Value returned by `acquire`
+            throttled: GitHub rejected the request with a rate limit
+            failed: The request failed for another reason; it neither grows
+                nor shrinks the limit
+            latency_class: Kind of request, whose latency is only compared
+                with that of requests of the same kind
+            hold: Keep the request's slot, for a response whose body is still
+                being read; `free` gives it back
+        """
+        now = self._clock()
+        with self._condition:
+            # Only grow while the window is reasonably full; otherwise a
+            # sequential caller would inflate the limit it never uses.
+            saturated = self._in_flight * 2 >= self._limit
+            if not hold:
+                self._in_flight -= 1
+
+            if throttled:
+                self._throttle_events += 1
+                self._decrease(started, now, "throttled")
+            elif not failed:
+                if self._record_latency(latency_class, now - started):
+                    self._latency_events += 1
+                    self._decrease(started, now, "latency rising")
+                elif saturated and self._limit < self.max_limit:
+                    self._limit = min(self._limit + 1 / self._limit, self.max_limit)
+                    self._peak_limit = max(self._peak_limit, int(self._limit))
+
+            self._condition.notify_all()
+
+    def free(self) -> None:
+        """Give back a slot kept by `release` with `hold`."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def _record_latency(self, latency_class: str, latency: float) -> bool:
+        """
+        Update the latency averages of a class and report whether its latency
+        is rising.
+        """
+        stats = self._latency.get(latency_class)
+        if stats is None:
+            self._latency[latency_class] = _LatencyStats(fast=latency, slow=latency)
+            return False
+
+        stats.fast += FAST_LATENCY_WEIGHT * (latency - stats.fast)
+        stats.slow += SLOW_LATENCY_WEIGHT * (latency - stats.slow)
+        stats.samples += 1
+
+        return (
+            stats.samples >= MIN_LATENCY_SAMPLES
+            and stats.fast > stats.slow * LATENCY_TOLERANCE
+        )
+
+    def _decrease(self, started: float, now: float, reason: str) -> None:
+        # Requests sent before the last cut were sized by the old limit; one
+        # burst of throttled responses should only cut the limit once.
+        if started < self._last_decrease:
+            return
+
+        previous = int(self._limit)
+        self._limit = max(self._limit * DECREASE_FACTOR, float(self.min_limit))
+        self._last_decrease = now
+        self._decreases += 1
+        self._lowest_limit = min(self._lowest_limit, int(self._limit))
+        # Start judging latency afresh at the new level of concurrency.
+        for stats in self._latency.values():
+            stats.fast = stats.slow
+
+        logger.info(
+            f"Reducing GitHub API concurrency from {previous} to {int(self._limit)}: "
+            f"{reason}"
+        )
+
+    def summary(self) -> Dict[str, int]:
+        """Concurrency limits and congestion signals observed during this run."""
+        with self._condition:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "peak_limit": self._peak_limit,
+                "lowest_limit": self._lowest_limit,
+                "peak_in_flight": self._peak_in_flight,
+                "throttle_events": self._throttle_events,
+                "latency_events": self._latency_events,
+                "decreases": self._decreases,
+            }
+
+    def log_summary(self) -> None:
+        stats = self.summary()
+        logger.info(
+            f"GitHub API concurrency: limit {stats['limit']} "
+            f"(range {stats['lowest_limit']}-{stats['peak_limit']}, "
+            f"peak in flight {stats['peak_in_flight']}), "
+            f"{stats['throttle_events']} throttled responses, "
+            f"{stats['latency_events']} latency spikes, "
+            f"{stats['decreases']} reductions"
+        )
@@ -4,10 +4,13 @@
 # See the LICENSE and NOTICES files in the project root for more information.
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from configargparse import ArgParser
 
+from edfi_repo_auditor.async_github_client import DEFAULT_MAX_CONCURRENCY
+from edfi_repo_auditor.github_client import DEFAULT_POOL_SIZE
+
 DEFAULT_LOG_LEVEL = "INFO"
 
 
@@ -24,6 +27,15 @@ class Configuration:
     save_results: bool
     file_name: str
     verify_ssl: bool = True
+    pool_size: int = DEFAULT_POOL_SIZE
+    jobs: int = 1
+    task_timeout: Optional[float] = None
+    use_async: bool = False
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    cache_dir: Optional[str] = None
+    state_db: Optional[str] = None
+    phase: str = "all"
+    snapshot_dir: Optional[str] = None
 
 
 def load_configuration(args_in: List[str]) -> Configuration:
@@ -32,8 +44,8 @@ def load_configuration(args_in: List[str]) -> Configuration:
     parser.add(  # type: ignore
         "-o",
         "--organization",
-        required=True,
-        help="GitHub organization name",
+        required=False,
+        help="GitHub organization name (required unless --phase compute)",
         type=str,
         env_var="AUDIT_ORGANIZATION",
     )
@@ -41,8 +53,8 @@ def load_configuration(args_in: List[str]) -> Configuration:
     parser.add(  # type: ignore
         "-p",
         "--access_token",
-        required=True,
-        help="GitHub personal access token (PAT) with repo read permission",
+        required=False,
+        help="GitHub personal access token (PAT) with repo read permission (required unless --phase compute)",
         type=str,
         env_var="AUDIT_ACCESS_TOKEN",
     )
@@ -94,14 +106,124 @@ def load_configuration(args_in: List[str]) -> Configuration:
         env_var="AUDIT_NO_VERIFY_SSL",
     )
 
+    parser.add(  # type: ignore
+        "--pool_size",
+        required=False,
+        help=f"Number of pooled keep-alive connections to the GitHub API (default: {DEFAULT_POOL_SIZE})",
+        default=DEFAULT_POOL_SIZE,
+        type=int,
+        env_var="AUDIT_POOL_SIZE",
+    )
+
+    parser.add(  # type: ignore
+        "-j",
+        "--jobs",
+        required=False,
+        help="Number of repositories to audit in parallel (default: 1)",
+        default=1,
+        type=int,
+        env_var="AUDIT_JOBS",
+    )
+
+    parser.add(  # type: ignore
+        "--task_timeout",
+        required=False,
+        help="Seconds each audit step of a repository may run before it is abandoned (default: no limit)",
+        default=None,
+        type=float,
+        env_var="AUDIT_TASK_TIMEOUT",
+    )
+
+    parser.add(  # type: ignore
+        "--use_async",
+        action="store_true",
+        help="Fetch data for all repositories concurrently with the asyncio client",
+        env_var="AUDIT_USE_ASYNC",
+    )
+
+    parser.add(  # type: ignore
+        "--max_concurrency",
+        required=False,
+        help=f"Maximum number of in-flight GitHub API calls in async mode (default: {DEFAULT_MAX_CONCURRENCY})",
+        default=DEFAULT_MAX_CONCURRENCY,
+        type=int,
+        env_var="AUDIT_MAX_CONCURRENCY",
+    )
+
+    parser.add(  # type: ignore
+        "--cache_dir",
+        required=False,
+        help="Directory for caching GitHub REST responses between runs (default: no cache)",
+        default=None,
+        type=str,
+        env_var="AUDIT_CACHE_DIR",
+    )
+
+    parser.add(  # type: ignore
+        "--state_db",
+        required=False,
+        help="SQLite file of workflow runs and merged PRs with reviews, synced incrementally between runs (default: none)",
+        default=None,
+        type=str,
+        env_var="AUDIT_STATE_DB",
+    )
+
+    parser.add(  # type: ignore
+        "--phase",
+        required=False,
+        help="Run the whole audit, only collect a raw-data snapshot, or only compute results from one (default: all)",
+        default="all",
+        type=str,
+        env_var="AUDIT_PHASE",
+        choices=["all", "collect", "compute"],
+    )
+
+    parser.add(  # type: ignore
+        "--snapshot_dir",
+        required=False,
+        help="Directory of the raw-data snapshot written by --phase collect and read by --phase compute",
+        default=None,
+        type=str,
+        env_var="AUDIT_SNAPSHOT_DIR",
+    )
+
     parsed = parser.parse_args(args_in)
 
+    if parsed.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    # The compute phase reads everything from the snapshot and makes no API
+    # calls, so it needs neither the organization nor a token.
+    if parsed.phase != "compute":
+        missing = [
+            option
+            for option, value in (
+                ("-o/--organization", parsed.organization),
+                ("-p/--access_token", parsed.access_token),
+            )
+            if not value
+        ]
+        if missing:
+            parser.error(f"the following arguments are required: {', '.join(missing)}")
+
+    if parsed.phase != "all" and not parsed.snapshot_dir:
+        parser.error(f"--snapshot_dir is required for --phase {parsed.phase}")
+
     return Configuration(
-        parsed.organization,
-        parsed.access_token,
+        parsed.organization or "",
+        parsed.access_token or "",
         parsed.repositories,
         parsed.log_level,
         parsed.save_results,
         parsed.file_name,
         verify_ssl=not parsed.no_verify_ssl,
+        pool_size=parsed.pool_size,
+        jobs=parsed.jobs,
+        task_timeout=parsed.task_timeout,
+        use_async=parsed.use_async,
+        max_concurrency=parsed.max_concurrency,
+        cache_dir=parsed.cache_dir,
+        state_db=parsed.state_db,
+        phase=parsed.phase,
+        snapshot_dir=parsed.snapshot_dir,
     )
@@ -3,32 +3,65 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+import codecs
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Tuple
-from json import dumps
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, closing
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+from json import dumps, loads
 
 import base64
-import pandas as pd
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 
+from edfi_repo_auditor.concurrency import ConcurrencyController
+from edfi_repo_auditor.http_cache import HttpCache
 from edfi_repo_auditor.log_helper import http_error
+from edfi_repo_auditor.page_size import PageSizeLimits, PageSizer
+from edfi_repo_auditor.rate_limit import RateLimiter, resource_for_url
+from edfi_repo_auditor.retry import TRANSIENT_STATUS_CODES, Retrier, is_idempotent
+from edfi_repo_auditor.state_store import PULL_REQUESTS, WORKFLOW_RUNS, StateStore
 
 API_URL = "https://api.github.com"
 GRAPHQL_ENDPOINT = f"{API_URL}/graphql"
 
-# Note that this doesn't handle paging and thus will not be sufficient if there
-# are more than 100 repositories.
+# Number of keep-alive connections held open per host. Should be at least the
+# number of threads issuing requests through a single client.
+DEFAULT_POOL_SIZE = 10
+
+# Media type that makes the contents API return a file's bytes as-is instead
+# of base64 inside a JSON document.
+RAW_MEDIA_TYPE = "application/vnd.github.raw"
+
+# Largest file read by get_file_content; anything beyond is not downloaded.
+DEFAULT_MAX_FILE_BYTES = 1024 * 1024
+
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+# Severities requested from the organization Dependabot alert stream; the
+# audit only reports on these.
+ORGANIZATION_ALERT_SEVERITIES = "critical,high"
+
+# How many times a single call is retried after being rate limited before the
+# error is surfaced.
+MAX_RATE_LIMIT_RETRIES = 5
+
 REPOSITORIES_TEMPLATE = """
-query($owner: String!) {
+query($owner: String!, $cursor: String) {
   organization(login: $owner) {
     id
-    repositories(first: 100) {
+    repositories(first: 100, after: $cursor) {
       totalCount
       nodes {
         name
       }
+      pageInfo { hasNextPage endCursor }
     }
   }
 }
@@ -36,125 +69,639 @@ query($owner: String!) {
 
 # Note that this doesn't handle paging and thus will not be sufficient if there
 # are more than 100 alerts.
-REPOSITORY_INFORMATION_TEMPLATE = """
-query($owner: String!, $repository: String!) {
-  repository(name: $repository, owner: $owner) {
-    vulnerabilityAlerts(first: 100, states: [OPEN]) {
-      nodes {
-        createdAt
-        securityVulnerability {
-          package {
-            name
-          }
-          advisory {
-            severity
-          }
+REPOSITORY_INFORMATION_FRAGMENT = """
+fragment RepositoryInformation on Repository {
+  vulnerabilityAlerts(first: 100, states: [OPEN]) @include(if: $includeAlerts) {
+    nodes {
+      createdAt
+      securityVulnerability {
+        package {
+          name
+        }
+        advisory {
+          severity
         }
       }
     }
-    rulesets(first: 10) {
-      nodes {
-        bypassActors(first: 10) {
-          edges {
-            node {
-              organizationAdmin
-              actor {
-                __typename
-              }
+  }
+  rulesets(first: 10) {
+    nodes {
+      bypassActors(first: 10) {
+        edges {
+          node {
+            organizationAdmin
+            actor {
+              __typename
             }
           }
         }
-        conditions {
-          refName {
-            include
-          }
+      }
+      conditions {
+        refName {
+          include
         }
-        enforcement
-        name
-        rules(first: 20) {
-          nodes {
-            type
+      }
+      enforcement
+      name
+      rules(first: 20) {
+        nodes {
+          type
+        }
+      }
+      target
+    }
+  }
+  hasWikiEnabled
+  hasIssuesEnabled
+  hasProjectsEnabled
+  hasVulnerabilityAlertsEnabled
+  deleteBranchOnMerge
+  squashMergeAllowed
+  licenseInfo {
+    key
+  }
+}
+""".strip()
+
+REPOSITORY_INFORMATION_TEMPLATE = """
+query($owner: String!, $repository: String!, $includeAlerts: Boolean = true) {
+  repository(name: $repository, owner: $owner) {
+    ...RepositoryInformation
+  }
+}
+""".strip() + "\n" + REPOSITORY_INFORMATION_FRAGMENT
+
+WORKFLOW_FILES_TEMPLATE = """
+query($owner: String!, $repository: String!) {
+  repository(name: $repository, owner: $owner) {
+    object(expression: "HEAD:.github/workflows") {
+      ... on Tree {
+        entries {
+          name
+          path
+          type
+          object {
+            ... on Blob {
+              isBinary
+              isTruncated
+              text
+            }
           }
         }
-        target
       }
     }
-    hasWikiEnabled
-    hasIssuesEnabled
-    hasProjectsEnabled
-    deleteBranchOnMerge
-    squashMergeAllowed
-    licenseInfo {
-      key
+  }
+}
+""".strip()
+
+# Number of repositories requested by the first batched repository-information
+# query, and the bounds within which later batches are resized.
+DEFAULT_INFORMATION_BATCH_SIZE = 20
+MAX_INFORMATION_BATCH_SIZE = 50
+
+# GraphQL rate-limit points a batched query should cost. Larger queries are
+# more likely to time out on GitHub's side.
+TARGET_INFORMATION_BATCH_COST = 10
+
+PULL_REQUEST_WITH_REVIEWS_FRAGMENT = """
+fragment PullRequestWithReviews on PullRequest {
+  id
+  number
+  createdAt
+  closedAt
+  mergedAt
+  author { login }
+  additions
+  deletions
+  changedFiles
+  reviews(first: 100) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      author { login }
+      state
+      submittedAt
     }
   }
 }
 """.strip()
 
+# Pull requests whose further review pages are requested in one follow-up
+# query.
+REVIEW_FOLLOW_UP_BATCH_SIZE = 20
+
 PULL_REQUESTS_WITH_REVIEWS_TEMPLATE = """
-query($owner: String!, $repo: String!, $cursor: String) {
+query($owner: String!, $repo: String!, $cursor: String, $pageSize: Int!) {
   repository(owner: $owner, name: $repo) {
     pullRequests(
-      first: 20
+      first: $pageSize
       states: [MERGED]
       orderBy: {field: UPDATED_AT, direction: DESC}
       after: $cursor
     ) {
       nodes {
-        number
-        createdAt
-        closedAt
-        mergedAt
-        author { login }
-        additions
-        deletions
-        changedFiles
-        reviews(first: 100) {
-          pageInfo { hasNextPage }
-          nodes {
-            author { login }
-            state
-            submittedAt
-          }
-        }
+        updatedAt
+        ...PullRequestWithReviews
       }
       pageInfo { hasNextPage endCursor }
     }
   }
+  rateLimit { cost remaining }
 }
-""".strip()
+""".strip() + "\n" + PULL_REQUEST_WITH_REVIEWS_FRAGMENT
+
+MERGED_PULL_REQUEST_SEARCH_TEMPLATE = """
+query($query: String!, $cursor: String, $pageSize: Int!) {
+  search(type: ISSUE, query: $query, first: $pageSize, after: $cursor) {
+    issueCount
+    nodes {
+      ... on PullRequest {
+        repository { name }
+        ...PullRequestWithReviews
+      }
+    }
+    pageInfo { hasNextPage endCursor }
+  }
+  rateLimit { cost remaining }
+}
+""".strip() + "\n" + PULL_REQUEST_WITH_REVIEWS_FRAGMENT
+
+# GitHub search returns at most this many results for one query, however many
+# match; a date range with more merged PRs is split in half and searched again.
+SEARCH_RESULT_LIMIT = 1000
+
+# Repositories named by `repo:` qualifiers in one scoped search; GitHub limits
+# the length of a search query, so longer lists are searched in groups.
+REPOSITORIES_PER_SEARCH = 10
+
+# The actions/runs endpoint stops returning results once page * per_page
+# passes this many, although total_count still reports the true total.
+WORKFLOW_RUNS_RESULT_LIMIT = 1000
+
+_RUN_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Bounds for the adaptive page sizes of the paginated pull-request queries.
+# Each PR brings up to 100 reviews, so even the largest page stays far below
+# GitHub's node limit; latency is what limits it in practice.
+PAGE_SIZE_LIMITS: Dict[str, PageSizeLimits] = {
+    "pull_requests": PageSizeLimits(initial=20, minimum=5, maximum=100),
+    "merged_pr_search": PageSizeLimits(initial=50, minimum=5, maximum=100),
+}
+
+# Error message of a GraphQL query that timed out on GitHub's side; the data
+# is then null or partial.
+GRAPHQL_TIMEOUT_MESSAGE = "Something went wrong while executing your query"
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+class GraphQLTimeoutError(RuntimeError):
+    """A GraphQL query that GitHub gave up on before it completed."""
+
+
+def _is_graphql_rate_limited(response: Response) -> bool:
+    """GraphQL reports an exhausted budget as a 200 with a RATE_LIMITED error."""
+    if "RATE_LIMITED" not in response.text:
+        return False
+    try:
+        body = response.json()
+    except ValueError:
+        return False
+    return isinstance(body, dict) and any(
+        isinstance(error, dict) and error.get("type") == "RATE_LIMITED"
+        for error in body.get("errors", [])
+    )
+
+
+def _latency_class(resource: str, payload: str) -> str:
+    """
+    Group requests whose latencies are comparable: REST calls by rate-limit
+    resource, and GraphQL queries by query text, since a page of PRs with
+    their reviews takes far longer than a repository lookup.
+    """
+    if resource != "graphql" or not payload:
+        return resource
+    try:
+        query = loads(payload).get("query", "")
+    except (ValueError, AttributeError):
+        return resource
+    return f"graphql {hash(query)}"
+
+
+def _is_graphql_timeout(response: Response) -> bool:
+    """
+    GraphQL reports a query that timed out on GitHub's side as a 200 with an
+    error, and null or partial data.
+    """
+    # Most bodies are ruled out without decoding them; _execute_api_call
+    # decodes the rest anyway.
+    if GRAPHQL_TIMEOUT_MESSAGE not in response.text:
+        return False
+    # Only the errors count: the data may hold arbitrary repository content,
+    # such as workflow files, that happens to contain the same words.
+    try:
+        body = response.json()
+    except ValueError:
+        return False
+    return isinstance(body, dict) and any(
+        isinstance(error, dict)
+        and str(error.get("message", "")).startswith(GRAPHQL_TIMEOUT_MESSAGE)
+        for error in body.get("errors") or []
+    )
+
+
+def _is_transient_failure(resource: str, response: Response) -> bool:
+    """
+    Gateway errors, and GraphQL queries that time out on GitHub's side, are
+    likely to succeed if repeated.
+    """
+    if response.status_code in TRANSIENT_STATUS_CODES:
+        return True
+    return (
+        resource == "graphql"
+        and response.status_code == requests.codes.ok
+        and _is_graphql_timeout(response)
+    )
+
+
+def _alert_node(alert: dict) -> dict:
+    """
+    Reshape a REST Dependabot alert like the GraphQL vulnerabilityAlerts nodes
+    of the repository information query.
+    """
+    return {
+        "createdAt": alert["created_at"],
+        "securityVulnerability": {
+            "package": {"name": alert["security_vulnerability"]["package"]["name"]},
+            "advisory": {"severity": alert["security_advisory"]["severity"].upper()},
+        },
+    }
+
+
+def _review_record(review: dict) -> dict:
+    return {
+        "user": (review.get("author") or {}).get("login"),
+        "state": review.get("state"),
+        "submitted_at": review.get("submittedAt"),
+    }
+
+
+def _review_overflow(node: dict) -> Optional[Tuple[str, str]]:
+    """
+    Return the node ID and review cursor of a PR with more reviews than its
+    first page holds, or None.
+    """
+    page_info = (node.get("reviews") or {}).get("pageInfo") or {}
+    if page_info.get("hasNextPage") and node.get("id") and page_info.get("endCursor"):
+        return node["id"], page_info["endCursor"]
+    return None
+
+
+def _review_pages_query(count: int) -> str:
+    """
+    Build one query that fetches the next page of reviews of `count` pull
+    requests, aliased p0, p1, ... and selected by the variables $id0, $after0,
+    $id1, $after1, ...
+    """
+    variables = ", ".join(
+        f"$id{index}: ID!, $after{index}: String" for index in range(count)
+    )
+    aliases = "\n".join(
+        f"  p{index}: node(id: $id{index}) {{\n"
+        "    ... on PullRequest {\n"
+        f"      reviews(first: 100, after: $after{index}) {{\n"
+        "        pageInfo { hasNextPage endCursor }\n"
+        "        nodes { author { login } state submittedAt }\n"
+        "      }\n"
+        "    }\n"
+        "  }"
+        for index in range(count)
+    )
+    return f"query({variables}) {{\n{aliases}\n}}"
+
+
+def _pull_request_record(node: dict) -> dict:
+    """
+    Convert a PullRequestWithReviews node to the REST-like record returned by
+    get_merged_prs_with_reviews.
+    """
+    review_data = node.get("reviews") or {}
+    reviews = [_review_record(r) for r in review_data.get("nodes", [])]
+    return {
+        "number": node["number"],
+        "created_at": node.get("createdAt"),
+        "closed_at": node.get("closedAt"),
+        "merged_at": node.get("mergedAt"),
+        "user": (node.get("author") or {}).get("login"),
+        "additions": node.get("additions"),
+        "deletions": node.get("deletions"),
+        "changed_files": node.get("changedFiles"),
+        "reviews": reviews,
+    }
+
+
+def _workflow_run_record(run: dict) -> dict:
+    return {
+        "id": run.get("id"),
+        "name": run.get("name"),
+        "status": run.get("status"),
+        "conclusion": run.get("conclusion"),
+        "created_at": run.get("created_at"),
+        "path": run.get("path"),
+    }
+
+
+def _repository_information_batch_query(count: int) -> str:
+    """
+    Build one query that fetches the repository information of `count`
+    repositories, aliased r0, r1, ... and named by the variables $r0, $r1, ...
+    """
+    variables = ", ".join(f"$r{index}: String!" for index in range(count))
+    aliases = "\n".join(
+        f"  r{index}: repository(name: $r{index}, owner: $owner) {{\n"
+        "    ...RepositoryInformation\n"
+        "  }"
+        for index in range(count)
+    )
+    return (
+        f"query($owner: String!, $includeAlerts: Boolean = true, {variables}) {{\n"
+        f"{aliases}\n"
+        "  rateLimit {\n    cost\n  }\n"
+        "}\n" + REPOSITORY_INFORMATION_FRAGMENT
+    )
+
+
 class GitHubClient:
-    def __init__(self, access_token: str):
+    def __init__(
+        self,
+        access_token: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        cache_dir: Optional[str] = None,
+        state_db: Optional[str] = None,
+    ):
         if len(access_token.strip()) == 0:
             raise ValueError("access_token cannot be blank")
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
         self.access_token = access_token
 
-    def _execute_api_call(
-        self, description: str, method: str, url: str, payload: str = ""
-    ) -> dict:
-        headers = {
+        # A single long-lived session lets every REST and GraphQL call reuse
+        # the same TLS connections to api.github.com instead of paying a new
+        # handshake per request. The underlying urllib3 pool is thread-safe,
+        # so one client can be shared by concurrent workers.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._stats_lock = threading.Lock()
+        self._request_count = 0
+
+        self.rate_limiter = RateLimiter()
+        self.retrier = Retrier()
+        self.page_sizer = PageSizer(PAGE_SIZE_LIMITS)
+
+        # Revalidating cached REST responses costs no rate-limit budget when
+        # GitHub answers 304 Not Modified.
+        self.cache = HttpCache(cache_dir) if cache_dir else None
+
+        # Completed workflow runs and merged PRs rarely change, so with a local
+        # store only what changed since the previous sync is downloaded again.
+        self.store = StateStore(state_db) if state_db else None
+
+        self._information_batch_size = DEFAULT_INFORMATION_BATCH_SIZE
+        self._prefetched_lock = threading.Lock()
+        self._prefetched_information: Dict[Tuple[str, str], dict] = {}
+        self._alerts_lock = threading.Lock()
+        self._organization_alerts: Dict[str, Dict[str, List[dict]]] = {}
+        self._merged_prs_lock = threading.Lock()
+        # Window in days, the repositories searched (None for the whole
+        # organization), and their PRs, by organization.
+        self._organization_merged_prs: Dict[
+            str, Tuple[int, Optional[FrozenSet[str]], Dict[str, List[dict]]]
+        ] = {}
+        # Never allow more requests in flight than there are pooled connections.
+        self.concurrency = ConcurrencyController(max_limit=pool_size)
+
+    def close(self) -> None:
+        """Close all pooled connections held by this client."""
+        self._session.close()
+        if self.store is not None:
+            self.store.close()
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        """
+        Report how many HTTP requests this client has sent and how many
+        connections were opened to serve them.
+
+        Returns:
+            Dictionary with "requests", "connections_opened", and
+            "connections_reused" counts.
+        """
+        opened = 0
+        for adapter in set(self._session.adapters.values()):
+            pools = getattr(adapter, "poolmanager", None)
+            if pools is None:
+                continue
+            for key in pools.pools.keys():
+                pool = pools.pools.get(key)
+                opened += getattr(pool, "num_connections", 0)
+
+        with self._stats_lock:
+            requests_sent = self._request_count
+
+        return {
+            "requests": requests_sent,
+            "connections_opened": opened,
+            "connections_reused": max(requests_sent - opened, 0),
+        }
+
+    def log_run_summary(self) -> None:
+        """Log HTTP usage statistics accumulated over the life of this client."""
+        stats = self.get_connection_stats()
+        logger.info(
+            f"GitHub API: {stats['requests']} requests over "
+            f"{stats['connections_opened']} connections "
+            f"({stats['connections_reused']} reused)"
+        )
+        self.rate_limiter.log_summary()
+        self.concurrency.log_summary()
+        self.retrier.log_summary()
+        self.page_sizer.log_summary()
+        if self.cache is not None:
+            self.cache.log_summary()
+        if self.store is not None:
+            self.store.log_summary()
+
+    def _headers(self) -> Dict[str, str]:
+        return {
             "Authorization": f"bearer {self.access_token}",
             "Content-Type": "application/json",
         }
 
+    def _send(
+        self,
+        description: str,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        payload: str = "",
+        stream: bool = False,
+        retry_graphql_timeouts: bool = True,
+    ) -> Response:
+        """
+        Send a request, pacing it against the rate limits and concurrency
+        limit, and repeating it after throttling or a transient failure.
+
+        With `retry_graphql_timeouts` off, a GraphQL query that timed out is
+        returned at once, so that the caller can ask for less instead.
+
+        With `stream` on, the returned response keeps its concurrency slot
+        while its body is read; the caller gives it back with
+        `self.concurrency.free()` once the response is closed.
+
+        Returns the final response whatever its status.
+        """
+        resource = resource_for_url(url)
+        retryable = is_idempotent(method, payload)
+        latency_class = _latency_class(resource, payload)
+        attempt = 0
+        retries = 0
+        while True:
+            self.rate_limiter.before_request(resource)
+
+            started = self.concurrency.acquire()
+            try:
+                with self._stats_lock:
+                    self._request_count += 1
+
+                response: Response = self._session.request(
+                    method, url, headers=headers, data=payload, stream=stream
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.concurrency.release(started, failed=True)
+                if retryable and self.retrier.retry(
+                    resource, retries, f"{description}: {e}"
+                ):
+                    retries += 1
+                    continue
+                raise
+            except BaseException:
+                self.concurrency.release(started, failed=True)
+                raise
+
+            self.rate_limiter.update(resource, response.headers)
+
+            status_code = response.status_code
+            if (
+                resource == "graphql"
+                and status_code == requests.codes.ok
+                and _is_graphql_rate_limited(response)
+            ):
+                status_code = requests.codes.too_many_requests
+
+            delay = self.rate_limiter.throttle_delay(
+                resource,
+                status_code,
+                response.headers,
+                response.text if status_code >= 400 else "",
+            )
+            transient = _is_transient_failure(resource, response)
+            graphql_timeout = transient and response.status_code == requests.codes.ok
+            # Release the slot before any back-off so that a sleeping thread
+            # does not hold capacity other requests could use. A streamed
+            # response keeps its slot until it is either returned or
+            # discarded, which after a transient failure follows the back-off.
+            self.concurrency.release(
+                started,
+                throttled=delay is not None,
+                failed=transient,
+                latency_class=latency_class,
+                hold=stream,
+            )
+
+            if delay is not None:
+                if attempt >= MAX_RATE_LIMIT_RETRIES:
+                    return response
+                attempt += 1
+                response.close()
+                if stream:
+                    self.concurrency.free()
+                self.rate_limiter.wait(
+                    resource, delay, f"rate limited on {description}"
+                )
+            elif (
+                transient
+                and retryable
+                and (retry_graphql_timeouts or not graphql_timeout)
+                and self.retrier.retry(
+                    resource,
+                    retries,
+                    f"{description}: HTTP {response.status_code}",
+                )
+            ):
+                retries += 1
+                response.close()
+                if stream:
+                    self.concurrency.free()
+            else:
+                return response
+
+    def _execute_api_call(
+        self,
+        description: str,
+        method: str,
+        url: str,
+        payload: str = "",
+        retry_graphql_timeouts: bool = True,
+        cacheable: bool = False,
+    ) -> dict:
+        headers = self._headers()
+
         logger.debug(f"{description}")
 
-        response: Response = requests.request(
-            method, url, headers=headers, data=payload
+        # Only stable resources are cached. Date-windowed and paginated
+        # listings would leave an entry behind for every URL ever requested,
+        # without a later run asking for the same URL again.
+        cacheable = cacheable and method.upper() == "GET"
+
+        cached = None
+        if cacheable and self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                headers.update(cached.conditional_headers())
+
+        response = self._send(
+            description,
+            method,
+            url,
+            headers,
+            payload,
+            retry_graphql_timeouts=retry_graphql_timeouts,
         )
 
+        if cached is not None and self.cache is not None:
+            self.cache.record(response.status_code == requests.codes.not_modified)
+            if response.status_code == requests.codes.not_modified:
+                return loads(cached.body)
+
         if response.status_code == requests.codes.ok:
             body = response.json()
 
             # GitHub API will return 200 with error messages if the query is malformed.
             if "errors" in body:
                 msg = f"Query for {description}."
+                if _is_graphql_timeout(response):
+                    raise GraphQLTimeoutError(*http_error(msg, response).args)
                 raise http_error(msg, response)
 
+            if cacheable and self.cache is not None:
+                self.cache.put(
+                    url,
+                    response.text,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+
             return body
         elif response.status_code == requests.codes.no_content:
             # There's a failure when attempting to convert a 204 response to JSON
@@ -164,36 +711,95 @@ class GitHubClient:
             raise http_error(msg, response)
 
     def _execute_graphql(
-        self, description: str, query: str, variables: dict | None = None
+        self,
+        description: str,
+        query: str,
+        variables: dict | None = None,
+        retry_timeouts: bool = True,
     ) -> dict:
         payload_variables = {} if variables is None else variables
         payload = dumps({"query": query, "variables": payload_variables})
 
         body = self._execute_api_call(
-            f"Querying for {description}", "POST", f"{GRAPHQL_ENDPOINT}", payload
+            f"Querying for {description}",
+            "POST",
+            f"{GRAPHQL_ENDPOINT}",
+            payload,
+            retry_graphql_timeouts=retry_timeouts,
         )
 
         return body
 
-    def get_repositories(self, owner: str) -> List[str]:
-        logger.info(f"Getting all repositories for organization {owner}")
+    def _execute_page(
+        self, shape: str, description: str, query: str, variables: dict
+    ) -> Tuple[dict, int, float]:
+        """
+        Query one page of a paginated shape at the size the PageSizer picks.
+
+        A page that times out on GitHub's side is asked for again at half the
+        size instead of being repeated as is; only at the minimum size is it
+        left to the usual retries.
+
+        Returns:
+            The response body, the page size it was fetched with, and the
+            seconds the successful query took.
+        """
+        page_size = self.page_sizer.size(shape)
+        while True:
+            smallest = page_size <= self.page_sizer.minimum(shape)
+            started = time.monotonic()
+            try:
+                body = self._execute_graphql(
+                    description,
+                    query,
+                    {**variables, "pageSize": page_size},
+                    retry_timeouts=smallest,
+                )
+            except GraphQLTimeoutError:
+                if smallest:
+                    raise
+                page_size = self.page_sizer.record_timeout(shape, page_size)
+                continue
+            return body, page_size, time.monotonic() - started
+
+    def iter_repositories(self, owner: str) -> Iterator[dict]:
+        """
+        Stream an organization's repositories, one page of 100 at a time.
+
+        Args:
+            owner: Organization name
+
+        Returns:
+            Iterator of repository nodes, each with a "name"
+        """
         if len(owner.strip()) == 0:
             raise ValueError("owner cannot be blank")
 
-        body = self._execute_graphql(
-            f"repositories for {owner}",
-            REPOSITORIES_TEMPLATE,
-            {"owner": owner},
-        )
-
-        total_repos = body["data"]["organization"]["repositories"]["totalCount"]
-        if total_repos > 100:
-            logger.warning(
-                f"There are over 100 repos in {owner}. Update the query to handle pagination"
+        cursor = None
+        page = 1
+        while True:
+            body = self._execute_graphql(
+                f"repositories for {owner}, page {page}",
+                REPOSITORIES_TEMPLATE,
+                {"owner": owner, "cursor": cursor},
             )
 
-        df = pd.DataFrame(body["data"]["organization"]["repositories"]["nodes"])
-        return df["name"].to_list()
+            repositories = body["data"]["organization"]["repositories"]
+            yield from repositories["nodes"]
+
+            page_info = repositories.get("pageInfo") or {}
+            if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+                break
+
+            cursor = page_info["endCursor"]
+            page += 1
+
+    def get_repositories(self, owner: str) -> List[str]:
+        logger.info(f"Getting all repositories for organization {owner}")
+        if len(owner.strip()) == 0:
+            raise ValueError("owner cannot be blank")
+
+        return [repository["name"] for repository in self.iter_repositories(owner)]
 
     def get_actions(self, owner: str, repository: str) -> dict:
         if len(owner.strip()) == 0:
@@ -205,6 +811,7 @@ class GitHubClient:
             f"Getting actions for {owner}/{repository}",
             "GET",
             f"{API_URL}/repos/{owner}/{repository}/actions/workflows",
+            cacheable=True,
         )
         return actions
 
@@ -214,13 +821,193 @@ class GitHubClient:
         if len(repository.strip()) == 0:
             raise ValueError("repository cannot be blank")
 
+        with self._prefetched_lock:
+            prefetched = self._prefetched_information.pop((owner, repository), None)
+        if prefetched is not None:
+            return self._with_organization_alerts(owner, repository, prefetched)
+
         body = self._execute_graphql(
             f"protection rules for {owner}/{repository}",
             REPOSITORY_INFORMATION_TEMPLATE,
-            {"owner": owner, "repository": repository},
+            {
+                "owner": owner,
+                "repository": repository,
+                "includeAlerts": not self._has_organization_alerts(owner),
+            },
+        )
+
+        return self._with_organization_alerts(
+            owner, repository, body["data"]["repository"]
         )
 
-        return body["data"]["repository"]
+    def prefetch_repository_information(
+        self, owner: str, repositories: List[str]
+    ) -> Dict[str, dict]:
+        """
+        Fetch the repository information of many repositories with batched
+        GraphQL queries, so that later calls to get_repository_information
+        for them are answered without another round trip.
+
+        The batch size adapts to the rate-limit cost GitHub reports for each
+        query. A batch that fails is split in half and retried; a repository
+        that still fails on its own is left for get_repository_information to
+        fetch, and report, individually.
+
+        Args:
+            owner: Repository owner
+            repositories: Names of the repositories
+
+        Returns:
+            Dictionary of repository name to repository information, for the
+            repositories that were fetched.
+        """
+        if len(owner.strip()) == 0:
+            raise ValueError("owner cannot be blank")
+
+        fetched: Dict[str, dict] = {}
+        pending = list(dict.fromkeys(repositories))
+        queries = 0
+        while pending:
+            batch = pending[: self._information_batch_size]
+            queries += 1
+            try:
+                body = self._execute_graphql(
+                    f"repository information for {len(batch)} repositories in {owner}",
+                    _repository_information_batch_query(len(batch)),
+                    {
+                        "owner": owner,
+                        "includeAlerts": not self._has_organization_alerts(owner),
+                        **{f"r{index}": name for index, name in enumerate(batch)},
+                    },
+                )
+            except RuntimeError as e:
+                if len(batch) == 1:
+                    logger.warning(
+                        f"Batched repository information failed for {owner}/{batch[0]}: {e}"
+                    )
+                    pending = pending[1:]
+                else:
+                    self._information_batch_size = max(len(batch) // 2, 1)
+                continue
+
+            pending = pending[len(batch) :]
+            data = body["data"]
+            for index, name in enumerate(batch):
+                if data.get(f"r{index}") is not None:
+                    fetched[name] = data[f"r{index}"]
+            self._resize_information_batch(len(batch), data.get("rateLimit"))
+
+        with self._prefetched_lock:
+            self._prefetched_information.update(
+                {(owner, name): information for name, information in fetched.items()}
+            )
+
+        logger.info(
+            f"Fetched repository information for {len(fetched)} of "
+            f"{len(repositories)} repositories in {owner} with {queries} queries"
+        )
+        return fetched
+
+    def _resize_information_batch(
+        self, batch_size: int, rate_limit: Optional[dict]
+    ) -> None:
+        cost = (rate_limit or {}).get("cost")
+        if not cost:
+            return
+        per_repository = cost / batch_size
+        self._information_batch_size = min(
+            max(int(TARGET_INFORMATION_BATCH_COST / per_repository), 1),
+            MAX_INFORMATION_BATCH_SIZE,
+        )
+
+    def iter_organization_dependabot_alerts(self, owner: str) -> Iterator[dict]:
+        """
+        Stream the open critical and high severity Dependabot alerts of every
+        repository in an organization, following the cursor in each page's
+        Link header.
+
+        Args:
+            owner: Organization name
+
+        Returns:
+            Iterator of REST alert records
+        """
+        if len(owner.strip()) == 0:
+            raise ValueError("owner cannot be blank")
+
+        url: Optional[str] = (
+            f"{API_URL}/orgs/{owner}/dependabot/alerts"
+            f"?state=open&severity={ORGANIZATION_ALERT_SEVERITIES}&per_page=100"
+        )
+        page = 1
+        while url:
+            description = f"Dependabot alerts for {owner}, page {page}"
+            logger.debug(description)
+            response = self._send(description, "GET", url, self._headers())
+            if response.status_code != requests.codes.ok:
+                raise http_error(f"Query for {description}.", response)
+
+            yield from response.json()
+
+            url = response.links.get("next", {}).get("url")
+            page += 1
+
+    def load_organization_dependabot_alerts(self, owner: str) -> bool:
+        """
+        Read an organization's open Dependabot alerts in one paginated stream
+        and index them by repository. From then on get_repository_information
+        leaves the alerts out of its queries and answers them from memory,
+        which also lifts the 100-alert limit of the per-repository query.
+
+        Args:
+            owner: Organization name
+
+        Returns:
+            True when the alerts are loaded. False when the organization
+            endpoint cannot be read (it needs an organization owner or
+            security manager token), in which case every repository query
+            keeps fetching its own alerts.
+        """
+        with self._alerts_lock:
+            if owner in self._organization_alerts:
+                return True
+
+            alerts: Dict[str, List[dict]] = {}
+            try:
+                for alert in self.iter_organization_dependabot_alerts(owner):
+                    alerts.setdefault(alert["repository"]["name"], []).append(
+                        _alert_node(alert)
+                    )
+            except RuntimeError as e:
+                logger.warning(
+                    f"Failed to read organization Dependabot alerts for {owner}, "
+                    f"falling back to per-repository alerts: {e}"
+                )
+                return False
+
+            self._organization_alerts[owner] = alerts
+
+        logger.info(
+            f"Loaded {sum(len(nodes) for nodes in alerts.values())} open "
+            f"Dependabot alerts across {len(alerts)} repositories in {owner}"
+        )
+        return True
+
+    def _has_organization_alerts(self, owner: str) -> bool:
+        with self._alerts_lock:
+            return owner in self._organization_alerts
+
+    def _with_organization_alerts(
+        self, owner: str, repository: str, information: dict
+    ) -> dict:
+        with self._alerts_lock:
+            alerts = self._organization_alerts.get(owner)
+        if alerts is None:
+            return information
+        return {
+            **information,
+            "vulnerabilityAlerts": {"nodes": alerts.get(repository, [])},
+        }
 
     def has_dependabot_enabled(self, owner: str, repository: str) -> bool:
         if len(owner.strip()) == 0:
@@ -244,7 +1031,34 @@ class GitHubClient:
 
         return has_dependabot
 
-    def get_file_content(self, owner: str, repository: str, path: str) -> Optional[str]:
+    def iter_file_content(
+        self,
+        owner: str,
+        repository: str,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_FILE_BYTES,
+    ) -> Iterator[str]:
+        """
+        Stream a file from the default branch as text, chunk by chunk.
+
+        The file is requested with the raw media type, so its bytes are
+        decoded straight into text without base64 or JSON. Reading stops
+        after `max_bytes`, leaving the rest of a huge file undownloaded.
+        Callers that only look for a few patterns can stop iterating as soon
+        as they have an answer.
+
+        Args:
+            owner: Repository owner
+            repository: Repository name
+            path: Path of the file within the repository
+            max_bytes: Number of bytes after which the file is cut off
+
+        Returns:
+            Iterator of text chunks
+
+        Raises:
+            RuntimeError: when the file cannot be read
+        """
         if len(owner.strip()) == 0:
             raise ValueError("owner cannot be blank")
         if len(repository.strip()) == 0:
@@ -252,21 +1066,183 @@ class GitHubClient:
         if len(path.strip()) == 0:
             raise ValueError("path cannot be blank")
 
-        file_result = None
+        return self._stream_file(owner, repository, path, max_bytes)
+
+    def _stream_file(
+        self, owner: str, repository: str, path: str, max_bytes: int
+    ) -> Iterator[str]:
+        description = f"Getting file {path} for {owner}/{repository}"
+        url = f"{API_URL}/repos/{owner}/{repository}/contents/{path}"
+        headers = {**self._headers(), "Accept": RAW_MEDIA_TYPE}
+
+        # Raw and JSON representations of a URL are cached separately.
+        cache_key = f"{url}#raw"
+        cached = self.cache.get(cache_key) if self.cache is not None else None
+        if cached is not None:
+            headers.update(cached.conditional_headers())
+
+        logger.debug(description)
+        response = self._send(description, "GET", url, headers, stream=True)
+        # The slot stays taken until the body has been read or the caller
+        # stops iterating, so that slow downloads count against the limit.
+        with ExitStack() as stack:
+            stack.callback(self.concurrency.free)
+            stack.enter_context(closing(response))
+            if cached is not None and self.cache is not None:
+                self.cache.record(response.status_code == requests.codes.not_modified)
+                if response.status_code == requests.codes.not_modified:
+                    yield cached.body
+                    return
+
+            if response.status_code != requests.codes.ok:
+                raise http_error(f"Query for {description}.", response)
+
+            if response.headers.get("Content-Type", "").startswith("application/json"):
+                # The raw media type was not honored; decode the JSON document.
+                yield base64.b64decode(response.json()["content"]).decode("UTF-8")
+                return
+
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            received = 0
+            parts: List[str] = []
+            for chunk in response.iter_content(_STREAM_CHUNK_BYTES):
+                if received + len(chunk) > max_bytes:
+                    logger.warning(
+                        f"File {path} in {owner}/{repository} is larger than "
+                        f"{max_bytes} bytes; reading only the first {max_bytes}"
+                    )
+                    text = decoder.decode(chunk[: max_bytes - received], final=True)
+                    if text:
+                        yield text
+                    return
+
+                received += len(chunk)
+                text = decoder.decode(chunk)
+                if text:
+                    if self.cache is not None:
+                        parts.append(text)
+                    yield text
+
+            text = decoder.decode(b"", final=True)
+            if text:
+                parts.append(text)
+                yield text
+
+            if self.cache is not None:
+                self.cache.put(
+                    cache_key,
+                    "".join(parts),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+
+    def get_file_content(
+        self,
+        owner: str,
+        repository: str,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_FILE_BYTES,
+    ) -> Optional[str]:
+        """
+        Get a file from the default branch as text, or None if it cannot be
+        read. Files larger than `max_bytes` are cut off.
+        """
+        try:
+            return "".join(self.iter_file_content(owner, repository, path, max_bytes))
+        except RuntimeError as e:
+            logger.warning(f"Failed to get file {path} for {owner}/{repository}: {e}")
+            return None
+
+    def get_workflow_files(self, owner: str, repository: str) -> Dict[str, str]:
+        """
+        Get the text of every file in the default branch's .github/workflows
+        directory with a single GraphQL query.
+
+        Files that GitHub reports as binary or truncated are left out, so that
+        callers can fall back to get_file_content for them.
+
+        Args:
+            owner: Repository owner
+            repository: Repository name
+
+        Returns:
+            Dictionary of file path (e.g. ".github/workflows/ci.yml") to text;
+            empty when there is no workflows directory or the query fails.
+        """
+        if len(owner.strip()) == 0:
+            raise ValueError("owner cannot be blank")
+        if len(repository.strip()) == 0:
+            raise ValueError("repository cannot be blank")
+
+        try:
+            body = self._execute_graphql(
+                f"workflow files for {owner}/{repository}",
+                WORKFLOW_FILES_TEMPLATE,
+                {"owner": owner, "repository": repository},
+            )
+        except RuntimeError as e:
+            logger.warning(
+                f"Failed to get workflow files for {owner}/{repository}: {e}"
+            )
+            return {}
+
+        tree = (body["data"]["repository"] or {}).get("object") or {}
+
+        files: Dict[str, str] = {}
+        for entry in tree.get("entries", []):
+            blob = entry.get("object") or {}
+            if (
+                entry.get("type") != "blob"
+                or blob.get("isBinary")
+                or blob.get("isTruncated")
+                or blob.get("text") is None
+            ):
+                continue
+            path = entry.get("path") or f".github/workflows/{entry['name']}"
+            files[path] = blob["text"]
+
+        return files
+
+    def get_root_file_names(self, owner: str, repository: str) -> Optional[Set[str]]:
+        """
+        List the files at the root of the default branch with a single request,
+        without downloading their contents.
+
+        Names are matched exactly, as get_file_content would match them.
+
+        Args:
+            owner: Repository owner
+            repository: Repository name
+
+        Returns:
+            Set of file names, or None when the tree could not be read in full
+            (for example, an empty repository) and the caller should fall back
+            to get_file_content.
+        """
+        if len(owner.strip()) == 0:
+            raise ValueError("owner cannot be blank")
+        if len(repository.strip()) == 0:
+            raise ValueError("repository cannot be blank")
+
         try:
-            file_result = self._execute_api_call(
-                f"Getting file {path} for {owner}/{repository}",
+            tree = self._execute_api_call(
+                f"Getting root tree for {owner}/{repository}",
                 "GET",
-                f"{API_URL}/repos/{owner}/{repository}/contents/{path}",
+                f"{API_URL}/repos/{owner}/{repository}/git/trees/HEAD",
+                cacheable=True,
             )
         except RuntimeError as e:
-            logger.warning(f"Failed to get file {path} for {owner}/{repository}: {e}")
+            logger.warning(f"Failed to get root tree for {owner}/{repository}: {e}")
+            return None
 
-        return (
-            base64.b64decode(file_result["content"]).decode("UTF-8")
-            if file_result
-            else None
-        )
+        if tree.get("truncated"):
+            return None
+
+        return {
+            entry["path"]
+            for entry in tree.get("tree", [])
+            if entry.get("type") == "blob"
+        }
 
     def get_pull_requests(
         self, owner: str, repository: str, state: str = "closed", per_page: int = 100
@@ -438,7 +1414,12 @@ class GitHubClient:
             per_page: Results per page (max 100)
 
         Returns:
-            List of run records with name, conclusion, created_at, path
+            List of run records with id, name, status, conclusion, created_at,
+            path
+
+        When the client has a state store, only the runs created since the
+        previous sync of the repository, or still unfinished at that sync, are
+        downloaded; the rest of the window is read from the store.
         """
         if len(owner.strip()) == 0:
             raise ValueError("owner cannot be blank")
@@ -447,79 +1428,247 @@ class GitHubClient:
         if not 1 <= per_page <= 100:
             raise ValueError("per_page must be between 1 and 100")
 
-        cutoff = (datetime.now(timezone.utc) - timedelta(days=since_days)).strftime(
-            "%Y-%m-%d"
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=since_days)).date()
+        start = datetime(cutoff.year, cutoff.month, cutoff.day, tzinfo=timezone.utc)
+
+        if self.store is None:
+            return self._fetch_workflow_runs_since(owner, repository, start, per_page)
+        return self._sync_workflow_runs(self.store, owner, repository, start, per_page)
+
+    def _sync_workflow_runs(
+        self,
+        store: StateStore,
+        owner: str,
+        repository: str,
+        start: datetime,
+        per_page: int,
+    ) -> List[dict]:
+        """
+        Bring the stored runs of a repository up to date and return those
+        created since `start`.
+
+        The store covers the window completely only if an earlier sync reached
+        back to `start`; otherwise the whole window is fetched again. A run is
+        stored with the status it had when fetched, so the sync resumes from
+        the oldest run that was not yet completed if that is earlier than the
+        watermark.
+        """
+        covered_from = start.strftime(_RUN_TIMESTAMP_FORMAT)
+        state = store.get_sync_state(owner, repository, WORKFLOW_RUNS)
+
+        since = start
+        if state is not None and state.covered_from <= covered_from:
+            resume_from = state.watermark
+            unfinished = store.earliest_unfinished_run(owner, repository)
+            if unfinished is not None:
+                resume_from = min(resume_from, unfinished)
+            since = max(
+                start,
+                datetime.strptime(resume_from, _RUN_TIMESTAMP_FORMAT).replace(
+                    tzinfo=timezone.utc
+                ),
+            )
+            logger.debug(
+                f"Syncing workflow runs of {owner}/{repository} created since "
+                f"{since.strftime(_RUN_TIMESTAMP_FORMAT)}"
+            )
+
+        runs = self._fetch_workflow_runs_since(owner, repository, since, per_page)
+
+        created = [run["created_at"] for run in runs if run.get("created_at")]
+        if state is not None:
+            created.append(state.watermark)
+        watermark = max(created, default=covered_from)
+
+        store.record_workflow_runs(
+            owner, repository, runs, covered_from=covered_from, watermark=watermark
         )
+        return store.get_workflow_runs(owner, repository, covered_from)
+
+    def _fetch_workflow_runs_since(
+        self, owner: str, repository: str, since: datetime, per_page: int
+    ) -> List[dict]:
+        """Fetch every workflow run created at or after `since`."""
+        if since.time() == datetime.min.time():
+            created_filter = f">={since.strftime('%Y-%m-%d')}"
+        else:
+            created_filter = f">={since.strftime(_RUN_TIMESTAMP_FORMAT)}"
 
         runs, total_count = self._fetch_workflow_run_pages(
-            owner, repository, f">={cutoff}", per_page
+            owner,
+            repository,
+            created_filter,
+            per_page,
+            stop_above=WORKFLOW_RUNS_RESULT_LIMIT,
         )
 
-        # The actions/runs endpoint caps combined pagination (page * per_page)
-        # at 1000 results and silently stops returning runs beyond that, even
-        # though `total_count` reports the true (larger) total. When that
-        # happens, the single windowed query above has silently dropped the
-        # oldest runs in the window, so re-fetch one calendar day at a time
-        # instead -- each day's result set stays comfortably under the cap.
-        if total_count is not None and total_count > 1000:
+        # Beyond the result limit the windowed query above would silently
+        # drop the oldest runs, so the window is split into smaller `created`
+        # ranges instead, each fetched in full once it is under the limit.
+        if total_count is not None and total_count > WORKFLOW_RUNS_RESULT_LIMIT:
             logger.warning(
-                f"{owner}/{repository} has {total_count} workflow runs in the "
-                f"last {since_days} days, which exceeds the GitHub API's "
-                "pagination limit; re-fetching one day at a time"
+                f"{owner}/{repository} has {total_count} workflow runs created "
+                f"since {since}, which exceeds the GitHub API's pagination "
+                "limit; splitting the window until each part fits"
             )
-            today = datetime.now(timezone.utc).date()
-            runs = []
-            for days_ago in range(since_days, -1, -1):
-                day = (today - timedelta(days=days_ago)).strftime("%Y-%m-%d")
-                day_runs, _ = self._fetch_workflow_run_pages(
-                    owner, repository, day, per_page
+            now = datetime.now(timezone.utc)
+            end = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+            runs = self._bisect_workflow_runs(owner, repository, since, end, per_page)
+
+        return runs
+
+    def _bisect_workflow_runs(
+        self,
+        owner: str,
+        repository: str,
+        start: datetime,
+        end: datetime,
+        per_page: int,
+    ) -> List[dict]:
+        """
+        Fetch the runs created in [start, end), a range known to exceed the
+        result limit, by splitting it at the hour nearest its middle. The two
+        halves are fetched concurrently, and each is split again only if it
+        also exceeds the limit. A range of an hour or less is not split; the
+        runs the API returns for it are kept and the truncation is logged.
+        """
+        if end - start <= timedelta(hours=1):
+            return self._fetch_workflow_run_range(
+                owner, repository, start, end, per_page
+            )
+
+        middle = (start + (end - start) / 2).replace(minute=0, second=0, microsecond=0)
+        if middle <= start:
+            middle = start + timedelta(hours=1)
+        middle = min(middle, end)
+
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="workflow-runs"
+        ) as executor:
+            earlier = executor.submit(
+                self._fetch_workflow_run_range,
+                owner,
+                repository,
+                start,
+                middle,
+                per_page,
+            )
+            later = self._fetch_workflow_run_range(
+                owner, repository, middle, end, per_page
+            )
+            return earlier.result() + later
+
+    def _fetch_workflow_run_range(
+        self,
+        owner: str,
+        repository: str,
+        start: datetime,
+        end: datetime,
+        per_page: int,
+    ) -> List[dict]:
+        """
+        Fetch the runs created in [start, end), splitting the range further
+        when it holds more runs than one query returns. A single hour is
+        never split.
+        """
+        created = (
+            f"{start.strftime(_RUN_TIMESTAMP_FORMAT)}.."
+            f"{(end - timedelta(seconds=1)).strftime(_RUN_TIMESTAMP_FORMAT)}"
+        )
+        splittable = end - start > timedelta(hours=1)
+
+        runs, total_count = self._fetch_workflow_run_pages(
+            owner,
+            repository,
+            created,
+            per_page,
+            stop_above=WORKFLOW_RUNS_RESULT_LIMIT if splittable else None,
+        )
+
+        if total_count is not None and total_count > WORKFLOW_RUNS_RESULT_LIMIT:
+            if splittable:
+                return self._bisect_workflow_runs(
+                    owner, repository, start, end, per_page
                 )
-                runs.extend(day_runs)
+            logger.warning(
+                f"{owner}/{repository} has {total_count} workflow runs created "
+                f"between {start} and {end}, more than the GitHub API returns "
+                f"for one query; only the first {WORKFLOW_RUNS_RESULT_LIMIT} "
+                "are included"
+            )
 
         return runs
 
     def _fetch_workflow_run_pages(
-        self, owner: str, repository: str, created_filter: str, per_page: int
+        self,
+        owner: str,
+        repository: str,
+        created_filter: str,
+        per_page: int,
+        stop_above: Optional[int] = None,
     ) -> Tuple[List[dict], Optional[int]]:
         """
         Fetch all pages of workflow runs matching a `created` query filter.
 
+        Once the first page reports total_count, the remaining pages are known
+        and are requested concurrently, within the client's concurrency limit,
+        then merged in page order. Without a total_count the pages are walked
+        one at a time until a short page.
+
         Returns a tuple of (runs, total_count), where total_count is the
         value reported on the first page (or None if the API omitted it).
+        When total_count exceeds `stop_above`, only the first page is read.
         """
-        all_runs: List[dict] = []
-        total_count: Optional[int] = None
-        page = 1
-
-        while True:
-            logger.info(f"Getting workflow runs for {owner}/{repository}, page {page}")
-            url = (
-                f"{API_URL}/repos/{owner}/{repository}/actions/runs"
-                f"?created={created_filter}&per_page={per_page}&page={page}"
+        body = self._get_workflow_run_page(
+            owner, repository, created_filter, per_page, 1
+        )
+        total_count: Optional[int] = body.get("total_count")
+        if (
+            stop_above is not None
+            and total_count is not None
+            and total_count > stop_above
+        ):
+            return [], total_count
+
+        runs = body.get("workflow_runs", [])
+        all_runs = [_workflow_run_record(run) for run in runs]
+        if len(runs) < per_page:
+            return all_runs, total_count
+
+        if total_count is not None:
+            last_page = math.ceil(
+                min(total_count, WORKFLOW_RUNS_RESULT_LIMIT) / per_page
             )
-
-            body = self._execute_api_call(
-                f"Getting workflow runs for {owner}/{repository}",
-                "GET",
-                url,
+            pages = range(2, last_page + 1)
+            if len(pages) > 0:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(pages), self.concurrency.limit),
+                    thread_name_prefix="workflow-runs",
+                ) as executor:
+                    bodies = executor.map(
+                        partial(
+                            self._get_workflow_run_page,
+                            owner,
+                            repository,
+                            created_filter,
+                            per_page,
+                        ),
+                        pages,
+                    )
+                    for page_body in bodies:
+                        all_runs.extend(
+                            _workflow_run_record(run)
+                            for run in page_body.get("workflow_runs", [])
+                        )
+            return all_runs, total_count
+
+        page = 2
+        while True:
+            body = self._get_workflow_run_page(
+                owner, repository, created_filter, per_page, page
             )
-
-            if page == 1:
-                total_count = body.get("total_count")
-
             runs = body.get("workflow_runs", [])
-            if not runs:
-                break
-
-            for run in runs:
-                all_runs.append(
-                    {
-                        "name": run.get("name"),
-                        "conclusion": run.get("conclusion"),
-                        "created_at": run.get("created_at"),
-                        "path": run.get("path"),
-                    }
-                )
+            all_runs.extend(_workflow_run_record(run) for run in runs)
 
             if len(runs) < per_page:
                 break
@@ -528,6 +1677,36 @@ class GitHubClient:
 
         return all_runs, total_count
 
+    def _get_workflow_run_page(
+        self,
+        owner: str,
+        repository: str,
+        created_filter: str,
+        per_page: int,
+        page: int,
+    ) -> dict:
+        logger.info(f"Getting workflow runs for {owner}/{repository}, page {page}")
+        url = (
+            f"{API_URL}/repos/{owner}/{repository}/actions/runs"
+            f"?created={created_filter}&per_page={per_page}&page={page}"
+        )
+
+        return self._execute_api_call(
+            f"Getting workflow runs for {owner}/{repository}",
+            "GET",
+            url,
+        )
+
+    def _record_page(
+        self, shape: str, page_size: int, body: dict, seconds: float, full: bool
+    ) -> None:
+        rate_limit = body["data"].get("rateLimit") or {}
+        logger.debug(
+            f"GraphQL {shape} page cost {rate_limit.get('cost')}, "
+            f"{rate_limit.get('remaining')} points remaining"
+        )
+        self.page_sizer.record(shape, page_size, rate_limit.get("cost"), seconds, full)
+
     def get_merged_prs_with_reviews(
         self, owner: str, repository: str, since_days: int = 30
     ) -> List[dict]:
@@ -545,64 +1724,131 @@ class GitHubClient:
         Returns:
             List of PR dicts with standard PR fields plus an embedded "reviews"
             list. Each review has "user", "state", and "submitted_at" keys.
+
+        When the client has a state store, only the PRs updated since the
+        newest merge seen by the previous sync of the repository are
+        downloaded; the rest of the window is read from the store.
         """
         if len(owner.strip()) == 0:
             raise ValueError("owner cannot be blank")
         if len(repository.strip()) == 0:
             raise ValueError("repository cannot be blank")
 
+        with self._merged_prs_lock:
+            loaded = self._organization_merged_prs.get(owner)
+        if (
+            loaded is not None
+            and loaded[0] >= since_days
+            and (loaded[1] is None or repository in loaded[1])
+        ):
+            return list(loaded[2].get(repository, []))
+
+        if self.store is None:
+            return self._scan_merged_prs(owner, repository, since_days)
+        return self._sync_merged_prs(self.store, owner, repository, since_days)
+
+    def _sync_merged_prs(
+        self, store: StateStore, owner: str, repository: str, since_days: int
+    ) -> List[dict]:
+        """
+        Bring the stored merged PRs of a repository up to date and return
+        those in the window.
+
+        Merging a PR, and reviewing it afterwards, both move its updatedAt,
+        so every PR merged or reviewed since the newest stored merge is
+        among the PRs updated since then.
+        """
+        # The metrics keep PRs merged less than `since_days + 1` whole days
+        # ago, so the store covers the window from the start of that day.
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=since_days + 1)).date()
+        covered_from = datetime(
+            cutoff.year, cutoff.month, cutoff.day, tzinfo=timezone.utc
+        ).strftime(_RUN_TIMESTAMP_FORMAT)
+        state = store.get_sync_state(owner, repository, PULL_REQUESTS)
+
+        updated_since: Optional[datetime] = None
+        if state is not None and state.covered_from <= covered_from:
+            updated_since = datetime.strptime(
+                state.watermark, _RUN_TIMESTAMP_FORMAT
+            ).replace(tzinfo=timezone.utc)
+            logger.debug(
+                f"Syncing PRs of {owner}/{repository} updated since "
+                f"{state.watermark}"
+            )
+
+        prs = self._scan_merged_prs(owner, repository, since_days, updated_since)
+
+        merged = [pr["merged_at"] for pr in prs if pr.get("merged_at")]
+        if state is not None:
+            merged.append(state.watermark)
+        watermark = max(merged, default=covered_from)
+
+        store.record_pull_requests(
+            owner, repository, prs, covered_from=covered_from, watermark=watermark
+        )
+        return store.get_pull_requests(owner, repository, covered_from)
+
+    def _scan_merged_prs(
+        self,
+        owner: str,
+        repository: str,
+        since_days: int,
+        updated_since: Optional[datetime] = None,
+    ) -> List[dict]:
+        """
+        Page through a repository's merged PRs, most recently updated first,
+        until they fall outside the window or, given `updated_since`, were
+        last updated before it.
+        """
         page_cutoff_days = since_days * 3
         now_utc = datetime.now(timezone.utc)
 
         all_prs: List[dict] = []
+        review_overflow: List[Tuple[dict, str, str]] = []
         cursor: Optional[str] = None
 
         while True:
-            variables: dict = {"owner": owner, "repo": repository, "cursor": cursor}
-            body = self._execute_graphql(
+            body, page_size, seconds = self._execute_page(
+                "pull_requests",
                 f"PRs with reviews for {owner}/{repository}",
                 PULL_REQUESTS_WITH_REVIEWS_TEMPLATE,
-                variables,
+                {"owner": owner, "repo": repository, "cursor": cursor},
             )
 
             pull_requests = body["data"]["repository"]["pullRequests"]
             nodes = pull_requests["nodes"]
+            self._record_page(
+                "pull_requests",
+                page_size,
+                body,
+                seconds,
+                pull_requests["pageInfo"]["hasNextPage"],
+            )
 
             if not nodes:
                 break
 
             for node in nodes:
-                review_data = node.get("reviews") or {}
-                if review_data.get("pageInfo", {}).get("hasNextPage"):
-                    logger.warning(
-                        f"PR #{node['number']} has >100 reviews; only first 100 fetched"
-                    )
-                reviews = [
-                    {
-                        "user": (r.get("author") or {}).get("login"),
-                        "state": r.get("state"),
-                        "submitted_at": r.get("submittedAt"),
-                    }
-                    for r in review_data.get("nodes", [])
-                ]
-                all_prs.append(
-                    {
-                        "number": node["number"],
-                        "created_at": node.get("createdAt"),
-                        "closed_at": node.get("closedAt"),
-                        "merged_at": node.get("mergedAt"),
-                        "user": (node.get("author") or {}).get("login"),
-                        "additions": node.get("additions"),
-                        "deletions": node.get("deletions"),
-                        "changed_files": node.get("changedFiles"),
-                        "reviews": reviews,
-                    }
-                )
+                record = _pull_request_record(node)
+                all_prs.append(record)
+                overflow = _review_overflow(node)
+                if overflow is not None:
+                    review_overflow.append((record, *overflow))
 
             page_info = pull_requests["pageInfo"]
             if not page_info["hasNextPage"]:
                 break
 
+            # PRs come in updatedAt order, so none on later pages changed
+            # after `updated_since` once one on this page did not.
+            if updated_since is not None and any(
+                datetime.fromisoformat(n["updatedAt"].replace("Z", "+00:00"))
+                < updated_since
+                for n in nodes
+                if n.get("updatedAt")
+            ):
+                break
+
             # Early exit: stop paginating once the most recently merged PR on
             # this page was merged far enough back that subsequent pages
             # (ordered by UPDATED_AT DESC) cannot fall within the window.
@@ -620,4 +1866,215 @@ class GitHubClient:
 
             cursor = page_info["endCursor"]
 
+        self._fetch_remaining_reviews(review_overflow)
+
         return all_prs
+
+    def _fetch_remaining_reviews(self, overflow: List[Tuple[dict, str, str]]) -> None:
+        """
+        Complete the reviews of PRs with more than one page of them.
+
+        Only the overflowing PRs are revisited, by node ID, in batched queries
+        that each fetch the next review page of many PRs; the main page query
+        keeps its size.
+
+        Args:
+            overflow: (record, node ID, review cursor) of each PR to complete;
+                further reviews are appended to the record's "reviews"
+        """
+        pending = list(overflow)
+        while pending:
+            batch = pending[:REVIEW_FOLLOW_UP_BATCH_SIZE]
+            pending = pending[len(batch) :]
+
+            variables: dict = {}
+            for index, (_, node_id, cursor) in enumerate(batch):
+                variables[f"id{index}"] = node_id
+                variables[f"after{index}"] = cursor
+
+            try:
+                body = self._execute_graphql(
+                    f"further reviews of {len(batch)} PRs",
+                    _review_pages_query(len(batch)),
+                    variables,
+                )
+            except RuntimeError as e:
+                for record, _, _ in batch + pending:
+                    logger.warning(
+                        f"PR #{record['number']} has more reviews than could be "
+                        f"fetched; only the first {len(record['reviews'])} are "
+                        f"included: {e}"
+                    )
+                return
+
+            for index, (record, node_id, _) in enumerate(batch):
+                reviews = (body["data"].get(f"p{index}") or {}).get("reviews") or {}
+                record["reviews"].extend(
+                    _review_record(r) for r in reviews.get("nodes", [])
+                )
+                page_info = reviews.get("pageInfo") or {}
+                if page_info.get("hasNextPage") and page_info.get("endCursor"):
+                    pending.append((record, node_id, page_info["endCursor"]))
+
+    def iter_organization_merged_prs(
+        self,
+        owner: str,
+        since_days: int = 30,
+        repositories: Optional[List[str]] = None,
+    ) -> Iterator[dict]:
+        """
+        Stream the PRs merged in an organization within the last `since_days`
+        days, with their reviews, from GraphQL search.
+
+        Search stops returning results after the first 1000 matches, so a date
+        range with more merged PRs than that is split in half until each part
+        fits.
+
+        Args:
+            owner: Organization name
+            since_days: How many days back to search, by merge date
+            repositories: Search only these repositories of the organization,
+                with `repo:` qualifiers, instead of the whole organization
+
+        Returns:
+            Iterator of PullRequestWithReviews nodes, each with the
+            "repository" it belongs to
+        """
+        if len(owner.strip()) == 0:
+            raise ValueError("owner cannot be blank")
+
+        # The metrics keep PRs merged less than `since_days + 1` whole days
+        # ago, so the search starts at the beginning of that day, as the
+        # per-repository scans do.
+        now = datetime.now(timezone.utc)
+        start = (now - timedelta(days=since_days + 1)).date()
+
+        if repositories is None:
+            scopes = [f"org:{owner}"]
+        else:
+            scopes = [
+                " ".join(
+                    f"repo:{owner}/{repository}"
+                    for repository in repositories[
+                        index : index + REPOSITORIES_PER_SEARCH
+                    ]
+                )
+                for index in range(0, len(repositories), REPOSITORIES_PER_SEARCH)
+            ]
+
+        for scope in scopes:
+            yield from self._search_merged_prs(owner, scope, start, now.date())
+
+    def _search_merged_prs(
+        self, owner: str, scope: str, start: date, end: date
+    ) -> Iterator[dict]:
+        query = f"{scope} is:pr is:merged merged:{start.isoformat()}..{end.isoformat()}"
+        cursor: Optional[str] = None
+        page = 1
+
+        while True:
+            body, page_size, seconds = self._execute_page(
+                "merged_pr_search",
+                f"merged PRs in {owner} from {start} to {end}, page {page}",
+                MERGED_PULL_REQUEST_SEARCH_TEMPLATE,
+                {"query": query, "cursor": cursor},
+            )
+            search = body["data"]["search"]
+            self._record_page(
+                "merged_pr_search",
+                page_size,
+                body,
+                seconds,
+                search["pageInfo"]["hasNextPage"],
+            )
+
+            if page == 1 and search["issueCount"] > SEARCH_RESULT_LIMIT:
+                if start < end:
+                    middle = start + (end - start) // 2
+                    yield from self._search_merged_prs(owner, scope, start, middle)
+                    yield from self._search_merged_prs(
+                        owner, scope, middle + timedelta(days=1), end
+                    )
+                    return
+                logger.warning(
+                    f"{owner} has {search['issueCount']} PRs merged on {start}, "
+                    f"more than GitHub search returns; only the first "
+                    f"{SEARCH_RESULT_LIMIT} are included"
+                )
+
+            # Search results that are not pull requests come back as empty
+            # objects.
+            yield from (node for node in search["nodes"] if node)
+
+            page_info = search["pageInfo"]
+            if not page_info["hasNextPage"] or not page_info.get("endCursor"):
+                break
+
+            cursor = page_info["endCursor"]
+            page += 1
+
+    def load_organization_merged_prs(
+        self,
+        owner: str,
+        since_days: int = 30,
+        repositories: Optional[List[str]] = None,
+    ) -> bool:
+        """
+        Read every PR merged in an organization within the window in one
+        search stream and group them by repository. From then on
+        get_merged_prs_with_reviews answers from memory for that window, with
+        exactly the PRs merged in it, instead of scanning each repository's
+        PRs by update date.
+
+        Args:
+            owner: Organization name
+            since_days: How many days back to read, by merge date
+            repositories: Read only these repositories of the organization;
+                the others are still scanned on their own
+
+        Returns:
+            True when the PRs are loaded; False when the search failed, in
+            which case each repository is scanned on its own, or when the
+            client has a state store, which syncs each repository's PRs
+            incrementally for less than a search of the whole window.
+        """
+        if self.store is not None:
+            return False
+
+        with self._merged_prs_lock:
+            scope = None if repositories is None else frozenset(repositories)
+            loaded = self._organization_merged_prs.get(owner)
+            if (
+                loaded is not None
+                and loaded[0] >= since_days
+                and (loaded[1] is None or (scope is not None and scope <= loaded[1]))
+            ):
+                return True
+
+            merged_prs: Dict[str, List[dict]] = {}
+            review_overflow: List[Tuple[dict, str, str]] = []
+            try:
+                for node in self.iter_organization_merged_prs(
+                    owner, since_days, repositories
+                ):
+                    record = _pull_request_record(node)
+                    merged_prs.setdefault(node["repository"]["name"], []).append(record)
+                    overflow = _review_overflow(node)
+                    if overflow is not None:
+                        review_overflow.append((record, *overflow))
+            except RuntimeError as e:
+                logger.warning(
+                    f"Failed to search merged PRs for {owner}, falling back to "
+                    f"per-repository scans: {e}"
+                )
+                return False
+
+            self._fetch_remaining_reviews(review_overflow)
+            self._organization_merged_prs[owner] = (since_days, scope, merged_prs)
+
+        logger.info(
+            f"Loaded {sum(len(prs) for prs in merged_prs.values())} PRs merged in "
+            f"the last {since_days} days across {len(merged_prs)} repositories "
+            f"in {owner}"
+        )
+        return True
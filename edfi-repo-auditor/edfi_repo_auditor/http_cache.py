@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Persistent cache for conditional REST requests.
+
+GitHub does not charge a 304 Not Modified response against the rate limit.
+The HttpCache keeps the ETag, Last-Modified value and body of each cached URL
+on disk, so that a later run can revalidate with If-None-Match /
+If-Modified-Since and reuse the stored body instead of downloading it again.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from json import JSONDecodeError, dump, load
+from typing import Dict, Optional
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers that ask GitHub to reply 304 if the resource is unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    def __init__(self, directory: str):
+        if len(directory.strip()) == 0:
+            raise ValueError("directory cannot be blank")
+
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the stored response for a URL, or None if there is none."""
+        try:
+            with open(self._path(url), encoding="utf-8") as file:
+                entry = load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for {url}: {e}")
+            return None
+
+        # Guard against a hash collision or an entry from a different layout.
+        if not isinstance(entry, dict) or entry.get("url") != url:
+            return None
+
+        return CachedResponse(
+            url=url,
+            body=entry.get("body", ""),
+            etag=entry.get("etag"),
+            last_modified=entry.get("last_modified"),
+        )
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store a response that carries a validator; others are not cached."""
+        if not etag and not last_modified:
+            return
+
+        path = self._path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file and rename it into place so that
+        # concurrent readers never see a partially written entry.
+        descriptor, temporary = tempfile.mkstemp(
+            dir=os.path.dirname(path), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                dump(
+                    {
+                        "url": url,
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "body": body,
+                    },
+                    file,
+                )
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+        with self._lock:
+            self._stores += 1
+
+    def record(self, hit: bool) -> None:
+        """Count a revalidation that was (hit) or was not (miss) answered 304."""
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def summary(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "stores": self._stores}
+
+    def log_summary(self) -> None:
+        stats = self.summary()
+        logger.info(
+            f"GitHub response cache: {stats['hits']} not modified, "
+            f"{stats['misses']} downloaded, {stats['stores']} stored "
+            f"in {self.directory}"
+        )
@@ -12,7 +12,7 @@ failure over the last 30 days, both overall and broken out per workflow.
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from edfi_repo_auditor.github_client import GitHubClient
 
@@ -111,9 +111,26 @@ def get_job_failure_metrics(
     """
     logger.info(f"Computing job failure rate metrics for {owner}/{repository}")
 
-    now_utc = datetime.now(timezone.utc)
     runs = client.get_workflow_runs(owner, repository, since_days=LAST_N_DAYS)
 
+    return compute_job_failure_metrics(runs)
+
+
+def compute_job_failure_metrics(
+    runs: List[Dict], now: Optional[datetime] = None
+) -> Dict[str, object]:
+    """
+    Compute Job Failure Rate metrics from already-fetched workflow runs.
+
+    Args:
+        runs: Runs as returned by GitHubClient.get_workflow_runs
+        now: End of the window; defaults to the current time
+
+    Returns:
+        Same dictionary as get_job_failure_metrics
+    """
+    now_utc = now or datetime.now(timezone.utc)
+
     # get_workflow_runs already filters server-side via the `created` query
     # parameter, but that cutoff has only day-level granularity, so it can
     # return runs up to ~24h older than the true window. Re-filter here with
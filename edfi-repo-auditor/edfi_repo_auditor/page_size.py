@@ -0,0 +1,191 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Adaptive page sizes for paginated GraphQL queries.
+
+A fixed `first:` wastes round trips on quiet repositories and risks timeouts
+on busy ones, where every node drags in up to a hundred reviews. The PageSizer
+keeps one page size per query shape and adjusts it after every page from the
+rate-limit cost GitHub reports (`rateLimit { cost }`) and the time the query
+took: slow or expensive pages halve the size, while full pages that came back
+quickly and cheaply double it. A page that GitHub gave up on altogether
+("Something went wrong while executing your query") halves the size at once,
+and the client asks for the same page again at the new size.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# A page that takes longer than this is shrunk; GitHub abandons queries that
+# run for about ten seconds.
+SLOW_QUERY_SECONDS = 5.0
+
+# A full page is only grown when it came back well inside the slow threshold.
+FAST_QUERY_SECONDS = 2.0
+
+# GraphQL rate-limit points one page should cost.
+TARGET_QUERY_COST = 10
+
+
+@dataclass(frozen=True)
+class PageSizeLimits:
+    initial: int
+    minimum: int
+    maximum: int
+
+
+@dataclass
+class _ShapeStats:
+    size: int
+    queries: int = 0
+    total_cost: int = 0
+    total_seconds: float = 0.0
+    changes: int = 0
+    timeouts: int = 0
+
+
+class PageSizer:
+    def __init__(
+        self,
+        limits: Dict[str, PageSizeLimits],
+        target_cost: int = TARGET_QUERY_COST,
+        slow_seconds: float = SLOW_QUERY_SECONDS,
+        fast_seconds: float = FAST_QUERY_SECONDS,
+    ):
+        for shape, limit in limits.items():
+            if not 1 <= limit.minimum <= limit.initial <= limit.maximum:
+                raise ValueError(f"invalid page size limits for {shape}")
+
+        self._limits = limits
+        self.target_cost = target_cost
+        self.slow_seconds = slow_seconds
+        self.fast_seconds = fast_seconds
+        self._lock = threading.Lock()
+        self._stats = {
+            shape: _ShapeStats(size=limit.initial) for shape, limit in limits.items()
+        }
+
+    def size(self, shape: str) -> int:
+        """Page size to request for the next query of this shape."""
+        with self._lock:
+            return self._stats[shape].size
+
+    def minimum(self, shape: str) -> int:
+        return self._limits[shape].minimum
+
+    def record_timeout(self, shape: str, size: int) -> int:
+        """
+        Record a page that timed out on GitHub's side and choose a smaller
+        size to ask for the same page again.
+
+        Returns:
+            Half of `size`, but not less than the minimum for the shape.
+        """
+        proposed = max(size // 2, self._limits[shape].minimum)
+
+        with self._lock:
+            stats = self._stats[shape]
+            stats.timeouts += 1
+            previous = stats.size
+            stats.size = proposed
+            if proposed != previous:
+                stats.changes += 1
+
+        logger.info(
+            f"GraphQL {shape} page of {size} timed out, retrying with {proposed}"
+        )
+        return proposed
+
+    def record(
+        self,
+        shape: str,
+        size: int,
+        cost: Optional[int],
+        seconds: float,
+        full: bool,
+    ) -> int:
+        """
+        Record one page and choose the size of the next.
+
+        Args:
+            shape: Query shape the page belongs to
+            size: Page size the query asked for
+            cost: Rate-limit points reported by GitHub, if any
+            seconds: Time the query took
+            full: More pages follow, so a larger page would have saved a trip
+
+        Returns:
+            Page size for the next query of this shape.
+        """
+        limits = self._limits[shape]
+        if seconds > self.slow_seconds:
+            proposed = size // 2
+        elif cost is not None and cost > self.target_cost:
+            proposed = size * self.target_cost // cost
+        elif full and seconds < self.fast_seconds:
+            proposed = size * 2
+        else:
+            proposed = size
+        proposed = min(max(proposed, limits.minimum), limits.maximum)
+
+        with self._lock:
+            stats = self._stats[shape]
+            stats.queries += 1
+            stats.total_cost += cost or 0
+            stats.total_seconds += seconds
+            previous = stats.size
+            stats.size = proposed
+            if proposed != previous:
+                stats.changes += 1
+
+        logger.debug(
+            f"GraphQL {shape}: {size} per page cost {cost} in {seconds:.2f}s, "
+            f"next page {proposed}"
+        )
+        if proposed != previous:
+            logger.info(
+                f"Changing GraphQL {shape} page size from {previous} to {proposed} "
+                f"(cost {cost}, {seconds:.2f}s)"
+            )
+        return proposed
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Current page size and average cost and latency for each shape."""
+        with self._lock:
+            return {
+                shape: {
+                    "size": stats.size,
+                    "queries": stats.queries,
+                    "average_cost": (
+                        round(stats.total_cost / stats.queries, 1)
+                        if stats.queries
+                        else 0.0
+                    ),
+                    "average_seconds": (
+                        round(stats.total_seconds / stats.queries, 2)
+                        if stats.queries
+                        else 0.0
+                    ),
+                    "changes": stats.changes,
+                    "timeouts": stats.timeouts,
+                }
+                for shape, stats in self._stats.items()
+            }
+
+    def log_summary(self) -> None:
+        for shape, stats in self.summary().items():
+            if stats["queries"] == 0:
+                continue
+            logger.info(
+                f"GraphQL {shape} pages: {stats['queries']} queries, "
+                f"average cost {stats['average_cost']} in "
+                f"{stats['average_seconds']}s, size now {stats['size']} "
+                f"after {stats['changes']} changes and {stats['timeouts']} timeouts"
+            )
@@ -245,7 +245,9 @@ def get_pr_metrics(
     Get basic PR metrics (duration and lead time) combined into a single dictionary.
 
     For extended metrics (review cycle, size indicators, etc.), use the
-    individual audit functions directly.
+    individual audit functions directly. When the client has a state store,
+    the PRs of the window come from the store after a sync of the PRs that
+    changed since the previous run.
 
     Args:
         client: GitHubClient instance
@@ -258,9 +260,26 @@ def get_pr_metrics(
     """
     logger.info(f"Computing PR metrics for {owner}/{repository}")
 
-    now_utc = datetime.now(timezone.utc)
     prs_with_reviews = client.get_merged_prs_with_reviews(owner, repository)
 
+    return compute_pr_metrics(prs_with_reviews)
+
+
+def compute_pr_metrics(
+    prs_with_reviews: List[Dict], now: Optional[datetime] = None
+) -> Dict[str, object]:
+    """
+    Compute the basic PR metrics from already-fetched PRs.
+
+    Args:
+        prs_with_reviews: PRs as returned by GitHubClient.get_merged_prs_with_reviews
+        now: End of the window; defaults to the current time
+
+    Returns:
+        Same dictionary as get_pr_metrics
+    """
+    now_utc = now or datetime.now(timezone.utc)
+
     merged_prs: List[Dict] = []
     reviews: Dict[int, List[Dict]] = {}
 
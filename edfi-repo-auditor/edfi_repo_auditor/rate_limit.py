@@ -0,0 +1,235 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Client-side scheduling for GitHub's primary and secondary rate limits.
+
+GitHub reports the primary budget of each resource ("core" for REST,
+"graphql", "search", ...) through the X-RateLimit-* response headers, and
+signals secondary (abuse) limits with a 403 or 429 carrying Retry-After. The
+RateLimiter tracks each budget separately, paces requests once a budget runs
+low, pauses until the reset when it is nearly exhausted, and tells the caller
+how long to back off after a throttled response.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Mapping, Optional
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Requests (or GraphQL points) held back from each budget so that the final
+# calls of a run never hit a hard 403.
+DEFAULT_RESERVE = 20
+
+# Once this fraction of a budget is left, requests are spread evenly over the
+# time remaining until the reset instead of being sent as fast as possible.
+SLOW_DOWN_FRACTION = 0.1
+
+# Wait used for a secondary rate limit that does not say how long to wait, as
+# recommended by GitHub's documentation.
+SECONDARY_LIMIT_DEFAULT_WAIT = 60.0
+
+# Small allowance for clock skew between GitHub and the local machine.
+RESET_MARGIN_SECONDS = 1.0
+
+
+@dataclass
+class RateLimitBudget:
+    limit: int = 0
+    remaining: int = 0
+    reset: float = 0.0
+    requests: int = 0
+    pauses: int = 0
+    paused_seconds: float = 0.0
+    throttled: int = 0
+    # Highest "used" value seen per reset window, to total consumption across
+    # windows without double counting concurrent responses.
+    used_by_window: Dict[float, int] = field(default_factory=dict)
+
+    @property
+    def consumed(self) -> int:
+        return sum(self.used_by_window.values())
+
+
+def resource_for_url(url: str) -> str:
+    """Guess which rate-limit resource a request will be charged to."""
+    if url.rstrip("/").endswith("/graphql"):
+        return "graphql"
+    if "/search/" in url:
+        return "search"
+    return "core"
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        reserve: int = DEFAULT_RESERVE,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.reserve = reserve
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._budgets: Dict[str, RateLimitBudget] = {}
+        self._next_slot: Dict[str, float] = {}
+
+    def _budget(self, resource: str) -> RateLimitBudget:
+        if resource not in self._budgets:
+            self._budgets[resource] = RateLimitBudget()
+        return self._budgets[resource]
+
+    def wait(self, resource: str, seconds: float, reason: str) -> None:
+        """Sleep on behalf of a resource, recording the pause."""
+        if seconds <= 0:
+            return
+
+        with self._lock:
+            budget = self._budget(resource)
+            budget.pauses += 1
+            budget.paused_seconds += seconds
+
+        logger.warning(f"Pausing {seconds:.1f}s for GitHub {resource} API: {reason}")
+        self._sleep(seconds)
+
+    def before_request(self, resource: str) -> None:
+        """
+        Block until it is reasonable to spend from the resource's budget.
+
+        Does nothing until a response has reported the budget.
+        """
+        with self._lock:
+            budget = self._budget(resource)
+            budget.requests += 1
+            now = self._clock()
+
+            if budget.limit == 0 or budget.reset <= now:
+                return
+
+            until_reset = budget.reset - now + RESET_MARGIN_SECONDS
+            if budget.remaining <= self.reserve:
+                pause = until_reset
+                pace = 0.0
+            elif budget.remaining <= budget.limit * SLOW_DOWN_FRACTION:
+                # Hand out evenly spaced send slots across all threads so the
+                # remaining budget lasts until the reset.
+                interval = until_reset / (budget.remaining - self.reserve)
+                slot = max(now, self._next_slot.get(resource, now))
+                self._next_slot[resource] = slot + interval
+                pause = 0.0
+                pace = slot - now
+                budget.paused_seconds += pace
+            else:
+                return
+
+            remaining = budget.remaining
+            limit = budget.limit
+
+        if pause > 0:
+            self.wait(
+                resource,
+                pause,
+                f"{remaining} of {limit} remaining, waiting for the budget to reset",
+            )
+        elif pace > 0:
+            logger.debug(f"Pacing GitHub {resource} API for {pace:.2f}s")
+            self._sleep(pace)
+
+    def update(self, resource: str, headers: Mapping[str, str]) -> None:
+        """Record the budget reported by a response's X-RateLimit headers."""
+        if "X-RateLimit-Remaining" not in headers:
+            return
+
+        resource = headers.get("X-RateLimit-Resource", resource)
+        try:
+            limit = int(headers.get("X-RateLimit-Limit", 0))
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset = float(headers.get("X-RateLimit-Reset", 0))
+            used = int(headers.get("X-RateLimit-Used", max(limit - remaining, 0)))
+        except ValueError:
+            return
+
+        with self._lock:
+            budget = self._budget(resource)
+            # Responses may arrive out of order; never let an older response
+            # raise the remaining count within the same window.
+            if reset > budget.reset or remaining < budget.remaining:
+                budget.remaining = remaining
+            budget.limit = limit
+            budget.reset = max(budget.reset, reset)
+            budget.used_by_window[reset] = max(
+                budget.used_by_window.get(reset, 0), used
+            )
+
+    def throttle_delay(
+        self,
+        resource: str,
+        status_code: int,
+        headers: Mapping[str, str],
+        text: str = "",
+    ) -> Optional[float]:
+        """
+        Return how long to wait before retrying a rate-limited response, or
+        None when the response was not rate limited.
+
+        A GraphQL RATE_LIMITED error arrives with a 200 status; callers should
+        pass 429 for it.
+        """
+        if status_code not in (403, 429):
+            return None
+
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                delay: Optional[float] = float(retry_after)
+            except ValueError:
+                delay = SECONDARY_LIMIT_DEFAULT_WAIT
+        elif headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                reset = float(headers.get("X-RateLimit-Reset", 0))
+            except ValueError:
+                reset = 0
+            delay = max(reset - self._clock(), 0) + RESET_MARGIN_SECONDS
+        elif status_code == 429 or "rate limit" in text.lower():
+            delay = SECONDARY_LIMIT_DEFAULT_WAIT
+        else:
+            # A plain 403 is a permissions problem, not throttling.
+            delay = None
+
+        if delay is not None:
+            with self._lock:
+                self._budget(
+                    headers.get("X-RateLimit-Resource", resource)
+                ).throttled += 1
+
+        return delay
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-resource budget consumption observed during this run."""
+        with self._lock:
+            return {
+                resource: {
+                    "requests": budget.requests,
+                    "consumed": budget.consumed,
+                    "remaining": budget.remaining,
+                    "limit": budget.limit,
+                    "throttled": budget.throttled,
+                    "pauses": budget.pauses,
+                    "paused_seconds": round(budget.paused_seconds, 1),
+                }
+                for resource, budget in sorted(self._budgets.items())
+            }
+
+    def log_summary(self) -> None:
+        for resource, stats in self.summary().items():
+            logger.info(
+                f"GitHub {resource} budget: {stats['requests']} requests consumed "
+                f"{stats['consumed']} of {stats['limit']} "
+                f"({stats['remaining']} remaining), throttled {stats['throttled']} "
+                f"times, paused {stats['pauses']} times for {stats['paused_seconds']}s"
+            )
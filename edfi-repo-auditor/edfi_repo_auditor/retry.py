@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Retries for transient GitHub failures.
+
+Gateway errors (502/503/504), dropped connections, and GraphQL queries that
+time out on GitHub's side ("Something went wrong while executing your query")
+usually succeed when repeated a little later. The Retrier waits with capped
+exponential backoff and full jitter between attempts, applies a separate
+policy to each API resource, and draws every retry from a budget shared by
+the whole run so that a real outage fails fast instead of multiplying the
+load.
+"""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from json import JSONDecodeError, loads
+from typing import Callable, Dict, Optional
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Total number of retries allowed across all calls made by one client.
+DEFAULT_RETRY_BUDGET = 100
+
+TRANSIENT_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int
+    base_delay: float
+    max_delay: float
+
+
+# Heavy GraphQL queries time out under load more often than REST calls and
+# need longer to recover, so they get more attempts and a longer backoff.
+RETRY_POLICIES: Dict[str, RetryPolicy] = {
+    "core": RetryPolicy(max_retries=3, base_delay=1.0, max_delay=30.0),
+    "graphql": RetryPolicy(max_retries=4, base_delay=2.0, max_delay=60.0),
+    "search": RetryPolicy(max_retries=3, base_delay=2.0, max_delay=60.0),
+}
+
+
+def is_idempotent(method: str, payload: str = "") -> bool:
+    """
+    Report whether a request can safely be sent again.
+
+    REST reads are always safe. A GraphQL POST is safe unless it carries a
+    mutation.
+    """
+    method = method.upper()
+    if method in ("GET", "HEAD"):
+        return True
+    if method != "POST" or not payload:
+        return False
+
+    try:
+        query = loads(payload).get("query", "")
+    except (JSONDecodeError, AttributeError):
+        return False
+    return isinstance(query, str) and not query.lstrip().startswith("mutation")
+
+
+def _sleep(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+class Retrier:
+    def __init__(
+        self,
+        budget: int = DEFAULT_RETRY_BUDGET,
+        policies: Optional[Dict[str, RetryPolicy]] = None,
+        sleep: Optional[Callable[[float], None]] = None,
+        random_fraction: Callable[[], float] = random.random,
+    ):
+        if budget < 0:
+            raise ValueError("budget cannot be negative")
+
+        self.budget = budget
+        self._policies = RETRY_POLICIES if policies is None else policies
+        self._sleep = _sleep if sleep is None else sleep
+        self._random_fraction = random_fraction
+        self._lock = threading.Lock()
+        self._retries: Dict[str, int] = {}
+        self._refused = 0
+
+    def backoff(self, resource: str, attempt: int) -> float:
+        """Full-jitter delay before retry number `attempt` (starting at 0)."""
+        policy = self._policy(resource)
+        ceiling = min(policy.max_delay, policy.base_delay * 2**attempt)
+        return ceiling * self._random_fraction()
+
+    def _policy(self, resource: str) -> RetryPolicy:
+        return self._policies.get(resource, self._policies["core"])
+
+    def retry(self, resource: str, attempt: int, reason: str) -> bool:
+        """
+        Wait before repeating a failed call, if the policy and budget allow.
+
+        Args:
+            resource: Rate-limit resource the call belongs to
+            attempt: Number of retries already made for this call
+            reason: Description of the failure, for logging
+
+        Returns:
+            True when the caller should send the request again.
+        """
+        if attempt >= self._policy(resource).max_retries:
+            return False
+
+        with self._lock:
+            used = sum(self._retries.values())
+            if used >= self.budget:
+                if self._refused == 0:
+                    logger.warning(
+                        f"Retry budget of {self.budget} exhausted; "
+                        "transient failures will no longer be retried"
+                    )
+                self._refused += 1
+                return False
+            self._retries[resource] = self._retries.get(resource, 0) + 1
+
+        delay = self.backoff(resource, attempt)
+        logger.warning(
+            f"Retrying GitHub {resource} API in {delay:.1f}s "
+            f"(attempt {attempt + 2}): {reason}"
+        )
+        self._sleep(delay)
+        return True
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Retries made during this run: one count per resource, the "total",
+        and the number of retries "refused" because the budget ran out.
+        """
+        with self._lock:
+            counts = {
+                resource: self._retries.get(resource, 0) for resource in self._policies
+            }
+            counts["total"] = sum(self._retries.values())
+            counts["refused"] = self._refused
+            return counts
+
+    def log_summary(self) -> None:
+        stats = self.summary()
+        per_resource = ", ".join(
+            f"{resource} {stats[resource]}" for resource in self._policies
+        )
+        logger.info(
+            f"GitHub API retries: {stats['total']} of {self.budget} budget used "
+            f"({per_resource}), {stats['refused']} refused"
+        )
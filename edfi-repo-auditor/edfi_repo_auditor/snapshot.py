@@ -0,0 +1,162 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Raw-data snapshots for the two-phase audit.
+
+The collect phase stores everything the audit reads from GitHub, so that the
+compute phase can rebuild the checklist results and metrics without a single
+API call. A snapshot is a directory holding one gzip-compressed JSON Lines
+file per entity, with one line per repository ({"repository": ..., "data":
+...}), and a manifest.json naming the organization, the time of collection,
+the repositories collected in full, in report order, and the number of days
+back that each time-windowed entity was collected for.
+"""
+
+import gzip
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from json import dumps, load, loads
+from typing import Any, Dict, List, Optional
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+
+MANIFEST_FILE = "manifest.json"
+
+# Everything collected for one repository; an entity missing for a repository
+# means the data could not be collected.
+ENTITIES = (
+    "actions",
+    "workflow_files",
+    "repository_information",
+    "dependabot_enabled",
+    "root_files",
+    "merged_prs",
+    "workflow_runs",
+    "ossf_score",
+)
+
+
+def _entity_path(directory: str, entity: str) -> str:
+    return os.path.join(directory, f"{entity}.jsonl.gz")
+
+
+@dataclass
+class Snapshot:
+    organization: str
+    collected_at: datetime
+    repositories: List[str] = field(default_factory=list)
+    data: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Days back each time-windowed entity was collected for; empty for
+    # snapshots written before the windows were recorded.
+    windows: Dict[str, int] = field(default_factory=dict)
+
+    def get(self, entity: str, repository: str) -> Any:
+        """Collected data of one entity for a repository, or None."""
+        return self.data.get(entity, {}).get(repository)
+
+    def has(self, entity: str, repository: str) -> bool:
+        return repository in self.data.get(entity, {})
+
+
+def write_snapshot(
+    directory: str,
+    organization: str,
+    collected_at: datetime,
+    repositories: Dict[str, Dict[str, Any]],
+    windows: Optional[Dict[str, int]] = None,
+) -> None:
+    """
+    Write a snapshot, replacing any snapshot already in the directory.
+
+    Args:
+        directory: Snapshot directory, created if needed
+        organization: Organization the data belongs to
+        collected_at: Time collection started, the "now" of the compute phase
+        repositories: Collected entities of each repository, in report order
+        windows: Days back each time-windowed entity was collected for
+    """
+    if len(directory.strip()) == 0:
+        raise ValueError("directory cannot be blank")
+
+    os.makedirs(directory, exist_ok=True)
+
+    # The manifest is removed first and written last, so an interrupted
+    # collection leaves no snapshot that looks complete.
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    for entity in ENTITIES:
+        with gzip.open(_entity_path(directory, entity), "wt", encoding="utf-8") as file:
+            for repository, entities in repositories.items():
+                if entity in entities:
+                    file.write(
+                        dumps({"repository": repository, "data": entities[entity]})
+                        + "\n"
+                    )
+
+    with open(manifest_path, "w", encoding="utf-8") as file:
+        file.write(
+            dumps(
+                {
+                    "format": SNAPSHOT_FORMAT,
+                    "organization": organization,
+                    "collected_at": collected_at.isoformat(),
+                    "repositories": list(repositories),
+                    "entities": list(ENTITIES),
+                    "windows": windows or {},
+                },
+                indent=2,
+            )
+        )
+
+    logger.info(
+        f"Wrote snapshot of {len(repositories)} repositories in {organization} "
+        f"to {directory}"
+    )
+
+
+def read_snapshot(directory: str) -> Snapshot:
+    """
+    Read a snapshot written by write_snapshot.
+
+    Raises:
+        ValueError: when the directory holds no snapshot, or one in a format
+            this version cannot read
+    """
+    try:
+        with open(os.path.join(directory, MANIFEST_FILE), encoding="utf-8") as file:
+            manifest = load(file)
+    except FileNotFoundError:
+        raise ValueError(f"No snapshot found in {directory}")
+
+    if manifest.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(
+            f"Snapshot in {directory} has format {manifest.get('format')}, "
+            f"expected {SNAPSHOT_FORMAT}"
+        )
+
+    snapshot = Snapshot(
+        organization=manifest["organization"],
+        collected_at=datetime.fromisoformat(manifest["collected_at"]),
+        repositories=manifest["repositories"],
+        windows=manifest.get("windows", {}),
+    )
+    for entity in manifest["entities"]:
+        path = _entity_path(directory, entity)
+        if not os.path.exists(path):
+            continue
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            snapshot.data[entity] = {
+                record["repository"]: record["data"]
+                for record in (loads(line) for line in file if line.strip())
+            }
+
+    return snapshot
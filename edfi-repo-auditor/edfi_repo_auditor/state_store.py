@@ -0,0 +1,342 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Local SQLite store for incremental syncs.
+
+Completed workflow runs and merged pull requests rarely change, so there is no
+need to download a whole 30-day window on every audit. The StateStore keeps
+the workflow runs of each repository, keyed by run id, and its merged pull
+requests with their reviews, keyed by PR number. For each repository and
+entity it also keeps a sync state: the start of the period the store holds
+completely ("covered from") and the high-water mark of the last sync. A later
+sync only asks GitHub for what changed since the mark.
+
+Timestamps are stored as UTC ISO 8601 strings ("2024-01-02T03:04:05Z"), which
+sort in time order.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+WORKFLOW_RUNS = "workflow_runs"
+PULL_REQUESTS = "pull_requests"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_state (
+    owner TEXT NOT NULL,
+    repository TEXT NOT NULL,
+    entity TEXT NOT NULL,
+    covered_from TEXT NOT NULL,
+    watermark TEXT NOT NULL,
+    PRIMARY KEY (owner, repository, entity)
+);
+
+CREATE TABLE IF NOT EXISTS workflow_runs (
+    owner TEXT NOT NULL,
+    repository TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT,
+    status TEXT,
+    conclusion TEXT,
+    created_at TEXT NOT NULL,
+    path TEXT,
+    PRIMARY KEY (owner, repository, id)
+);
+
+CREATE INDEX IF NOT EXISTS workflow_runs_created_at
+    ON workflow_runs (owner, repository, created_at);
+
+CREATE TABLE IF NOT EXISTS pull_requests (
+    owner TEXT NOT NULL,
+    repository TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    created_at TEXT,
+    closed_at TEXT,
+    merged_at TEXT NOT NULL,
+    user TEXT,
+    additions INTEGER,
+    deletions INTEGER,
+    changed_files INTEGER,
+    PRIMARY KEY (owner, repository, number)
+);
+
+CREATE TABLE IF NOT EXISTS pull_request_reviews (
+    owner TEXT NOT NULL,
+    repository TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    user TEXT,
+    state TEXT,
+    submitted_at TEXT,
+    PRIMARY KEY (owner, repository, number, position)
+);
+"""
+
+
+@dataclass(frozen=True)
+class SyncState:
+    covered_from: str
+    watermark: str
+
+
+class StateStore:
+    def __init__(self, path: str):
+        if len(path.strip()) == 0:
+            raise ValueError("path cannot be blank")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        # Shared by the client's worker threads; every use holds the lock.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+        self._synced: Dict[str, int] = {}
+        self._fetched: Dict[str, int] = {}
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def get_sync_state(
+        self, owner: str, repository: str, entity: str
+    ) -> Optional[SyncState]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT covered_from, watermark FROM sync_state "
+                "WHERE owner = ? AND repository = ? AND entity = ?",
+                (owner, repository, entity),
+            ).fetchone()
+        if row is None:
+            return None
+        return SyncState(row["covered_from"], row["watermark"])
+
+    def earliest_unfinished_run(self, owner: str, repository: str) -> Optional[str]:
+        """Creation time of the oldest stored run that had not completed."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT MIN(created_at) AS created_at FROM workflow_runs "
+                "WHERE owner = ? AND repository = ? "
+                "AND (status IS NULL OR status != 'completed')",
+                (owner, repository),
+            ).fetchone()
+        return row["created_at"]
+
+    def record_workflow_runs(
+        self,
+        owner: str,
+        repository: str,
+        runs: List[dict],
+        covered_from: str,
+        watermark: str,
+    ) -> None:
+        """
+        Store freshly fetched runs, drop runs older than `covered_from`, and
+        move the sync state forward, all in one transaction so that a failed
+        sync leaves the previous state intact.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO workflow_runs "
+                "(owner, repository, id, name, status, conclusion, created_at, path) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        owner,
+                        repository,
+                        run["id"],
+                        run.get("name"),
+                        run.get("status"),
+                        run.get("conclusion"),
+                        run["created_at"],
+                        run.get("path"),
+                    )
+                    for run in runs
+                    if run.get("id") is not None and run.get("created_at")
+                ],
+            )
+            self._connection.execute(
+                "DELETE FROM workflow_runs "
+                "WHERE owner = ? AND repository = ? AND created_at < ?",
+                (owner, repository, covered_from),
+            )
+            self._set_sync_state(
+                owner, repository, WORKFLOW_RUNS, covered_from, watermark, len(runs)
+            )
+
+    def get_workflow_runs(self, owner: str, repository: str, since: str) -> List[dict]:
+        """Stored runs created at or after `since`, newest first."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, name, status, conclusion, created_at, path "
+                "FROM workflow_runs "
+                "WHERE owner = ? AND repository = ? AND created_at >= ? "
+                "ORDER BY created_at DESC, id DESC",
+                (owner, repository, since),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def record_pull_requests(
+        self,
+        owner: str,
+        repository: str,
+        pull_requests: List[dict],
+        covered_from: str,
+        watermark: str,
+    ) -> None:
+        """
+        Store freshly fetched merged PRs, replacing the reviews of each, drop
+        PRs merged before `covered_from`, and move the sync state forward, all
+        in one transaction.
+        """
+        records = [
+            pr
+            for pr in pull_requests
+            if pr.get("number") is not None and pr.get("merged_at")
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO pull_requests "
+                "(owner, repository, number, created_at, closed_at, merged_at, "
+                "user, additions, deletions, changed_files) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        owner,
+                        repository,
+                        pr["number"],
+                        pr.get("created_at"),
+                        pr.get("closed_at"),
+                        pr["merged_at"],
+                        pr.get("user"),
+                        pr.get("additions"),
+                        pr.get("deletions"),
+                        pr.get("changed_files"),
+                    )
+                    for pr in records
+                ],
+            )
+            self._connection.executemany(
+                "DELETE FROM pull_request_reviews "
+                "WHERE owner = ? AND repository = ? AND number = ?",
+                [(owner, repository, pr["number"]) for pr in records],
+            )
+            self._connection.executemany(
+                "INSERT INTO pull_request_reviews "
+                "(owner, repository, number, position, user, state, submitted_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        owner,
+                        repository,
+                        pr["number"],
+                        position,
+                        review.get("user"),
+                        review.get("state"),
+                        review.get("submitted_at"),
+                    )
+                    for pr in records
+                    for position, review in enumerate(pr.get("reviews", []))
+                ],
+            )
+            self._connection.execute(
+                "DELETE FROM pull_request_reviews "
+                "WHERE owner = ? AND repository = ? AND number IN ("
+                "SELECT number FROM pull_requests "
+                "WHERE owner = ? AND repository = ? AND merged_at < ?)",
+                (owner, repository, owner, repository, covered_from),
+            )
+            self._connection.execute(
+                "DELETE FROM pull_requests "
+                "WHERE owner = ? AND repository = ? AND merged_at < ?",
+                (owner, repository, covered_from),
+            )
+            self._set_sync_state(
+                owner,
+                repository,
+                PULL_REQUESTS,
+                covered_from,
+                watermark,
+                len(pull_requests),
+            )
+
+    def get_pull_requests(self, owner: str, repository: str, since: str) -> List[dict]:
+        """
+        Stored PRs merged at or after `since`, most recently merged first,
+        each with its "reviews" in the order GitHub returned them.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT number, created_at, closed_at, merged_at, user, "
+                "additions, deletions, changed_files FROM pull_requests "
+                "WHERE owner = ? AND repository = ? AND merged_at >= ? "
+                "ORDER BY merged_at DESC, number DESC",
+                (owner, repository, since),
+            ).fetchall()
+            review_rows = self._connection.execute(
+                "SELECT number, user, state, submitted_at "
+                "FROM pull_request_reviews "
+                "WHERE owner = ? AND repository = ? "
+                "ORDER BY number, position",
+                (owner, repository),
+            ).fetchall()
+
+        reviews: Dict[int, List[dict]] = {}
+        for row in review_rows:
+            reviews.setdefault(row["number"], []).append(
+                {
+                    "user": row["user"],
+                    "state": row["state"],
+                    "submitted_at": row["submitted_at"],
+                }
+            )
+        return [
+            {**dict(row), "reviews": reviews.get(row["number"], [])} for row in rows
+        ]
+
+    def _set_sync_state(
+        self,
+        owner: str,
+        repository: str,
+        entity: str,
+        covered_from: str,
+        watermark: str,
+        fetched: int,
+    ) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO sync_state "
+            "(owner, repository, entity, covered_from, watermark) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (owner, repository, entity, covered_from, watermark),
+        )
+        self._synced[entity] = self._synced.get(entity, 0) + 1
+        self._fetched[entity] = self._fetched.get(entity, 0) + fetched
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Syncs completed and records fetched from GitHub during this run."""
+        with self._lock:
+            return {
+                entity: {"syncs": syncs, "fetched": self._fetched.get(entity, 0)}
+                for entity, syncs in sorted(self._synced.items())
+            }
+
+    def log_summary(self) -> None:
+        for entity, stats in self.summary().items():
+            logger.info(
+                f"State store {entity}: {stats['syncs']} incremental syncs "
+                f"fetched {stats['fetched']} records into {self.path}"
+            )
@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Minimal task-graph scheduler.
+
+Runs a set of named tasks on a thread pool, starting each task as soon as the
+tasks it depends on have finished, so that independent work proceeds
+concurrently.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# How often to check whether a queued task with a timeout has started yet
+_START_POLL_INTERVAL = 0.01
+
+
+class TaskTimeoutError(TimeoutError):
+    """Raised when a task does not finish within its timeout."""
+
+
+@dataclass
+class Task:
+    """
+    A unit of work in a task graph.
+
+    Attributes:
+        name: Unique name; results are keyed by it
+        func: Callable invoked with the results of `depends_on`, in order
+        depends_on: Names of the tasks that must finish first
+        timeout: Seconds the task may run, measured from when it is started
+        on_error: Maps a failure (including TaskTimeoutError) to a fallback
+            result. When None, the failure cancels the remaining tasks and is
+            raised from run_task_graph.
+    """
+
+    name: str
+    func: Callable[..., Any]
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    on_error: Optional[Callable[[BaseException], Any]] = None
+
+
+def _validate(tasks: Sequence[Task]) -> None:
+    names = [task.name for task in tasks]
+    if len(set(names)) != len(names):
+        raise ValueError("task names must be unique")
+
+    by_name = {task.name: task for task in tasks}
+    for task in tasks:
+        for dependency in task.depends_on:
+            if dependency not in by_name:
+                raise ValueError(f"{task.name} depends on unknown task {dependency}")
+
+    # Kahn's algorithm: if not every task can be ordered, there is a cycle.
+    remaining = {task.name: set(task.depends_on) for task in tasks}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"task graph has a cycle among {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+def _handle_failure(task: Task, error: BaseException) -> Any:
+    if task.on_error is None:
+        raise error
+    return task.on_error(error)
+
+
+def run_task_graph(
+    tasks: Sequence[Task], max_workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Run the tasks, honoring dependencies and per-task timeouts.
+
+    A task that times out is abandoned: its thread cannot be interrupted, so
+    it may keep running in the background, but its result is discarded. When
+    a task without an `on_error` handler fails, tasks that have not started
+    yet are cancelled and the error is raised.
+
+    Args:
+        tasks: Tasks to run
+        max_workers: Size of the thread pool (default: one thread per task)
+
+    Returns:
+        Dictionary of task name to result
+    """
+    _validate(tasks)
+    if not tasks:
+        return {}
+
+    results: Dict[str, Any] = {}
+    pending: List[Task] = list(tasks)
+    running: Dict[Future, Task] = {}
+    # Written by the worker threads when a task actually starts, so that a
+    # timeout does not count time spent queued behind other tasks.
+    started: Dict[str, float] = {}
+
+    def _start(task: Task, *args: Any) -> Any:
+        started[task.name] = time.monotonic()
+        return task.func(*args)
+
+    def _wait_time() -> Optional[float]:
+        timed = [task for task in running.values() if task.timeout is not None]
+        if not timed:
+            return None
+        if any(task.name not in started for task in timed):
+            return _START_POLL_INTERVAL
+        deadlines = [
+            started[task.name] + task.timeout
+            for task in timed
+            if task.timeout is not None
+        ]
+        return max(min(deadlines) - time.monotonic(), 0)
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers or len(tasks), thread_name_prefix="task"
+    )
+    try:
+        while pending or running:
+            for task in [t for t in pending if all(d in results for d in t.depends_on)]:
+                pending.remove(task)
+                future = executor.submit(
+                    _start, task, *(results[d] for d in task.depends_on)
+                )
+                running[future] = task
+
+            done, _ = wait(running, timeout=_wait_time(), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                task = running.pop(future)
+                try:
+                    results[task.name] = future.result()
+                except Exception as e:
+                    results[task.name] = _handle_failure(task, e)
+
+            now = time.monotonic()
+            for future, task in list(running.items()):
+                if (
+                    task.timeout is not None
+                    and task.name in started
+                    and now - started[task.name] >= task.timeout
+                ):
+                    future.cancel()
+                    del running[future]
+                    message = f"{task.name} timed out after {task.timeout}s"
+                    logger.warning(f"Task {message}")
+                    results[task.name] = _handle_failure(
+                        task, TaskTimeoutError(message)
+                    )
+    finally:
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Single-pass scanner for the workflow-file checklist items.
+
+Every workflow check (approved repository scanner, test reporter, unit tests,
+CodeQL) is an alternative of one pre-compiled pattern, so each file is read
+once no matter how many checks are still open, and reading stops as soon as
+all of them have matched. A check passes when any workflow file matches it.
+"""
+
+import logging
+import re
+from typing import Dict, Optional, Set
+
+from edfi_repo_auditor.checklist import CHECKLIST, get_message
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Checklist item for each named group of WORKFLOW_CHECK_PATTERN, in the order
+# the results are reported.
+WORKFLOW_CHECKS: Dict[str, dict] = {
+    "approved_actions": CHECKLIST.APPROVED_ACTIONS,
+    "test_reporter": CHECKLIST.TEST_REPORTER,
+    "unit_tests": CHECKLIST.UNIT_TESTS,
+    "codeql": CHECKLIST.CODEQL,
+}
+
+# The alternatives sit inside a lookahead so that matching is attempted at
+# every position and one check's match (e.g. the "unit-test" inside
+# "publish-unit-test-result-action") cannot hide another's. Case sensitivity
+# is set per alternative to keep each check's original rules.
+WORKFLOW_CHECK_PATTERN = re.compile(
+    r"(?=(?P<approved_actions>(?i:uses:\s*ed-fi-alliance-oss/ed-fi-actions/"
+    r".github/workflows/repository-scanner\.yml))"
+    r"|(?P<test_reporter>uses: dorny/test-reporter"
+    r"|uses: EnricoMi/publish-unit-test-result-action)"
+    r"|(?P<unit_tests>(?i:unit.{0,2}tests?))"
+    r"|(?P<codeql>uses: github/codeql-action/analyze))"
+)
+
+
+class WorkflowScan:
+    """Accumulates which workflow checks have matched across files."""
+
+    def __init__(self) -> None:
+        self.matched: Set[str] = set()
+        self.files_scanned = 0
+
+    @property
+    def complete(self) -> bool:
+        return len(self.matched) == len(WORKFLOW_CHECKS)
+
+    def add(self, file_content: Optional[str]) -> bool:
+        """
+        Scan one workflow file.
+
+        Returns:
+            True once every check has matched, so that the caller can stop
+            reading further files.
+        """
+        if not file_content:
+            logger.debug("File not found")
+            return self.complete
+
+        self.files_scanned += 1
+        for match in WORKFLOW_CHECK_PATTERN.finditer(file_content):
+            if match.lastgroup is not None:
+                self.matched.add(match.lastgroup)
+                if self.complete:
+                    break
+
+        return self.complete
+
+    def results(self) -> dict:
+        """
+        Checklist results for the workflow checks; empty when no workflow file
+        could be read.
+        """
+        if self.files_scanned == 0:
+            return {}
+
+        return {
+            item["description"]: get_message(item, name in self.matched)
+            for name, item in WORKFLOW_CHECKS.items()
+        }
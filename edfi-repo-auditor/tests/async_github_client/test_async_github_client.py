@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import asyncio
+import threading
+import time
+from http import HTTPStatus
+
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.async_github_client import AsyncGitHubClient
+from edfi_repo_auditor.github_client import API_URL
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+
+
+def describe_when_initializing_an_AsyncGitHubClient() -> None:
+    def describe_given_blank_access_token() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                AsyncGitHubClient("   ")
+
+    def describe_given_max_concurrency_below_one() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                AsyncGitHubClient(ACCESS_TOKEN, max_concurrency=0)
+
+
+def describe_when_calling_the_async_client() -> None:
+    def describe_given_a_valid_response() -> None:
+        def it_returns_the_same_result_as_the_sync_client() -> None:
+            async def fetch() -> dict:
+                client = AsyncGitHubClient(ACCESS_TOKEN)
+                try:
+                    return await client.get_actions(OWNER, REPO)
+                finally:
+                    client.close()
+
+            with requests_mock.Mocker() as m:
+                m.get(
+                    f"{API_URL}/repos/{OWNER}/{REPO}/actions/workflows",
+                    status_code=HTTPStatus.OK,
+                    text='{"total_count": 0, "workflows": []}',
+                )
+                result = asyncio.run(fetch())
+
+            assert result == {"total_count": 0, "workflows": []}
+
+    def describe_given_more_calls_than_the_concurrency_limit() -> None:
+        def it_never_exceeds_the_limit() -> None:
+            lock = threading.Lock()
+            in_flight = 0
+            peak = 0
+
+            def slow_call(owner: str, repository: str) -> bool:
+                nonlocal in_flight, peak
+                with lock:
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                time.sleep(0.02)
+                with lock:
+                    in_flight -= 1
+                return True
+
+            async def fan_out() -> list:
+                client = AsyncGitHubClient(ACCESS_TOKEN, max_concurrency=3)
+                client.client.has_dependabot_enabled = slow_call  # type: ignore[method-assign]
+                try:
+                    return await asyncio.gather(
+                        *(client.has_dependabot_enabled(OWNER, REPO) for _ in range(10))
+                    )
+                finally:
+                    client.close()
+
+            results = asyncio.run(fan_out())
+
+            assert len(results) == 10
+            assert peak == 3
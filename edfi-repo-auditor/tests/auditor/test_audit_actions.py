@@ -157,3 +157,88 @@ def describe_when_auditing_actions() -> None:
             mock_client.get_file_content.return_value = file_content
             results = audit_actions(mock_client, OWNER, REPO)
             assert results[CHECKLIST.CODEQL["description"]] == CHECKLIST.CODEQL["fail"]
+
+    def describe_given_workflow_files_fetched_in_one_query() -> None:
+        SCANNER = (
+            "uses: ed-fi-alliance-oss/ed-fi-actions/.github/workflows/"
+            "repository-scanner.yml"
+        )
+
+        @pytest.fixture
+        def actions() -> dict:
+            return {
+                "total_count": 2,
+                "workflows": [
+                    {"path": ".github/workflows/scan.yml"},
+                    {"path": ".github/workflows/codeql.yml"},
+                ],
+            }
+
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_does_not_request_files_one_by_one(mock_client, actions: dict) -> None:
+            mock_client.get_actions.return_value = actions
+            mock_client.get_workflow_files.return_value = {
+                ".github/workflows/scan.yml": SCANNER,
+                ".github/workflows/codeql.yml": "uses: github/codeql-action/analyze",
+            }
+
+            results = audit_actions(mock_client, OWNER, REPO)
+
+            mock_client.get_file_content.assert_not_called()
+            assert (
+                results[CHECKLIST.APPROVED_ACTIONS["description"]]
+                == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+            )
+            assert (
+                results[CHECKLIST.CODEQL["description"]]
+                == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+            )
+
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_falls_back_for_files_the_query_left_out(
+            mock_client, actions: dict
+        ) -> None:
+            mock_client.get_actions.return_value = actions
+            mock_client.get_workflow_files.return_value = {
+                ".github/workflows/scan.yml": SCANNER,
+            }
+            mock_client.get_file_content.return_value = (
+                "uses: github/codeql-action/analyze"
+            )
+
+            results = audit_actions(mock_client, OWNER, REPO)
+
+            mock_client.get_file_content.assert_called_once_with(
+                OWNER, REPO, ".github/workflows/codeql.yml"
+            )
+            assert (
+                results[CHECKLIST.CODEQL["description"]]
+                == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+            )
+
+    def describe_given_every_check_passes_in_the_first_file() -> None:
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_stops_fetching_files(mock_client) -> None:
+            mock_client.get_actions.return_value = {
+                "total_count": 3,
+                "workflows": [
+                    {"path": ".github/workflows/a.yml"},
+                    {"path": ".github/workflows/b.yml"},
+                    {"path": ".github/workflows/c.yml"},
+                ],
+            }
+            mock_client.get_workflow_files.return_value = {}
+            mock_client.get_file_content.return_value = """
+                uses: ed-fi-alliance-oss/ed-fi-actions/.github/workflows/repository-scanner.yml
+                uses: dorny/test-reporter
+                name: unit tests
+                uses: github/codeql-action/analyze
+            """
+
+            results = audit_actions(mock_client, OWNER, REPO)
+
+            assert mock_client.get_file_content.call_count == 1
+            assert all(
+                result == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+                for result in results.values()
+            )
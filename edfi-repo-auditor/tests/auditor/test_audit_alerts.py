@@ -7,7 +7,7 @@ from datetime import datetime as real_datetime, timedelta, timezone
 from typing import List
 import pytest
 
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from edfi_repo_auditor.auditor import ALERTS_WEEKS_SINCE_CREATED, audit_alerts
 from edfi_repo_auditor.checklist import CHECKLIST, CHECKLIST_DEFAULT_SUCCESS_MESSAGE
 
@@ -54,6 +54,65 @@ def describe_when_auditing_alerts() -> None:
                     == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
                 )
 
+        def describe_given_graphql_reports_the_status() -> None:
+            ALERTS: List[dict] = []
+
+            @pytest.fixture
+            def mock_client() -> Mock:
+                return Mock()
+
+            @pytest.fixture
+            def results(mock_client: Mock) -> dict:
+                return audit_alerts(mock_client, OWNER, REPO, ALERTS, True)
+
+            def it_returns_dependabot_enabled(results: dict) -> None:
+                assert (
+                    results[CHECKLIST.DEPENDABOT_ENABLED["description"]]
+                    == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+                )
+
+            def it_does_not_call_the_rest_api(results: dict, mock_client: Mock) -> None:
+                mock_client.has_dependabot_enabled.assert_not_called()
+
+        def describe_given_graphql_reports_disabled() -> None:
+            ALERTS: List[dict] = []
+
+            @pytest.fixture
+            def mock_client() -> Mock:
+                mock = Mock()
+                mock.has_dependabot_enabled.return_value = True
+                return mock
+
+            @pytest.fixture
+            def results(mock_client: Mock) -> dict:
+                return audit_alerts(mock_client, OWNER, REPO, ALERTS, False)
+
+            def it_trusts_the_graphql_value(results: dict) -> None:
+                assert (
+                    results[CHECKLIST.DEPENDABOT_ENABLED["description"]]
+                    == CHECKLIST.DEPENDABOT_ENABLED["fail"]
+                )
+
+        def describe_given_graphql_status_is_unknown() -> None:
+            ALERTS: List[dict] = []
+
+            @pytest.fixture
+            def mock_client() -> Mock:
+                mock = Mock()
+                mock.has_dependabot_enabled.return_value = True
+                return mock
+
+            @pytest.fixture
+            def results(mock_client: Mock) -> dict:
+                return audit_alerts(mock_client, OWNER, REPO, ALERTS, None)
+
+            def it_falls_back_to_the_rest_api(results: dict, mock_client: Mock) -> None:
+                mock_client.has_dependabot_enabled.assert_called_once_with(OWNER, REPO)
+                assert (
+                    results[CHECKLIST.DEPENDABOT_ENABLED["description"]]
+                    == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+                )
+
         def describe_given_there_are_no_alerts() -> None:
             ALERTS: List[dict] = []
 
@@ -28,6 +28,7 @@ def describe_when_reviewing_files() -> None:
         @pytest.fixture
         @patch("edfi_repo_auditor.github_client.GitHubClient")
         def results(mock_client) -> dict:
+            mock_client.get_root_file_names.return_value = None
             mock_client.get_file_content.return_value = "Found"
             return review_files(mock_client, OWNER, REPO)
 
@@ -47,6 +48,7 @@ def describe_when_reviewing_files() -> None:
         @pytest.fixture
         @patch("edfi_repo_auditor.github_client.GitHubClient")
         def results(mock_client) -> dict:
+            mock_client.get_root_file_names.return_value = None
             mock_client.get_file_content.return_value = None
             return review_files(mock_client, OWNER, REPO)
 
@@ -61,6 +63,7 @@ def describe_when_reviewing_files() -> None:
             def get_file_content(org, repo, path):
                 return "Found" if path == "CLAUDE.md" else None
 
+            mock_client.get_root_file_names.return_value = None
             mock_client.get_file_content.side_effect = get_file_content
             return review_files(mock_client, OWNER, REPO)
 
@@ -69,3 +72,50 @@ def describe_when_reviewing_files() -> None:
                 results[CHECKLIST.AGENTS["description"]]
                 == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
             )
+
+    def describe_given_the_root_tree_is_available() -> None:
+        @pytest.fixture
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def mock_client(mock_client):
+            mock_client.get_root_file_names.return_value = {
+                "LICENSE",
+                "NOTICES.md",
+                "CLAUDE.md",
+                "security.md",
+                "README.md",
+            }
+            return mock_client
+
+        @pytest.fixture
+        def results(mock_client) -> dict:
+            return review_files(mock_client, OWNER, REPO)
+
+        def it_does_not_download_any_file(mock_client, results: dict) -> None:
+            mock_client.get_file_content.assert_not_called()
+
+        def it_passes_files_in_the_tree(results: dict) -> None:
+            assert (
+                results[CHECKLIST.LICENSE["description"]]
+                == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+            )
+            assert (
+                results[CHECKLIST.NOTICES["description"]]
+                == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+            )
+
+        def it_accepts_the_alternate_filename(results: dict) -> None:
+            assert (
+                results[CHECKLIST.AGENTS["description"]]
+                == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+            )
+
+        def it_matches_names_case_sensitively(results: dict) -> None:
+            assert (
+                results[CHECKLIST.SECURITY["description"]] == CHECKLIST.SECURITY["fail"]
+            )
+
+        def it_fails_files_missing_from_the_tree(results: dict) -> None:
+            assert (
+                results[CHECKLIST.CONTRIBUTORS["description"]]
+                == CHECKLIST.CONTRIBUTORS["fail"]
+            )
@@ -3,8 +3,13 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+import threading
+import time
+from typing import Optional
 from unittest.mock import patch
 
+import requests
+
 from edfi_repo_auditor.auditor import run_audit
 from edfi_repo_auditor.config import Configuration
 
@@ -14,14 +19,21 @@ REPO = "Ed-Fi-ODS"
 OTHER_REPO = "Ed-Fi-Admin"
 
 
-def _config(repositories: list) -> Configuration:
+def _config(
+    repositories: list,
+    jobs: int = 1,
+    save_results: bool = False,
+    task_timeout: Optional[float] = None,
+) -> Configuration:
     return Configuration(
         organization=OWNER,
         personal_access_token=ACCESS_TOKEN,
         repositories=repositories,
         log_level="INFO",
-        save_results=False,
+        save_results=save_results,
         file_name="",
+        jobs=jobs,
+        task_timeout=task_timeout,
     )
 
 
@@ -110,3 +122,309 @@ def describe_when_running_a_full_audit() -> None:
             assert "Job Failure Rate (%)" not in first_results
             assert second_results["Job Failure Rate (%)"] == 0.0
             assert second_results["Total Workflow Runs (last 30 days)"] == 2
+
+    def describe_given_the_ossf_score_fails() -> None:
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.get_ossf_score")
+        @patch("edfi_repo_auditor.auditor.get_job_failure_metrics")
+        @patch("edfi_repo_auditor.auditor.get_pr_metrics")
+        @patch("edfi_repo_auditor.auditor.review_files")
+        @patch("edfi_repo_auditor.auditor.audit_actions")
+        @patch("edfi_repo_auditor.auditor.get_repo_information")
+        @patch("edfi_repo_auditor.auditor.GitHubClient")
+        def it_logs_a_network_error_and_reports_no_score(
+            mock_client_class,
+            mock_repo_info,
+            mock_actions,
+            mock_files,
+            mock_pr_metrics,
+            mock_job_metrics,
+            mock_ossf,
+            mock_output,
+            caplog,
+        ) -> None:
+            mock_repo_info.return_value = {"Repo Check": "pass"}
+            mock_actions.return_value = {}
+            mock_files.return_value = {}
+            mock_pr_metrics.return_value = {}
+            mock_job_metrics.return_value = {}
+            mock_ossf.side_effect = requests.ConnectionError("reset")
+
+            run_audit(_config([REPO]))
+
+            results = mock_output.call_args[0][1]
+            assert results["OSSF Score"] is None
+            assert results["Repo Check"] == "pass"
+            assert f"OpenSSF score for {OWNER}/{REPO}: reset" in caplog.text
+
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.get_ossf_score")
+        @patch("edfi_repo_auditor.auditor.get_job_failure_metrics")
+        @patch("edfi_repo_auditor.auditor.get_pr_metrics")
+        @patch("edfi_repo_auditor.auditor.review_files")
+        @patch("edfi_repo_auditor.auditor.audit_actions")
+        @patch("edfi_repo_auditor.auditor.get_repo_information")
+        @patch("edfi_repo_auditor.auditor.GitHubClient")
+        def it_fails_the_repository_on_an_unexpected_error(
+            mock_client_class,
+            mock_repo_info,
+            mock_actions,
+            mock_files,
+            mock_pr_metrics,
+            mock_job_metrics,
+            mock_ossf,
+            mock_output,
+            caplog,
+        ) -> None:
+            mock_repo_info.return_value = {}
+            mock_actions.return_value = {}
+            mock_files.return_value = {}
+            mock_pr_metrics.return_value = {}
+            mock_job_metrics.return_value = {}
+            mock_ossf.side_effect = KeyError("title")
+
+            run_audit(_config([REPO]))
+
+            mock_output.assert_not_called()
+            assert f"Failed to audit {OWNER}/{REPO}" in caplog.text
+
+    def describe_given_several_jobs() -> None:
+        REPOSITORIES = [f"repo-{i}" for i in range(6)]
+
+        def _slow_first_repository(client, organization: str, repository: str) -> dict:
+            # The first repository finishes last when audited in parallel.
+            if repository == REPOSITORIES[0]:
+                time.sleep(0.05)
+            return {"Actions Check": repository}
+
+        @patch("edfi_repo_auditor.auditor.save_to_csv")
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.get_ossf_score")
+        @patch("edfi_repo_auditor.auditor.get_job_failure_metrics")
+        @patch("edfi_repo_auditor.auditor.get_pr_metrics")
+        @patch("edfi_repo_auditor.auditor.review_files")
+        @patch("edfi_repo_auditor.auditor.audit_actions")
+        @patch("edfi_repo_auditor.auditor.get_repo_information")
+        @patch("edfi_repo_auditor.auditor.GitHubClient")
+        def it_writes_the_same_report_as_a_serial_run(
+            mock_client_class,
+            mock_repo_info,
+            mock_actions,
+            mock_files,
+            mock_pr_metrics,
+            mock_job_metrics,
+            mock_ossf,
+            mock_output,
+            mock_save,
+        ) -> None:
+            mock_repo_info.return_value = {"Repo Check": "pass"}
+            mock_actions.side_effect = _slow_first_repository
+            mock_files.return_value = {}
+            mock_pr_metrics.return_value = {}
+            mock_job_metrics.return_value = {}
+            mock_ossf.return_value = {"OSSF Score": 8.0}
+
+            run_audit(_config(REPOSITORIES, jobs=1, save_results=True))
+            serial_output = [c[0] for c in mock_output.call_args_list]
+            serial_report = mock_save.call_args[0][0]
+
+            mock_output.reset_mock()
+            mock_save.reset_mock()
+
+            run_audit(_config(REPOSITORIES, jobs=4, save_results=True))
+            parallel_output = [c[0] for c in mock_output.call_args_list]
+            parallel_report = mock_save.call_args[0][0]
+
+            assert [c[0] for c in parallel_output] == REPOSITORIES
+            assert parallel_output == serial_output
+            assert parallel_report.equals(serial_report)
+
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.get_ossf_score")
+        @patch("edfi_repo_auditor.auditor.get_job_failure_metrics")
+        @patch("edfi_repo_auditor.auditor.get_pr_metrics")
+        @patch("edfi_repo_auditor.auditor.review_files")
+        @patch("edfi_repo_auditor.auditor.audit_actions")
+        @patch("edfi_repo_auditor.auditor.get_repo_information")
+        @patch("edfi_repo_auditor.auditor.GitHubClient")
+        def it_isolates_a_failing_repository(
+            mock_client_class,
+            mock_repo_info,
+            mock_actions,
+            mock_files,
+            mock_pr_metrics,
+            mock_job_metrics,
+            mock_ossf,
+            mock_output,
+        ) -> None:
+            def fail_one(client, organization: str, repository: str) -> dict:
+                if repository == REPOSITORIES[2]:
+                    raise RuntimeError("boom")
+                return {}
+
+            mock_repo_info.side_effect = fail_one
+            mock_actions.return_value = {}
+            mock_files.return_value = {}
+            mock_pr_metrics.return_value = {}
+            mock_job_metrics.return_value = {}
+            mock_ossf.return_value = {}
+
+            run_audit(_config(REPOSITORIES, jobs=3))
+
+            written = [c[0][0] for c in mock_output.call_args_list]
+            assert written == REPOSITORIES[:2] + REPOSITORIES[3:]
+
+    def describe_given_a_step_exceeds_the_task_timeout() -> None:
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.get_ossf_score")
+        @patch("edfi_repo_auditor.auditor.get_job_failure_metrics")
+        @patch("edfi_repo_auditor.auditor.get_pr_metrics")
+        @patch("edfi_repo_auditor.auditor.review_files")
+        @patch("edfi_repo_auditor.auditor.audit_actions")
+        @patch("edfi_repo_auditor.auditor.get_repo_information")
+        @patch("edfi_repo_auditor.auditor.GitHubClient")
+        def it_reports_the_other_steps_without_waiting(
+            mock_client_class,
+            mock_repo_info,
+            mock_actions,
+            mock_files,
+            mock_pr_metrics,
+            mock_job_metrics,
+            mock_ossf,
+            mock_output,
+        ) -> None:
+            release = threading.Event()
+
+            def slow_ossf(organization: str, repository: str) -> dict:
+                release.wait(2)
+                return {"OSSF Score": 8.0}
+
+            mock_repo_info.return_value = {"Repo Check": "pass"}
+            mock_actions.return_value = {}
+            mock_files.return_value = {}
+            mock_pr_metrics.return_value = {}
+            mock_job_metrics.return_value = {}
+            mock_ossf.side_effect = slow_ossf
+
+            try:
+                run_audit(_config([REPO], task_timeout=0.05))
+            finally:
+                release.set()
+
+            results = mock_output.call_args[0][1]
+            assert results["OSSF Score"] is None
+            assert results["Repo Check"] == "pass"
+
+    def describe_given_several_repositories() -> None:
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.get_ossf_score")
+        @patch("edfi_repo_auditor.auditor.get_job_failure_metrics")
+        @patch("edfi_repo_auditor.auditor.get_pr_metrics")
+        @patch("edfi_repo_auditor.auditor.review_files")
+        @patch("edfi_repo_auditor.auditor.audit_actions")
+        @patch("edfi_repo_auditor.auditor.get_repo_information")
+        @patch("edfi_repo_auditor.auditor.GitHubClient")
+        def it_prefetches_repository_information_in_batches(
+            mock_client_class,
+            mock_repo_info,
+            mock_actions,
+            mock_files,
+            mock_pr_metrics,
+            mock_job_metrics,
+            mock_ossf,
+            mock_output,
+        ) -> None:
+            for mock in (
+                mock_repo_info,
+                mock_actions,
+                mock_files,
+                mock_pr_metrics,
+                mock_job_metrics,
+                mock_ossf,
+            ):
+                mock.return_value = {}
+
+            run_audit(_config([REPO, OTHER_REPO]))
+
+            client = mock_client_class.return_value
+            client.prefetch_repository_information.assert_called_once_with(
+                OWNER, [REPO, OTHER_REPO]
+            )
+
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.get_ossf_score")
+        @patch("edfi_repo_auditor.auditor.get_job_failure_metrics")
+        @patch("edfi_repo_auditor.auditor.get_pr_metrics")
+        @patch("edfi_repo_auditor.auditor.review_files")
+        @patch("edfi_repo_auditor.auditor.audit_actions")
+        @patch("edfi_repo_auditor.auditor.get_repo_information")
+        @patch("edfi_repo_auditor.auditor.GitHubClient")
+        def it_loads_organization_alerts_and_prs_before_prefetching(
+            mock_client_class,
+            mock_repo_info,
+            mock_actions,
+            mock_files,
+            mock_pr_metrics,
+            mock_job_metrics,
+            mock_ossf,
+            mock_output,
+        ) -> None:
+            for mock in (
+                mock_repo_info,
+                mock_actions,
+                mock_files,
+                mock_pr_metrics,
+                mock_job_metrics,
+                mock_ossf,
+            ):
+                mock.return_value = {}
+
+            client = mock_client_class.return_value
+            client.get_repositories.return_value = [REPO, OTHER_REPO]
+
+            run_audit(_config([]))
+
+            client.load_organization_dependabot_alerts.assert_called_once_with(OWNER)
+            client.load_organization_merged_prs.assert_called_once_with(
+                OWNER, repositories=None
+            )
+            calls = [name for name, _, _ in client.mock_calls]
+            assert calls.index("load_organization_dependabot_alerts") < calls.index(
+                "prefetch_repository_information"
+            )
+
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.get_ossf_score")
+        @patch("edfi_repo_auditor.auditor.get_job_failure_metrics")
+        @patch("edfi_repo_auditor.auditor.get_pr_metrics")
+        @patch("edfi_repo_auditor.auditor.review_files")
+        @patch("edfi_repo_auditor.auditor.audit_actions")
+        @patch("edfi_repo_auditor.auditor.get_repo_information")
+        @patch("edfi_repo_auditor.auditor.GitHubClient")
+        def it_reads_only_the_named_repositories_alerts_and_prs(
+            mock_client_class,
+            mock_repo_info,
+            mock_actions,
+            mock_files,
+            mock_pr_metrics,
+            mock_job_metrics,
+            mock_ossf,
+            mock_output,
+        ) -> None:
+            for mock in (
+                mock_repo_info,
+                mock_actions,
+                mock_files,
+                mock_pr_metrics,
+                mock_job_metrics,
+                mock_ossf,
+            ):
+                mock.return_value = {}
+
+            run_audit(_config([REPO, OTHER_REPO]))
+
+            client = mock_client_class.return_value
+            client.load_organization_merged_prs.assert_called_once_with(
+                OWNER, repositories=[REPO, OTHER_REPO]
+            )
+            client.load_organization_dependabot_alerts.assert_not_called()
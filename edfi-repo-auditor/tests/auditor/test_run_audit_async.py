@@ -0,0 +1,243 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import asyncio
+import threading
+from typing import Dict, List, Optional, Set
+from unittest.mock import patch
+
+import requests
+
+from edfi_repo_auditor.auditor import run_audit, run_audit_async
+from edfi_repo_auditor.config import Configuration
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+OTHER_REPO = "Ed-Fi-Admin"
+
+INFORMATION = {
+    "vulnerabilityAlerts": {"nodes": []},
+    "rulesets": {"nodes": []},
+    "hasWikiEnabled": False,
+    "hasIssuesEnabled": True,
+    "hasProjectsEnabled": False,
+    "deleteBranchOnMerge": True,
+    "squashMergeAllowed": True,
+    "licenseInfo": {"key": "apache-2.0"},
+}
+ACTIONS = {"total_count": 1, "workflows": [{"path": ".github/workflows/ci.yml"}]}
+WORKFLOW = "uses: github/codeql-action/analyze\nname: Unit Tests\n"
+
+
+def _config(repositories: list, task_timeout: Optional[float] = None) -> Configuration:
+    return Configuration(
+        organization=OWNER,
+        personal_access_token=ACCESS_TOKEN,
+        repositories=repositories,
+        log_level="INFO",
+        save_results=False,
+        file_name="",
+        task_timeout=task_timeout,
+    )
+
+
+class _FakeSyncClient:
+    def __init__(self, *args, **kwargs) -> None:
+        pass
+
+    def prefetch_repository_information(
+        self, owner: str, repositories: List[str]
+    ) -> Dict[str, dict]:
+        return {repository: INFORMATION for repository in repositories}
+
+    def load_organization_dependabot_alerts(self, owner: str) -> bool:
+        return False
+
+    def load_organization_merged_prs(
+        self,
+        owner: str,
+        since_days: int = 30,
+        repositories: Optional[List[str]] = None,
+    ) -> bool:
+        return False
+
+    def get_repository_information(self, owner: str, repository: str) -> dict:
+        return INFORMATION
+
+    def has_dependabot_enabled(self, owner: str, repository: str) -> bool:
+        return repository == REPO
+
+    def get_actions(self, owner: str, repository: str) -> dict:
+        return ACTIONS
+
+    def get_file_content(self, owner: str, repository: str, path: str) -> Optional[str]:
+        if path.endswith(".yml"):
+            return WORKFLOW
+        return "Found" if path in ("LICENSE", "CLAUDE.md") else None
+
+    def get_workflow_files(self, owner: str, repository: str) -> Dict[str, str]:
+        return {".github/workflows/ci.yml": WORKFLOW} if repository == REPO else {}
+
+    def get_root_file_names(self, owner: str, repository: str) -> Optional[Set[str]]:
+        return {"LICENSE", "CLAUDE.md"} if repository == REPO else None
+
+    def get_merged_prs_with_reviews(
+        self, owner: str, repository: str, since_days: int = 30
+    ) -> List[dict]:
+        return []
+
+    def get_workflow_runs(
+        self, owner: str, repository: str, since_days: int = 30, per_page: int = 100
+    ) -> List[dict]:
+        if repository == OTHER_REPO:
+            raise RuntimeError("boom")
+        return []
+
+    def log_run_summary(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeAsyncClient:
+    sync_client = _FakeSyncClient
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.client = self.sync_client()
+
+    async def prefetch_repository_information(
+        self, owner: str, repositories: List[str]
+    ) -> Dict[str, dict]:
+        return self.client.prefetch_repository_information(owner, repositories)
+
+    async def load_organization_dependabot_alerts(self, owner: str) -> bool:
+        return self.client.load_organization_dependabot_alerts(owner)
+
+    async def load_organization_merged_prs(
+        self,
+        owner: str,
+        since_days: int = 30,
+        repositories: Optional[List[str]] = None,
+    ) -> bool:
+        return self.client.load_organization_merged_prs(owner, since_days, repositories)
+
+    def log_run_summary(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class _NoWorkflowsClient(_FakeSyncClient):
+    workflow_file_requests: List[str] = []
+
+    def get_actions(self, owner: str, repository: str) -> dict:
+        return {"total_count": 0, "workflows": []}
+
+    def get_workflow_files(self, owner: str, repository: str) -> Dict[str, str]:
+        self.workflow_file_requests.append(repository)
+        return {}
+
+
+def describe_when_running_an_async_audit() -> None:
+    @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+    @patch("edfi_repo_auditor.auditor.get_ossf_score")
+    @patch("edfi_repo_auditor.auditor.AsyncGitHubClient", _FakeAsyncClient)
+    @patch("edfi_repo_auditor.auditor.GitHubClient", _FakeSyncClient)
+    def it_produces_the_same_output_as_the_serial_audit(mock_ossf, mock_output) -> None:
+        mock_ossf.return_value = {"OSSF Score": 7.5}
+
+        run_audit(_config([REPO, OTHER_REPO]))
+        serial = [c[0] for c in mock_output.call_args_list]
+
+        mock_output.reset_mock()
+        asyncio.run(run_audit_async(_config([REPO, OTHER_REPO])))
+        concurrent = [c[0] for c in mock_output.call_args_list]
+
+        assert concurrent == serial
+
+    @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+    @patch("edfi_repo_auditor.auditor.get_ossf_score")
+    @patch("edfi_repo_auditor.auditor.AsyncGitHubClient", _FakeAsyncClient)
+    def it_writes_repositories_in_configured_order(mock_ossf, mock_output) -> None:
+        mock_ossf.return_value = {"OSSF Score": None}
+
+        asyncio.run(run_audit_async(_config([OTHER_REPO, REPO])))
+
+        assert [c[0][0] for c in mock_output.call_args_list] == [OTHER_REPO, REPO]
+
+    @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+    @patch("edfi_repo_auditor.auditor.get_ossf_score")
+    def it_reads_dependabot_status_from_graphql(mock_ossf, mock_output) -> None:
+        mock_ossf.return_value = {"OSSF Score": None}
+        probes: List[str] = []
+
+        class _GraphQLStatusSyncClient(_FakeSyncClient):
+            def get_repository_information(self, owner: str, repository: str) -> dict:
+                return {**INFORMATION, "hasVulnerabilityAlertsEnabled": True}
+
+            def has_dependabot_enabled(self, owner: str, repository: str) -> bool:
+                probes.append(repository)
+                return False
+
+        class _GraphQLStatusClient(_FakeAsyncClient):
+            sync_client = _GraphQLStatusSyncClient
+
+        with patch("edfi_repo_auditor.auditor.AsyncGitHubClient", _GraphQLStatusClient):
+            asyncio.run(run_audit_async(_config([REPO])))
+
+        assert probes == []
+
+    @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+    @patch("edfi_repo_auditor.auditor.get_ossf_score")
+    def it_skips_workflow_files_when_there_are_no_workflows(
+        mock_ossf, mock_output
+    ) -> None:
+        mock_ossf.return_value = {"OSSF Score": None}
+
+        class _NoWorkflowsAsyncClient(_FakeAsyncClient):
+            sync_client = _NoWorkflowsClient
+
+        with patch(
+            "edfi_repo_auditor.auditor.AsyncGitHubClient", _NoWorkflowsAsyncClient
+        ):
+            asyncio.run(run_audit_async(_config([REPO])))
+
+        assert _NoWorkflowsClient.workflow_file_requests == []
+
+    @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+    @patch("edfi_repo_auditor.auditor.get_ossf_score")
+    @patch("edfi_repo_auditor.auditor.AsyncGitHubClient", _FakeAsyncClient)
+    def it_falls_back_when_the_ossf_score_fails(mock_ossf, mock_output) -> None:
+        mock_ossf.side_effect = requests.ConnectionError("scorecard unavailable")
+
+        asyncio.run(run_audit_async(_config([REPO])))
+
+        assert mock_output.call_args[0][1]["OSSF Score"] is None
+
+    @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+    @patch("edfi_repo_auditor.auditor.get_ossf_score")
+    @patch("edfi_repo_auditor.auditor.AsyncGitHubClient", _FakeAsyncClient)
+    def it_reports_the_other_steps_when_one_exceeds_the_task_timeout(
+        mock_ossf, mock_output
+    ) -> None:
+        release = threading.Event()
+
+        def slow_ossf(organization: str, repository: str) -> dict:
+            release.wait(2)
+            return {"OSSF Score": 8.0}
+
+        mock_ossf.side_effect = slow_ossf
+
+        try:
+            asyncio.run(run_audit_async(_config([REPO], task_timeout=0.05)))
+        finally:
+            release.set()
+
+        results = mock_output.call_args[0][1]
+        assert results["OSSF Score"] is None
+        assert results["Has Actions"] == "✅ OK"
@@ -0,0 +1,199 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from edfi_repo_auditor.auditor import (
+    COLLECTION_WINDOWS,
+    run_audit,
+    run_collect,
+    run_compute,
+)
+from edfi_repo_auditor.config import Configuration
+from edfi_repo_auditor.pr_metrics import MERGED_PRS_LAST_30_DAYS_KEY
+from edfi_repo_auditor.snapshot import ENTITIES, read_snapshot, write_snapshot
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+WORKFLOW = ".github/workflows/ci.yml"
+
+
+def _days_ago(days: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+    client.get_actions.side_effect = lambda *_: {
+        "total_count": 1,
+        "workflows": [{"path": WORKFLOW}],
+    }
+    client.get_workflow_files.side_effect = lambda *_: {
+        WORKFLOW: "steps:\n  - uses: dorny/test-reporter@v1\n  - run: unit tests\n"
+    }
+    client.get_repository_information.side_effect = lambda *_: {
+        "hasWikiEnabled": False,
+        "hasIssuesEnabled": True,
+        "hasProjectsEnabled": False,
+        "deleteBranchOnMerge": True,
+        "squashMergeAllowed": True,
+        "licenseInfo": {"key": "apache-2.0"},
+        "hasVulnerabilityAlertsEnabled": True,
+        "vulnerabilityAlerts": {
+            "nodes": [
+                {
+                    "createdAt": _days_ago(40),
+                    "securityVulnerability": {"advisory": {"severity": "HIGH"}},
+                }
+            ]
+        },
+        "rulesets": {"nodes": []},
+    }
+    client.get_root_file_names.side_effect = lambda *_: {"LICENSE", "NOTICES.md"}
+    client.get_merged_prs_with_reviews.side_effect = lambda *_, **__: [
+        {
+            "number": 1,
+            "created_at": _days_ago(3),
+            "closed_at": _days_ago(1),
+            "merged_at": _days_ago(1),
+            "user": "alice",
+            "additions": 10,
+            "deletions": 5,
+            "changed_files": 2,
+            "reviews": [
+                {"user": "bob", "state": "APPROVED", "submitted_at": _days_ago(2)}
+            ],
+        }
+    ]
+    client.get_workflow_runs.side_effect = lambda *_, **__: [
+        {"name": "CI", "conclusion": "success", "created_at": _days_ago(2)},
+        {"name": "CI", "conclusion": "failure", "created_at": _days_ago(1)},
+    ]
+    return client
+
+
+def _config(**kwargs) -> Configuration:
+    return Configuration(
+        organization=OWNER,
+        personal_access_token=ACCESS_TOKEN,
+        repositories=[REPO],
+        log_level="INFO",
+        save_results=False,
+        file_name="",
+        **kwargs,
+    )
+
+
+def _collect(directory: Path) -> str:
+    with patch("edfi_repo_auditor.auditor.GitHubClient", return_value=_client()):
+        run_collect(_config(phase="collect", snapshot_dir=str(directory)))
+    return str(directory)
+
+
+def describe_when_auditing_in_two_phases() -> None:
+    @pytest.fixture(autouse=True)
+    def ossf_score(monkeypatch) -> None:
+        monkeypatch.setattr(
+            "edfi_repo_auditor.auditor.get_ossf_score",
+            lambda *_: {"OSSF Score": 7.5},
+        )
+
+    @pytest.fixture
+    def audited() -> dict:
+        with patch("edfi_repo_auditor.auditor.GitHubClient", return_value=_client()):
+            with patch("edfi_repo_auditor.auditor.output_to_github_actions") as output:
+                run_audit(_config())
+        return output.call_args[0][1]
+
+    @pytest.fixture
+    def snapshot_dir(tmp_path: Path) -> str:
+        return _collect(tmp_path)
+
+    def it_collects_every_entity(snapshot_dir: str) -> None:
+        snapshot = read_snapshot(snapshot_dir)
+
+        assert snapshot.repositories == [REPO]
+        assert all(snapshot.has(entity, REPO) for entity in ENTITIES)
+
+    def it_records_the_collection_windows(snapshot_dir: str) -> None:
+        assert read_snapshot(snapshot_dir).windows == COLLECTION_WINDOWS
+
+    def it_computes_the_same_results_as_a_full_audit(
+        audited: dict, snapshot_dir: str
+    ) -> None:
+        with patch("edfi_repo_auditor.auditor.GitHubClient") as client_class:
+            with patch("edfi_repo_auditor.auditor.output_to_github_actions") as output:
+                run_compute(_config(phase="compute", snapshot_dir=snapshot_dir))
+
+        client_class.assert_not_called()
+        assert output.call_args[0][1] == audited
+
+    def it_computes_without_an_organization_or_token(
+        audited: dict, snapshot_dir: str
+    ) -> None:
+        config = _config(phase="compute", snapshot_dir=snapshot_dir)
+        config.organization = ""
+        config.personal_access_token = ""
+
+        with patch("edfi_repo_auditor.auditor.output_to_github_actions") as output:
+            run_compute(config)
+
+        assert output.call_args[0][1] == audited
+
+    def it_rejects_a_snapshot_of_another_organization(snapshot_dir: str) -> None:
+        config = _config(phase="compute", snapshot_dir=snapshot_dir)
+        config.organization = "Ed-Fi-Exchange-OSS"
+
+        with pytest.raises(ValueError):
+            run_compute(config)
+
+    def it_ends_the_time_windows_at_collection(tmp_path: Path) -> None:
+        collected_at = datetime.now(timezone.utc) - timedelta(days=60)
+        merged_at = (collected_at - timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        entities = read_snapshot(_collect(tmp_path)).data
+        repository = {entity: data[REPO] for entity, data in entities.items()}
+        repository["merged_prs"][0]["merged_at"] = merged_at
+        write_snapshot(str(tmp_path), OWNER, collected_at, {REPO: repository})
+
+        with patch("edfi_repo_auditor.auditor.output_to_github_actions") as output:
+            run_compute(_config(phase="compute", snapshot_dir=str(tmp_path)))
+
+        assert output.call_args[0][1][MERGED_PRS_LAST_30_DAYS_KEY] == 1
+
+    def describe_given_a_narrower_collection_window() -> None:
+        def it_raises_a_ValueError(tmp_path: Path) -> None:
+            snapshot = read_snapshot(_collect(tmp_path))
+            repository = {entity: data[REPO] for entity, data in snapshot.data.items()}
+            write_snapshot(
+                str(tmp_path),
+                OWNER,
+                snapshot.collected_at,
+                {REPO: repository},
+                windows={**COLLECTION_WINDOWS, "workflow_runs": 7},
+            )
+
+            with pytest.raises(ValueError):
+                run_compute(_config(phase="compute", snapshot_dir=str(tmp_path)))
+
+    def describe_given_no_recorded_collection_window() -> None:
+        def it_warns_and_computes(tmp_path: Path, caplog) -> None:
+            snapshot = read_snapshot(_collect(tmp_path))
+            repository = {entity: data[REPO] for entity, data in snapshot.data.items()}
+            write_snapshot(
+                str(tmp_path), OWNER, snapshot.collected_at, {REPO: repository}
+            )
+
+            with patch("edfi_repo_auditor.auditor.output_to_github_actions") as output:
+                run_compute(_config(phase="compute", snapshot_dir=str(tmp_path)))
+
+            output.assert_called_once()
+            assert "does not record how many days of merged_prs" in caplog.text
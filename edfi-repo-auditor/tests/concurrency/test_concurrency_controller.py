@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import threading
+
+import pytest
+
+from edfi_repo_auditor.concurrency import ConcurrencyController
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _fill_and_drain(
+    controller: ConcurrencyController, clock: _Clock, latency: float = 0.1
+) -> None:
+    started = [controller.acquire() for _ in range(controller.limit)]
+    clock.now += latency
+    for start in started:
+        controller.release(start)
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+def describe_when_creating_a_controller() -> None:
+    def it_starts_at_the_initial_limit(clock: _Clock) -> None:
+        assert ConcurrencyController(10, initial_limit=4, clock=clock).limit == 4
+
+    def it_caps_the_initial_limit_at_the_maximum(clock: _Clock) -> None:
+        assert ConcurrencyController(2, initial_limit=4, clock=clock).limit == 2
+
+    def it_rejects_a_maximum_below_the_minimum() -> None:
+        with pytest.raises(ValueError):
+            ConcurrencyController(1, min_limit=2)
+
+
+def describe_when_responses_are_healthy() -> None:
+    def describe_given_the_limit_is_in_use() -> None:
+        def it_raises_the_limit_additively(clock: _Clock) -> None:
+            controller = ConcurrencyController(10, initial_limit=4, clock=clock)
+
+            for _ in range(4):
+                _fill_and_drain(controller, clock)
+
+            assert 4 < controller.limit <= 6
+
+        def it_never_exceeds_the_maximum(clock: _Clock) -> None:
+            controller = ConcurrencyController(6, initial_limit=4, clock=clock)
+
+            for _ in range(50):
+                _fill_and_drain(controller, clock)
+
+            assert controller.limit == 6
+
+    def describe_given_requests_are_sent_one_at_a_time() -> None:
+        def it_keeps_the_limit(clock: _Clock) -> None:
+            controller = ConcurrencyController(10, initial_limit=4, clock=clock)
+
+            for _ in range(50):
+                started = controller.acquire()
+                clock.now += 0.1
+                controller.release(started)
+
+            assert controller.limit == 4
+
+
+def describe_when_a_response_is_throttled() -> None:
+    def it_halves_the_limit(clock: _Clock) -> None:
+        controller = ConcurrencyController(10, initial_limit=8, clock=clock)
+
+        controller.release(controller.acquire(), throttled=True)
+
+        assert controller.limit == 4
+
+    def it_cuts_once_for_a_burst_of_throttled_responses(clock: _Clock) -> None:
+        controller = ConcurrencyController(10, initial_limit=8, clock=clock)
+        started = [controller.acquire() for _ in range(8)]
+        clock.now += 0.1
+
+        for start in started:
+            controller.release(start, throttled=True)
+
+        summary = controller.summary()
+        assert controller.limit == 4
+        assert summary["throttle_events"] == 8
+        assert summary["decreases"] == 1
+
+    def it_does_not_go_below_the_minimum(clock: _Clock) -> None:
+        controller = ConcurrencyController(10, initial_limit=2, clock=clock)
+
+        for _ in range(3):
+            clock.now += 1
+            controller.release(controller.acquire(), throttled=True)
+
+        assert controller.limit == 1
+
+
+def describe_when_latency_rises() -> None:
+    def it_reduces_the_limit(clock: _Clock) -> None:
+        controller = ConcurrencyController(10, initial_limit=8, clock=clock)
+        for _ in range(30):
+            started = controller.acquire()
+            clock.now += 0.1
+            controller.release(started)
+
+        for _ in range(5):
+            started = controller.acquire()
+            clock.now += 1.0
+            controller.release(started)
+
+        assert controller.limit < 8
+        assert controller.summary()["latency_events"] >= 1
+
+    def describe_given_slow_requests_of_another_kind() -> None:
+        def it_keeps_the_limit(clock: _Clock) -> None:
+            controller = ConcurrencyController(10, initial_limit=8, clock=clock)
+            for index in range(400):
+                started = controller.acquire()
+                # Runs of slow queries between quick REST calls.
+                slow = index % 8 >= 6
+                clock.now += 3.0 if slow else 0.15
+                controller.release(started, latency_class="graphql" if slow else "core")
+
+            assert controller.summary()["latency_events"] == 0
+            assert controller.limit == 8
+
+
+def describe_when_a_request_fails() -> None:
+    def it_leaves_the_limit_alone(clock: _Clock) -> None:
+        controller = ConcurrencyController(10, initial_limit=4, clock=clock)
+        started = [controller.acquire() for _ in range(4)]
+        for start in started:
+            controller.release(start, failed=True)
+
+        assert controller.limit == 4
+        assert controller.summary()["in_flight"] == 0
+
+
+def describe_when_the_limit_is_reached() -> None:
+    def it_blocks_until_a_slot_is_released() -> None:
+        controller = ConcurrencyController(1)
+        first = controller.acquire()
+        acquired = threading.Event()
+
+        def _second() -> None:
+            controller.release(controller.acquire())
+            acquired.set()
+
+        thread = threading.Thread(target=_second)
+        thread.start()
+        assert not acquired.wait(0.05)
+
+        controller.release(first)
+        thread.join(1)
+
+        assert acquired.is_set()
+
+
+def describe_when_a_slot_is_held_after_release() -> None:
+    def it_blocks_until_the_slot_is_freed() -> None:
+        controller = ConcurrencyController(1)
+        controller.release(controller.acquire(), hold=True)
+        acquired = threading.Event()
+
+        def _second() -> None:
+            controller.release(controller.acquire())
+            acquired.set()
+
+        thread = threading.Thread(target=_second)
+        thread.start()
+        assert not acquired.wait(0.05)
+
+        controller.free()
+        thread.join(1)
+
+        assert acquired.is_set()
+        assert controller.summary()["in_flight"] == 0
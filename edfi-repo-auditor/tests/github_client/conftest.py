@@ -0,0 +1,16 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from typing import List
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def retry_sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """Skip the backoff between retries of transient failures."""
+    sleeps: List[float] = []
+    monkeypatch.setattr("edfi_repo_auditor.retry._sleep", sleeps.append)
+    return sleeps
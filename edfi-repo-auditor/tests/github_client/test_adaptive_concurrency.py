@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator
+
+import pytest
+
+from edfi_repo_auditor.concurrency import ConcurrencyController
+from edfi_repo_auditor.github_client import GitHubClient
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+
+# The stub answers 429 whenever more than this many requests are in flight,
+# mimicking GitHub's secondary rate limit.
+STUB_CAPACITY = 3
+
+
+class _ThrottlingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    in_flight = 0
+
+    def do_GET(self) -> None:
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            throttle = cls.in_flight > STUB_CAPACITY
+        try:
+            if throttle:
+                self._respond(429, b'{"message": "secondary rate limit"}')
+            else:
+                time.sleep(0.01)
+                self._respond(200, b'{"ok": true}')
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def _respond(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ThrottlingHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def describe_when_the_server_throttles_concurrent_requests() -> None:
+    @pytest.fixture
+    def summary(server_url: str) -> Dict[str, int]:
+        client = GitHubClient(ACCESS_TOKEN, pool_size=16)
+        client.concurrency = ConcurrencyController(16, initial_limit=16)
+        try:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                results = list(
+                    executor.map(
+                        lambda i: client._execute_api_call(
+                            "stub", "GET", f"{server_url}/stub/{i}"
+                        ),
+                        range(64),
+                    )
+                )
+            assert results == [{"ok": True}] * 64
+            return client.concurrency.summary()
+        finally:
+            client.close()
+
+    def it_records_the_throttle_events(summary: Dict[str, int]) -> None:
+        assert summary["throttle_events"] > 0
+
+    def it_backs_off_below_the_starting_concurrency(summary: Dict[str, int]) -> None:
+        assert summary["lowest_limit"] < 16
+        assert summary["decreases"] >= 1
+
+    def it_releases_every_slot(summary: Dict[str, int]) -> None:
+        assert summary["in_flight"] == 0
@@ -0,0 +1,115 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from http import HTTPStatus
+from pathlib import Path
+
+import requests_mock
+
+from edfi_repo_auditor.github_client import API_URL, GitHubClient
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+ACTIONS_URL = f"{API_URL}/repos/{OWNER}/{REPO}/actions/workflows"
+ACTIONS_BODY = '{"total_count": 1, "workflows": [{"path": ".github/workflows/a.yml"}]}'
+ETAG = 'W/"4f2b"'
+
+
+def describe_when_a_cache_directory_is_configured() -> None:
+    def describe_given_the_response_was_cached_by_an_earlier_run() -> None:
+        def it_sends_a_conditional_request(tmp_path: Path) -> None:
+            with requests_mock.Mocker() as m:
+                m.get(ACTIONS_URL, text=ACTIONS_BODY, headers={"ETag": ETAG})
+                GitHubClient(ACCESS_TOKEN, cache_dir=str(tmp_path)).get_actions(
+                    OWNER, REPO
+                )
+
+                m.get(ACTIONS_URL, status_code=HTTPStatus.NOT_MODIFIED)
+                GitHubClient(ACCESS_TOKEN, cache_dir=str(tmp_path)).get_actions(
+                    OWNER, REPO
+                )
+
+                assert m.last_request.headers["If-None-Match"] == ETAG
+
+        def it_reuses_the_cached_body_when_not_modified(tmp_path: Path) -> None:
+            with requests_mock.Mocker() as m:
+                m.get(ACTIONS_URL, text=ACTIONS_BODY, headers={"ETag": ETAG})
+                first = GitHubClient(ACCESS_TOKEN, cache_dir=str(tmp_path))
+                expected = first.get_actions(OWNER, REPO)
+
+                m.get(ACTIONS_URL, status_code=HTTPStatus.NOT_MODIFIED)
+                second = GitHubClient(ACCESS_TOKEN, cache_dir=str(tmp_path))
+                actual = second.get_actions(OWNER, REPO)
+
+            assert actual == expected
+            assert second.cache is not None
+            assert second.cache.summary()["hits"] == 1
+
+        def it_replaces_the_entry_when_modified(tmp_path: Path) -> None:
+            with requests_mock.Mocker() as m:
+                m.get(ACTIONS_URL, text=ACTIONS_BODY, headers={"ETag": ETAG})
+                GitHubClient(ACCESS_TOKEN, cache_dir=str(tmp_path)).get_actions(
+                    OWNER, REPO
+                )
+
+                m.get(ACTIONS_URL, text='{"total_count": 0}', headers={"ETag": '"new"'})
+                client = GitHubClient(ACCESS_TOKEN, cache_dir=str(tmp_path))
+                actual = client.get_actions(OWNER, REPO)
+
+            assert actual == {"total_count": 0}
+            assert client.cache is not None
+            assert client.cache.get(ACTIONS_URL).etag == '"new"'  # type: ignore
+
+
+def describe_when_no_cache_directory_is_configured() -> None:
+    def it_sends_unconditional_requests() -> None:
+        with requests_mock.Mocker() as m:
+            m.get(ACTIONS_URL, text=ACTIONS_BODY, headers={"ETag": ETAG})
+            client = GitHubClient(ACCESS_TOKEN)
+            client.get_actions(OWNER, REPO)
+            client.get_actions(OWNER, REPO)
+
+            assert "If-None-Match" not in m.last_request.headers
+
+
+def describe_when_a_raw_file_was_cached_by_an_earlier_run() -> None:
+    def it_reuses_the_cached_text_when_not_modified(tmp_path: Path) -> None:
+        url = f"{API_URL}/repos/{OWNER}/{REPO}/contents/LICENSE"
+        with requests_mock.Mocker() as m:
+            m.get(url, text="Apache License", headers={"ETag": ETAG})
+            GitHubClient(ACCESS_TOKEN, cache_dir=str(tmp_path)).get_file_content(
+                OWNER, REPO, "LICENSE"
+            )
+
+            m.get(url, status_code=HTTPStatus.NOT_MODIFIED)
+            result = GitHubClient(
+                ACCESS_TOKEN, cache_dir=str(tmp_path)
+            ).get_file_content(OWNER, REPO, "LICENSE")
+
+            assert m.last_request.headers["If-None-Match"] == ETAG
+        assert result == "Apache License"
+
+
+def describe_when_a_date_windowed_listing_is_requested() -> None:
+    def it_does_not_cache_the_response(tmp_path: Path) -> None:
+        runs_url = f"{API_URL}/repos/{OWNER}/{REPO}/actions/runs"
+        with requests_mock.Mocker() as m:
+            m.get(
+                runs_url,
+                text='{"total_count": 0, "workflow_runs": []}',
+                headers={"ETag": ETAG},
+            )
+            GitHubClient(ACCESS_TOKEN, cache_dir=str(tmp_path)).get_workflow_runs(
+                OWNER, REPO
+            )
+
+            client = GitHubClient(ACCESS_TOKEN, cache_dir=str(tmp_path))
+            client.get_workflow_runs(OWNER, REPO)
+
+            assert "If-None-Match" not in m.last_request.headers
+        assert client.cache is not None
+        assert client.cache.summary()["stores"] == 0
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator
+
+import pytest
+
+from edfi_repo_auditor.github_client import GitHubClient
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def describe_when_getting_connection_stats() -> None:
+    def describe_given_no_requests_sent() -> None:
+        def it_reports_zero_requests() -> None:
+            assert GitHubClient(ACCESS_TOKEN).get_connection_stats() == {
+                "requests": 0,
+                "connections_opened": 0,
+                "connections_reused": 0,
+            }
+
+    def describe_given_several_requests_to_the_same_host() -> None:
+        @pytest.fixture
+        def stats(server_url: str) -> Dict[str, int]:
+            client = GitHubClient(ACCESS_TOKEN)
+            try:
+                for _ in range(3):
+                    client._execute_api_call("stub", "GET", f"{server_url}/stub")
+                return client.get_connection_stats()
+            finally:
+                client.close()
+
+        def it_counts_every_request(stats: Dict[str, int]) -> None:
+            assert stats["requests"] == 3
+
+        def it_opens_a_single_connection(stats: Dict[str, int]) -> None:
+            assert stats["connections_opened"] == 1
+
+        def it_reuses_the_connection(stats: Dict[str, int]) -> None:
+            assert stats["connections_reused"] == 2
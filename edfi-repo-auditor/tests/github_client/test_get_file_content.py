@@ -4,11 +4,11 @@
 # See the LICENSE and NOTICES files in the project root for more information.
 
 from http import HTTPStatus
-from typing import Optional
+from typing import List, Optional
 import pytest
 import requests_mock
 
-from edfi_repo_auditor.github_client import GitHubClient, API_URL
+from edfi_repo_auditor.github_client import GitHubClient, API_URL, RAW_MEDIA_TYPE
 
 ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
 OWNER = "Ed-Fi-Alliance-OSS"
@@ -52,6 +52,7 @@ def describe_when_getting_file() -> None:
                         f"{FILES_URL}/README.md",
                         status_code=HTTPStatus.OK,
                         text=FILE_RESULT,
+                        headers={"Content-Type": "application/json; charset=utf-8"},
                     )
                     return GitHubClient(ACCESS_TOKEN).get_file_content(
                         OWNER, REPO, "README.md"
@@ -84,3 +85,92 @@ def describe_when_getting_file() -> None:
                         GitHubClient(ACCESS_TOKEN).get_file_content(
                             OWNER, REPO, "README.md"
                         )
+
+
+def describe_when_getting_a_raw_file() -> None:
+    def it_requests_the_raw_media_type() -> None:
+        with requests_mock.Mocker() as m:
+            m.get(f"{FILES_URL}/LICENSE", text="Apache License")
+            GitHubClient(ACCESS_TOKEN).get_file_content(OWNER, REPO, "LICENSE")
+
+            assert m.last_request.headers["Accept"] == RAW_MEDIA_TYPE
+
+    def it_returns_the_text() -> None:
+        with requests_mock.Mocker() as m:
+            m.get(
+                f"{FILES_URL}/LICENSE",
+                content="Licence été".encode("utf-8"),
+                headers={"Content-Type": "application/vnd.github.raw"},
+            )
+            result = GitHubClient(ACCESS_TOKEN).get_file_content(OWNER, REPO, "LICENSE")
+
+        assert result == "Licence été"
+
+    def describe_given_the_file_is_larger_than_the_cap() -> None:
+        def it_returns_only_the_first_bytes() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(f"{FILES_URL}/big.yml", content=b"a" * 100)
+                result = GitHubClient(ACCESS_TOKEN).get_file_content(
+                    OWNER, REPO, "big.yml", max_bytes=10
+                )
+
+            assert result == "a" * 10
+
+    def describe_given_the_file_does_not_exist() -> None:
+        def it_returns_none() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(f"{FILES_URL}/NOTICES.md", status_code=HTTPStatus.NOT_FOUND)
+                result = GitHubClient(ACCESS_TOKEN).get_file_content(
+                    OWNER, REPO, "NOTICES.md"
+                )
+
+            assert result is None
+
+
+def describe_when_streaming_a_file() -> None:
+    def it_yields_text_chunks() -> None:
+        with requests_mock.Mocker() as m:
+            m.get(f"{FILES_URL}/ci.yml", content=b"on: push\njobs: {}\n")
+            chunks: List[str] = list(
+                GitHubClient(ACCESS_TOKEN).iter_file_content(OWNER, REPO, "ci.yml")
+            )
+
+        assert "".join(chunks) == "on: push\njobs: {}\n"
+
+    def describe_given_blank_path() -> None:
+        def it_raises_a_ValueError_immediately() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient(ACCESS_TOKEN).iter_file_content(OWNER, REPO, " ")
+
+    def describe_given_the_file_does_not_exist() -> None:
+        def it_raises_a_RuntimeError() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(f"{FILES_URL}/ci.yml", status_code=HTTPStatus.NOT_FOUND)
+                with pytest.raises(RuntimeError):
+                    list(
+                        GitHubClient(ACCESS_TOKEN).iter_file_content(
+                            OWNER, REPO, "ci.yml"
+                        )
+                    )
+
+    def describe_given_the_body_is_still_being_read() -> None:
+        def it_holds_a_concurrency_slot_until_the_body_is_read() -> None:
+            client = GitHubClient(ACCESS_TOKEN)
+            with requests_mock.Mocker() as m:
+                m.get(f"{FILES_URL}/ci.yml", content=b"on: push\n")
+                chunks = client.iter_file_content(OWNER, REPO, "ci.yml")
+                next(chunks)
+                streaming = client.concurrency.summary()["in_flight"]
+                list(chunks)
+
+            assert streaming == 1
+            assert client.concurrency.summary()["in_flight"] == 0
+
+        def it_frees_the_slot_when_the_file_cannot_be_read() -> None:
+            client = GitHubClient(ACCESS_TOKEN)
+            with requests_mock.Mocker() as m:
+                m.get(f"{FILES_URL}/ci.yml", status_code=HTTPStatus.NOT_FOUND)
+                with pytest.raises(RuntimeError):
+                    list(client.iter_file_content(OWNER, REPO, "ci.yml"))
+
+            assert client.concurrency.summary()["in_flight"] == 0
@@ -192,6 +192,151 @@ def describe_get_merged_prs_with_reviews() -> None:
         def it_includes_second_page_pr(results: list) -> None:
             assert results[1]["number"] == 1
 
+    def describe_given_fast_full_pages() -> None:
+        PAGE1 = _graphql_response([_make_node(2)], True, "cursor_abc")
+        PAGE1["data"]["rateLimit"] = {"cost": 1, "remaining": 4999}
+        PAGE2 = _graphql_response([_make_node(1)])
+
+        @pytest.fixture
+        def page_sizes() -> list:
+            with requests_mock_module.Mocker() as m:
+                m.register_uri(
+                    "POST",
+                    GRAPHQL_ENDPOINT,
+                    [
+                        {"json": PAGE1, "status_code": HTTPStatus.OK},
+                        {"json": PAGE2, "status_code": HTTPStatus.OK},
+                    ],
+                )
+                GitHubClient(ACCESS_TOKEN).get_merged_prs_with_reviews(OWNER, REPO)
+                return [r.json()["variables"]["pageSize"] for r in m.request_history]
+
+        def it_doubles_the_page_size(page_sizes: list) -> None:
+            assert page_sizes == [20, 40]
+
+    def describe_given_a_page_times_out_on_githubs_side() -> None:
+        TIMEOUT = {
+            "data": None,
+            "errors": [
+                {
+                    "message": "Something went wrong while executing your "
+                    "query. This may be the result of a timeout."
+                }
+            ],
+        }
+
+        @pytest.fixture
+        def client() -> GitHubClient:
+            return GitHubClient(ACCESS_TOKEN)
+
+        @pytest.fixture
+        def page_sizes(client: GitHubClient) -> list:
+            with requests_mock_module.Mocker() as m:
+                m.register_uri(
+                    "POST",
+                    GRAPHQL_ENDPOINT,
+                    [
+                        {"json": TIMEOUT, "status_code": HTTPStatus.OK},
+                        {
+                            "json": _graphql_response([_make_node(1)]),
+                            "status_code": HTTPStatus.OK,
+                        },
+                    ],
+                )
+                client.get_merged_prs_with_reviews(OWNER, REPO)
+                return [r.json()["variables"]["pageSize"] for r in m.request_history]
+
+        def it_asks_again_for_half_the_page(page_sizes: list) -> None:
+            assert page_sizes == [20, 10]
+
+        def it_does_not_spend_a_retry(
+            client: GitHubClient, page_sizes: list, retry_sleeps: list
+        ) -> None:
+            assert retry_sleeps == []
+            assert client.retrier.summary().get("graphql", 0) == 0
+
+        def it_counts_the_timeout(client: GitHubClient, page_sizes: list) -> None:
+            assert client.page_sizer.summary()["pull_requests"]["timeouts"] == 1
+
+        def describe_given_every_page_size_times_out() -> None:
+            def it_retries_at_the_minimum_and_then_fails(
+                client: GitHubClient,
+            ) -> None:
+                with requests_mock_module.Mocker() as m:
+                    m.post(GRAPHQL_ENDPOINT, json=TIMEOUT)
+                    with pytest.raises(RuntimeError):
+                        client.get_merged_prs_with_reviews(OWNER, REPO)
+
+                    page_sizes = [
+                        r.json()["variables"]["pageSize"] for r in m.request_history
+                    ]
+                assert page_sizes == [20, 10, 5, 5, 5, 5, 5]
+
+    def describe_given_pr_with_more_than_one_page_of_reviews() -> None:
+        def _review(login: str) -> dict:
+            return {
+                "author": {"login": login},
+                "state": "COMMENTED",
+                "submittedAt": "2026-03-21T09:00:00Z",
+            }
+
+        def _follow_up(nodes: list, has_next_page: bool, end_cursor=None) -> dict:
+            return {
+                "data": {
+                    "p0": {
+                        "reviews": {
+                            "pageInfo": {
+                                "hasNextPage": has_next_page,
+                                "endCursor": end_cursor,
+                            },
+                            "nodes": nodes,
+                        }
+                    }
+                }
+            }
+
+        @pytest.fixture
+        def history() -> list:
+            busy = _make_node(7, reviews=[_review("bob")])
+            busy["id"] = "PR_busy"
+            busy["reviews"]["pageInfo"] = {"hasNextPage": True, "endCursor": "r1"}
+            quiet = _make_node(8, reviews=[_review("carol")])
+            quiet["id"] = "PR_quiet"
+
+            with requests_mock_module.Mocker() as m:
+                m.register_uri(
+                    "POST",
+                    GRAPHQL_ENDPOINT,
+                    [
+                        {"json": _graphql_response([busy, quiet])},
+                        {"json": _follow_up([_review("dave")], True, "r2")},
+                        {"json": _follow_up([_review("erin")], False)},
+                    ],
+                )
+                results = GitHubClient(ACCESS_TOKEN).get_merged_prs_with_reviews(
+                    OWNER, REPO
+                )
+                return [results, m.request_history]
+
+        def it_appends_every_review_page(history: list) -> None:
+            results, _ = history
+            assert [r["user"] for r in results[0]["reviews"]] == [
+                "bob",
+                "dave",
+                "erin",
+            ]
+
+        def it_leaves_other_prs_alone(history: list) -> None:
+            results, _ = history
+            assert [r["user"] for r in results[1]["reviews"]] == ["carol"]
+
+        def it_follows_only_the_overflowing_pr(history: list) -> None:
+            _, requests = history
+            assert [r.json()["variables"] for r in requests[1:]] == [
+                {"id0": "PR_busy", "after0": "r1"},
+                {"id0": "PR_busy", "after0": "r2"},
+            ]
+
     def describe_given_pr_with_null_author() -> None:
         @pytest.fixture
         def results() -> list:
@@ -4,6 +4,7 @@
 # See the LICENSE and NOTICES files in the project root for more information.
 
 from http import HTTPStatus
+from json import dumps
 from typing import List
 import pytest
 import requests_mock
@@ -98,3 +99,48 @@ def describe_when_getting_repositories() -> None:
 
                     with pytest.raises(RuntimeError):
                         GitHubClient(ACCESS_TOKEN).get_repositories(OWNER)
+
+
+def _page(names: List[str], end_cursor: str, has_next_page: bool) -> str:
+    return dumps(
+        {
+            "data": {
+                "organization": {
+                    "repositories": {
+                        "totalCount": 3,
+                        "nodes": [{"name": name} for name in names],
+                        "pageInfo": {
+                            "hasNextPage": has_next_page,
+                            "endCursor": end_cursor,
+                        },
+                    }
+                }
+            }
+        }
+    )
+
+
+def _respond(request, context) -> str:
+    if request.json()["variables"]["cursor"] is None:
+        return _page(["Ed-Fi-Standard", "Ed-Fi-ODS"], "Y3Vyc29yOjI=", True)
+    return _page(["Ed-Fi-Admin"], "Y3Vyc29yOjM=", False)
+
+
+def describe_when_getting_more_than_one_page_of_repositories() -> None:
+    def it_follows_the_cursor() -> None:
+        with requests_mock.Mocker() as m:
+            m.post(GRAPHQL_ENDPOINT, text=_respond)
+            results = GitHubClient(ACCESS_TOKEN).get_repositories(OWNER)
+
+            assert m.last_request.json()["variables"]["cursor"] == "Y3Vyc29yOjI="
+        assert results == ["Ed-Fi-Standard", "Ed-Fi-ODS", "Ed-Fi-Admin"]
+
+    def it_streams_one_page_at_a_time() -> None:
+        with requests_mock.Mocker() as m:
+            m.post(GRAPHQL_ENDPOINT, text=_respond)
+            repositories = GitHubClient(ACCESS_TOKEN).iter_repositories(OWNER)
+
+            first = next(repositories)
+
+            assert first["name"] == "Ed-Fi-Standard"
+            assert m.call_count == 1
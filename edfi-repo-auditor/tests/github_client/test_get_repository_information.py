@@ -96,6 +96,7 @@ def describe_when_getting_repository_information() -> None:
       "hasWikiEnabled": false,
       "hasIssuesEnabled": false,
       "hasProjectsEnabled": false,
+      "hasVulnerabilityAlertsEnabled": true,
       "discussions": {
         "totalCount": 0
       },
@@ -140,6 +141,9 @@ def describe_when_getting_repository_information() -> None:
             def it_returns_license_info(results: dict) -> None:
                 assert results["licenseInfo"]["key"] == "apache-2.0"
 
+            def it_returns_if_dependabot_alerts_are_enabled(results: dict) -> None:
+                assert results["hasVulnerabilityAlertsEnabled"] is True
+
         def describe_given_bad_query() -> None:
             REPOSITORY_INFORMATION_RESULT = """
 {
@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from http import HTTPStatus
+from json import dumps
+
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import API_URL, GitHubClient
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+TREE_URL = f"{API_URL}/repos/{OWNER}/{REPO}/git/trees/HEAD"
+
+TREE_RESULT = dumps(
+    {
+        "sha": "9fb037999f264ba9a7fc6274d15fa3ae2ab98312",
+        "tree": [
+            {"path": ".github", "type": "tree"},
+            {"path": "LICENSE", "type": "blob"},
+            {"path": "NOTICES.md", "type": "blob"},
+            {"path": "src", "type": "tree"},
+        ],
+        "truncated": False,
+    }
+)
+
+
+def describe_when_getting_root_file_names() -> None:
+    def describe_given_blank_owner() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient(ACCESS_TOKEN).get_root_file_names("", REPO)
+
+    def describe_given_blank_repository() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient(ACCESS_TOKEN).get_root_file_names(OWNER, "")
+
+    def describe_given_a_root_tree() -> None:
+        def it_returns_only_the_files() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(TREE_URL, text=TREE_RESULT)
+                result = GitHubClient(ACCESS_TOKEN).get_root_file_names(OWNER, REPO)
+
+            assert result == {"LICENSE", "NOTICES.md"}
+
+    def describe_given_a_truncated_tree() -> None:
+        def it_returns_none() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(TREE_URL, text=dumps({"tree": [], "truncated": True}))
+                result = GitHubClient(ACCESS_TOKEN).get_root_file_names(OWNER, REPO)
+
+            assert result is None
+
+    def describe_given_an_empty_repository() -> None:
+        def it_returns_none() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(
+                    TREE_URL,
+                    status_code=HTTPStatus.CONFLICT,
+                    text='{"message": "Git Repository is empty."}',
+                )
+                result = GitHubClient(ACCESS_TOKEN).get_root_file_names(OWNER, REPO)
+
+            assert result is None
@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from http import HTTPStatus
+from json import dumps
+from typing import Dict
+
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import GRAPHQL_ENDPOINT, GitHubClient
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+
+
+def _entry(name: str, blob: dict, type: str = "blob") -> dict:
+    return {
+        "name": name,
+        "path": f".github/workflows/{name}",
+        "type": type,
+        "object": blob,
+    }
+
+
+WORKFLOWS_RESULT = dumps(
+    {
+        "data": {
+            "repository": {
+                "object": {
+                    "entries": [
+                        _entry(
+                            "ci.yml",
+                            {
+                                "isBinary": False,
+                                "isTruncated": False,
+                                "text": "on: push",
+                            },
+                        ),
+                        _entry(
+                            "huge.yml",
+                            {"isBinary": False, "isTruncated": True, "text": "on: p"},
+                        ),
+                        _entry(
+                            "logo.png",
+                            {"isBinary": True, "isTruncated": False, "text": None},
+                        ),
+                        _entry("templates", {}, type="tree"),
+                    ]
+                }
+            }
+        }
+    }
+)
+
+
+def describe_when_getting_workflow_files() -> None:
+    def describe_given_blank_owner() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient(ACCESS_TOKEN).get_workflow_files("", REPO)
+
+    def describe_given_a_workflows_directory() -> None:
+        @pytest.fixture
+        def results() -> Dict[str, str]:
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=WORKFLOWS_RESULT)
+                return GitHubClient(ACCESS_TOKEN).get_workflow_files(OWNER, REPO)
+
+        def it_returns_the_text_keyed_by_path(results: Dict[str, str]) -> None:
+            assert results[".github/workflows/ci.yml"] == "on: push"
+
+        def it_leaves_out_truncated_and_binary_files(results: Dict[str, str]) -> None:
+            assert list(results) == [".github/workflows/ci.yml"]
+
+    def describe_given_no_workflows_directory() -> None:
+        def it_returns_nothing() -> None:
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    text=dumps({"data": {"repository": {"object": None}}}),
+                )
+                assert GitHubClient(ACCESS_TOKEN).get_workflow_files(OWNER, REPO) == {}
+
+    def describe_given_the_query_fails() -> None:
+        def it_returns_nothing() -> None:
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, status_code=HTTPStatus.UNAUTHORIZED, text="")
+                assert GitHubClient(ACCESS_TOKEN).get_workflow_files(OWNER, REPO) == {}
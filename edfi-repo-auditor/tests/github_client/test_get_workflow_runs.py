@@ -3,8 +3,11 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+import threading
 from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
+from json import dumps
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 import requests_mock
@@ -183,6 +186,55 @@ def describe_when_getting_workflow_runs() -> None:
             ) -> None:
                 assert len(results) == 2
 
+        def describe_given_total_count_across_several_pages() -> None:
+            def _page(page: int) -> list:
+                return [
+                    {
+                        "name": "CI",
+                        "conclusion": "success",
+                        "created_at": f"2024-01-0{page}T10:00:0{index}Z",
+                        "path": ".github/workflows/ci.yml",
+                    }
+                    for index in range(2 if page < 3 else 1)
+                ]
+
+            @pytest.fixture
+            def fetched() -> dict:
+                threads = {}
+
+                def respond(request, context) -> str:
+                    page = int(parse_qs(urlparse(request.url).query)["page"][0])
+                    threads[page] = threading.current_thread().name
+                    return dumps({"total_count": 5, "workflow_runs": _page(page)})
+
+                with requests_mock.Mocker() as m:
+                    m.get(RUNS_URL, text=respond)
+                    results = GitHubClient(ACCESS_TOKEN).get_workflow_runs(
+                        OWNER, REPO, per_page=2
+                    )
+                return {"results": results, "threads": threads}
+
+            def it_requests_each_known_page_once(fetched: dict) -> None:
+                assert sorted(fetched["threads"]) == [1, 2, 3]
+
+            def it_fetches_the_remaining_pages_on_the_worker_pool(
+                fetched: dict,
+            ) -> None:
+                assert fetched["threads"][1] == threading.current_thread().name
+                assert all(
+                    fetched["threads"][page].startswith("workflow-runs")
+                    for page in (2, 3)
+                )
+
+            def it_merges_the_runs_in_page_order(fetched: dict) -> None:
+                assert [r["created_at"] for r in fetched["results"]] == [
+                    "2024-01-01T10:00:00Z",
+                    "2024-01-01T10:00:01Z",
+                    "2024-01-02T10:00:00Z",
+                    "2024-01-02T10:00:01Z",
+                    "2024-01-03T10:00:00Z",
+                ]
+
         def describe_given_empty_result() -> None:
             @pytest.fixture
             def results() -> list:
@@ -211,72 +263,131 @@ def describe_when_getting_workflow_runs() -> None:
         def describe_given_total_count_exceeds_the_1000_result_pagination_cap() -> None:
             # GitHub's actions/runs endpoint silently stops returning results
             # once page * per_page exceeds 1000, even when total_count says
-            # more runs exist. When that's detected, the client re-fetches one
-            # calendar day at a time instead of trusting the windowed query.
-            def it_falls_back_to_per_day_fetching() -> None:
-                today = datetime.now(timezone.utc).date()
-                yesterday_str = (today - timedelta(days=1)).strftime("%Y-%m-%d")
-                today_str = today.strftime("%Y-%m-%d")
-
-                WINDOWED_RESULT = """
-{
-    "total_count": 1500,
-    "workflow_runs": [
-        {
-            "name": "CI",
-            "conclusion": "success",
-            "created_at": "2024-01-01T10:00:00Z",
-            "path": ".github/workflows/ci.yml"
-        }
-    ]
-}
-""".strip()
-
-                DAY1_RESULT = f"""
-{{
-    "workflow_runs": [
-        {{
-            "name": "CI",
-            "conclusion": "failure",
-            "created_at": "{yesterday_str}T09:00:00Z",
-            "path": ".github/workflows/ci.yml"
-        }}
-    ]
-}}
-""".strip()
+            # more runs exist. When that's detected, the client splits the
+            # window into `created` ranges until each one fits under the cap.
+            today = datetime.now(timezone.utc).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            yesterday = today - timedelta(days=1)
+            # Two busy hours that together, but not separately, exceed the cap
+            BUSY_HOURS = {
+                yesterday + timedelta(hours=9): 600,
+                yesterday + timedelta(hours=10): 600,
+            }
+
+            def _runs_in(created: str) -> dict:
+                if created.startswith(">="):
+                    return {
+                        "total_count": sum(BUSY_HOURS.values()),
+                        "workflow_runs": [],
+                    }
+
+                start, end = (
+                    datetime.strptime(bound, "%Y-%m-%dT%H:%M:%SZ").replace(
+                        tzinfo=timezone.utc
+                    )
+                    for bound in created.split("..")
+                )
+                hours = [hour for hour in BUSY_HOURS if start <= hour <= end]
+                return {
+                    "total_count": sum(BUSY_HOURS[hour] for hour in hours),
+                    "workflow_runs": [
+                        {
+                            "name": "CI",
+                            "conclusion": "success",
+                            "created_at": hour.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                            "path": ".github/workflows/ci.yml",
+                        }
+                        for hour in hours
+                    ],
+                }
+
+            def _respond(request, context) -> str:
+                created = parse_qs(urlparse(request.url).query)["created"][0]
+                return dumps(_runs_in(created))
 
-                DAY2_RESULT = f"""
-{{
-    "workflow_runs": [
-        {{
-            "name": "CI",
-            "conclusion": "success",
-            "created_at": "{today_str}T09:00:00Z",
-            "path": ".github/workflows/ci.yml"
-        }}
-    ]
-}}
-""".strip()
+            @pytest.fixture
+            def fetched() -> dict:
+                with requests_mock.Mocker() as m:
+                    m.get(RUNS_URL, text=_respond)
+                    results = GitHubClient(ACCESS_TOKEN).get_workflow_runs(
+                        OWNER, REPO, since_days=1
+                    )
+                    ranges = [
+                        parse_qs(urlparse(r.url).query)["created"][0]
+                        for r in m.request_history
+                    ]
+                return {"results": results, "ranges": ranges}
+
+            def it_returns_the_runs_of_every_busy_hour_once(fetched: dict) -> None:
+                assert sorted(r["created_at"] for r in fetched["results"]) == [
+                    hour.strftime("%Y-%m-%dT%H:%M:%SZ") for hour in BUSY_HOURS
+                ]
+
+            def it_only_splits_ranges_above_the_cap(fetched: dict) -> None:
+                over_cap = [
+                    created
+                    for created in fetched["ranges"]
+                    if _runs_in(created)["total_count"] > 1000
+                ]
+                # Every range above the cap is split into two halves, so the
+                # number of requests is 1 + 2 * (ranges above the cap).
+                assert len(fetched["ranges"]) == 1 + 2 * len(over_cap)
+
+            def it_fetches_each_busy_hour_in_a_range_under_the_cap(
+                fetched: dict,
+            ) -> None:
+                assert [
+                    _runs_in(created)["total_count"]
+                    for created in fetched["ranges"]
+                    if 0 < _runs_in(created)["total_count"] <= 1000
+                ] == [600, 600]
+
+        def describe_given_a_single_hour_exceeds_the_cap() -> None:
+            def it_stops_splitting_at_one_hour() -> None:
+                def respond(request, context) -> str:
+                    created = parse_qs(urlparse(request.url).query)["created"][0]
+                    if created.startswith(">="):
+                        total = 5000
+                    else:
+                        # Every range, down to a single hour, is over the cap
+                        total = 1001
+                    return dumps({"total_count": total, "workflow_runs": []})
 
                 with requests_mock.Mocker() as m:
-                    m.get(
-                        f"{RUNS_URL}?created=>={_cutoff(1)}&per_page=100&page=1",
-                        status_code=HTTPStatus.OK,
-                        text=WINDOWED_RESULT,
+                    m.get(RUNS_URL, text=respond)
+                    GitHubClient(ACCESS_TOKEN).get_workflow_runs(
+                        OWNER, REPO, since_days=1
                     )
-                    m.get(
-                        f"{RUNS_URL}?created={yesterday_str}&per_page=100&page=1",
-                        status_code=HTTPStatus.OK,
-                        text=DAY1_RESULT,
+                    ranges = [
+                        parse_qs(urlparse(r.url).query)["created"][0]
+                        for r in m.request_history[1:]
+                    ]
+
+                for created in ranges:
+                    start, end = (
+                        datetime.strptime(bound, "%Y-%m-%dT%H:%M:%SZ")
+                        for bound in created.split("..")
                     )
+                    assert end - start >= timedelta(minutes=59, seconds=59)
+
+        def describe_given_a_range_of_less_than_an_hour_exceeds_the_cap() -> None:
+            def it_fetches_the_range_once_without_inverting_it(caplog) -> None:
+                start = datetime(2024, 1, 31, 10, 15, tzinfo=timezone.utc)
+                end = datetime(2024, 1, 31, 11, 0, tzinfo=timezone.utc)
+
+                with requests_mock.Mocker() as m:
                     m.get(
-                        f"{RUNS_URL}?created={today_str}&per_page=100&page=1",
-                        status_code=HTTPStatus.OK,
-                        text=DAY2_RESULT,
+                        RUNS_URL,
+                        text=dumps({"total_count": 1001, "workflow_runs": []}),
                     )
-                    results = GitHubClient(ACCESS_TOKEN).get_workflow_runs(
-                        OWNER, REPO, since_days=1
+                    GitHubClient(ACCESS_TOKEN)._bisect_workflow_runs(
+                        OWNER, REPO, start, end, 100
                     )
+                    ranges = [
+                        parse_qs(urlparse(r.url).query)["created"][0]
+                        for r in m.request_history
+                    ]
 
-                assert len(results) == 2
-                assert {r["conclusion"] for r in results} == {"failure", "success"}
+                assert set(ranges) == {"2024-01-31T10:15:00Z..2024-01-31T10:59:59Z"}
+                assert "only the first 1000 are included" in caplog.text
@@ -13,3 +13,8 @@ def describe_when_initializing_a_GitHubClient() -> None:
         def it_raises_a_ValueError() -> None:
             with pytest.raises(ValueError):
                 GitHubClient("   ")
+
+    def describe_given_pool_size_below_one() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient("asd09uasdfu09asdfj;iolkasdfklj", pool_size=0)
@@ -0,0 +1,178 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from http import HTTPStatus
+from json import dumps
+
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import API_URL, GRAPHQL_ENDPOINT, GitHubClient
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+OTHER_REPO = "Ed-Fi-Admin"
+
+ALERTS_URL = f"{API_URL}/orgs/{OWNER}/dependabot/alerts"
+NEXT_PAGE_URL = f"{ALERTS_URL}?after=Y3Vyc29y"
+
+INFORMATION = {
+    "rulesets": {"nodes": []},
+    "hasWikiEnabled": False,
+    "licenseInfo": None,
+}
+
+
+def _alert(repository: str, severity: str) -> dict:
+    return {
+        "number": 1,
+        "state": "open",
+        "created_at": "2024-01-02T03:04:05Z",
+        "repository": {"name": repository},
+        "security_advisory": {"severity": severity},
+        "security_vulnerability": {
+            "package": {"ecosystem": "npm", "name": "minimist"},
+            "severity": severity,
+        },
+    }
+
+
+def _mock_alert_pages(m: requests_mock.Mocker) -> None:
+    m.get(
+        ALERTS_URL,
+        text=dumps([_alert(REPO, "high"), _alert(REPO, "critical")]),
+        headers={"Link": f'<{NEXT_PAGE_URL}>; rel="next"'},
+    )
+    # Registered last so that it takes precedence for the cursor request.
+    m.get(NEXT_PAGE_URL, text=dumps([_alert(OTHER_REPO, "critical")]))
+
+
+def describe_when_streaming_organization_dependabot_alerts() -> None:
+    def describe_given_blank_owner() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                list(GitHubClient(ACCESS_TOKEN).iter_organization_dependabot_alerts(""))
+
+    def describe_given_two_pages() -> None:
+        @pytest.fixture
+        def history() -> list:
+            with requests_mock.Mocker() as m:
+                _mock_alert_pages(m)
+                alerts = list(
+                    GitHubClient(ACCESS_TOKEN).iter_organization_dependabot_alerts(
+                        OWNER
+                    )
+                )
+                assert len(alerts) == 3
+                return m.request_history
+
+        def it_follows_the_link_header(history: list) -> None:
+            assert [r.url for r in history][1] == NEXT_PAGE_URL
+
+        def it_filters_open_severe_alerts_on_the_server(history: list) -> None:
+            assert history[0].qs == {
+                "state": ["open"],
+                "severity": ["critical,high"],
+                "per_page": ["100"],
+            }
+
+
+def describe_when_loading_organization_dependabot_alerts() -> None:
+    def describe_given_the_stream_is_readable() -> None:
+        @pytest.fixture
+        def client() -> GitHubClient:
+            return GitHubClient(ACCESS_TOKEN)
+
+        def it_indexes_alerts_by_repository(client: GitHubClient) -> None:
+            with requests_mock.Mocker() as m:
+                _mock_alert_pages(m)
+                m.post(
+                    GRAPHQL_ENDPOINT, text=dumps({"data": {"repository": INFORMATION}})
+                )
+
+                assert client.load_organization_dependabot_alerts(OWNER) is True
+                information = client.get_repository_information(OWNER, REPO)
+
+            assert information["vulnerabilityAlerts"]["nodes"] == [
+                {
+                    "createdAt": "2024-01-02T03:04:05Z",
+                    "securityVulnerability": {
+                        "package": {"name": "minimist"},
+                        "advisory": {"severity": "HIGH"},
+                    },
+                },
+                {
+                    "createdAt": "2024-01-02T03:04:05Z",
+                    "securityVulnerability": {
+                        "package": {"name": "minimist"},
+                        "advisory": {"severity": "CRITICAL"},
+                    },
+                },
+            ]
+
+        def it_leaves_alerts_out_of_repository_queries(client: GitHubClient) -> None:
+            with requests_mock.Mocker() as m:
+                _mock_alert_pages(m)
+                graphql = m.post(
+                    GRAPHQL_ENDPOINT, text=dumps({"data": {"repository": INFORMATION}})
+                )
+
+                client.load_organization_dependabot_alerts(OWNER)
+                client.get_repository_information(OWNER, REPO)
+
+                assert (
+                    graphql.last_request.json()["variables"]["includeAlerts"] is False
+                )
+
+        def it_reports_no_alerts_for_a_repository_without_any(
+            client: GitHubClient,
+        ) -> None:
+            with requests_mock.Mocker() as m:
+                _mock_alert_pages(m)
+                m.post(
+                    GRAPHQL_ENDPOINT, text=dumps({"data": {"repository": INFORMATION}})
+                )
+
+                client.load_organization_dependabot_alerts(OWNER)
+                information = client.get_repository_information(OWNER, "Ed-Fi-Docs")
+
+            assert information["vulnerabilityAlerts"] == {"nodes": []}
+
+        def it_reads_the_stream_once(client: GitHubClient) -> None:
+            with requests_mock.Mocker() as m:
+                _mock_alert_pages(m)
+
+                client.load_organization_dependabot_alerts(OWNER)
+                client.load_organization_dependabot_alerts(OWNER)
+
+                assert m.call_count == 2
+
+    def describe_given_the_token_cannot_read_the_stream() -> None:
+        @pytest.fixture
+        def client() -> GitHubClient:
+            return GitHubClient(ACCESS_TOKEN)
+
+        def it_falls_back_to_per_repository_alerts(client: GitHubClient) -> None:
+            with requests_mock.Mocker() as m:
+                m.get(ALERTS_URL, status_code=HTTPStatus.FORBIDDEN, text="{}")
+                graphql = m.post(
+                    GRAPHQL_ENDPOINT,
+                    text=dumps(
+                        {
+                            "data": {
+                                "repository": {
+                                    **INFORMATION,
+                                    "vulnerabilityAlerts": {"nodes": []},
+                                }
+                            }
+                        }
+                    ),
+                )
+
+                assert client.load_organization_dependabot_alerts(OWNER) is False
+                client.get_repository_information(OWNER, REPO)
+
+                assert graphql.last_request.json()["variables"]["includeAlerts"] is True
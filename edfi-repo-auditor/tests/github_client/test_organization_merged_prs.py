@@ -0,0 +1,281 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import re
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from json import dumps
+from typing import List
+
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import (
+    GRAPHQL_ENDPOINT,
+    REPOSITORIES_PER_SEARCH,
+    SEARCH_RESULT_LIMIT,
+    GitHubClient,
+)
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+OTHER_REPO = "Ed-Fi-Admin"
+
+_ISO = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _node(number: int, repository: str) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "repository": {"name": repository},
+        "number": number,
+        "createdAt": (now - timedelta(days=2)).strftime(_ISO),
+        "closedAt": now.strftime(_ISO),
+        "mergedAt": now.strftime(_ISO),
+        "author": {"login": "alice"},
+        "additions": 1,
+        "deletions": 1,
+        "changedFiles": 1,
+        "reviews": {
+            "pageInfo": {"hasNextPage": False},
+            "nodes": [
+                {
+                    "author": {"login": "bob"},
+                    "state": "APPROVED",
+                    "submittedAt": now.strftime(_ISO),
+                }
+            ],
+        },
+    }
+
+
+def _search(
+    nodes: List[dict], issue_count: int, has_next_page=False, end_cursor=None
+) -> str:
+    return dumps(
+        {
+            "data": {
+                "search": {
+                    "issueCount": issue_count,
+                    "nodes": nodes,
+                    "pageInfo": {
+                        "hasNextPage": has_next_page,
+                        "endCursor": end_cursor,
+                    },
+                }
+            }
+        }
+    )
+
+
+def _two_pages(request, context) -> str:
+    if request.json()["variables"]["cursor"] is None:
+        return _search([_node(1, REPO), {}], 3, True, "c1")
+    return _search([_node(2, OTHER_REPO), _node(3, REPO)], 3)
+
+
+def _merged_range(request) -> List[str]:
+    query = request.json()["variables"]["query"]
+    match = re.search(r"merged:(\S+)\.\.(\S+)", query)
+    assert match is not None
+    return [match.group(1), match.group(2)]
+
+
+def describe_when_searching_merged_prs_for_an_organization() -> None:
+    def describe_given_blank_owner() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                list(GitHubClient(ACCESS_TOKEN).iter_organization_merged_prs(" "))
+
+    def describe_given_two_pages() -> None:
+        def it_follows_the_cursor() -> None:
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=_two_pages)
+                nodes = list(
+                    GitHubClient(ACCESS_TOKEN).iter_organization_merged_prs(OWNER)
+                )
+
+                assert m.call_count == 2
+            assert [node["number"] for node in nodes] == [1, 2, 3]
+
+        def it_searches_the_exact_window() -> None:
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=_two_pages)
+                list(GitHubClient(ACCESS_TOKEN).iter_organization_merged_prs(OWNER, 30))
+
+                query = m.request_history[0].json()["variables"]["query"]
+            today = datetime.now(timezone.utc).date()
+            assert query == (
+                f"org:{OWNER} is:pr is:merged "
+                f"merged:{today - timedelta(days=31)}..{today}"
+            )
+
+        def it_includes_prs_merged_on_the_last_day_the_metrics_count() -> None:
+            # compute_pr_metrics keeps PRs whose age in whole days is at most
+            # 30, such as one merged 30 and a half days ago.
+            merged = datetime.now(timezone.utc) - timedelta(days=30, hours=12)
+
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=_two_pages)
+                list(GitHubClient(ACCESS_TOKEN).iter_organization_merged_prs(OWNER, 30))
+
+                start, end = _merged_range(m.request_history[0])
+            assert start <= merged.date().isoformat() <= end
+
+    def describe_given_named_repositories() -> None:
+        def it_searches_only_those_repositories() -> None:
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=_search([], 0))
+                list(
+                    GitHubClient(ACCESS_TOKEN).iter_organization_merged_prs(
+                        OWNER, 30, [REPO, OTHER_REPO]
+                    )
+                )
+
+                query = m.request_history[0].json()["variables"]["query"]
+            assert query.startswith(
+                f"repo:{OWNER}/{REPO} repo:{OWNER}/{OTHER_REPO} is:pr is:merged "
+            )
+
+        def it_searches_long_lists_in_groups() -> None:
+            repositories = [f"repo-{i}" for i in range(REPOSITORIES_PER_SEARCH + 1)]
+
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=_search([], 0))
+                list(
+                    GitHubClient(ACCESS_TOKEN).iter_organization_merged_prs(
+                        OWNER, 30, repositories
+                    )
+                )
+
+                queries = [r.json()["variables"]["query"] for r in m.request_history]
+            assert [query.count("repo:") for query in queries] == [
+                REPOSITORIES_PER_SEARCH,
+                1,
+            ]
+
+    def describe_given_more_results_than_search_returns() -> None:
+        def it_splits_the_date_range() -> None:
+            today = datetime.now(timezone.utc).date()
+            whole = [str(today - timedelta(days=31)), str(today)]
+
+            def respond(request, context) -> str:
+                if _merged_range(request) == whole:
+                    return _search([_node(1, REPO)], SEARCH_RESULT_LIMIT + 1)
+                return _search([_node(2, REPO)], 1)
+
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=respond)
+                nodes = list(
+                    GitHubClient(ACCESS_TOKEN).iter_organization_merged_prs(OWNER, 30)
+                )
+
+                ranges = [_merged_range(r) for r in m.request_history]
+            assert ranges == [
+                whole,
+                [str(today - timedelta(days=31)), str(today - timedelta(days=16))],
+                [str(today - timedelta(days=15)), str(today)],
+            ]
+            assert [node["number"] for node in nodes] == [2, 2]
+
+
+def describe_when_loading_merged_prs_for_an_organization() -> None:
+    def describe_given_the_search_succeeds() -> None:
+        @pytest.fixture
+        def client() -> GitHubClient:
+            client = GitHubClient(ACCESS_TOKEN)
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=_two_pages)
+                assert client.load_organization_merged_prs(OWNER) is True
+            return client
+
+        def it_answers_each_repository_from_memory(client: GitHubClient) -> None:
+            with requests_mock.Mocker() as m:
+                prs = client.get_merged_prs_with_reviews(OWNER, REPO)
+
+                assert m.call_count == 0
+            assert [pr["number"] for pr in prs] == [1, 3]
+            assert prs[0]["reviews"][0] == {
+                "user": "bob",
+                "state": "APPROVED",
+                "submitted_at": prs[0]["reviews"][0]["submitted_at"],
+            }
+
+        def it_reports_no_prs_for_a_quiet_repository(client: GitHubClient) -> None:
+            with requests_mock.Mocker() as m:
+                assert client.get_merged_prs_with_reviews(OWNER, "Ed-Fi-Docs") == []
+
+                assert m.call_count == 0
+
+        def it_scans_the_repository_for_a_longer_window(client: GitHubClient) -> None:
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    text=dumps(
+                        {
+                            "data": {
+                                "repository": {
+                                    "pullRequests": {
+                                        "nodes": [],
+                                        "pageInfo": {
+                                            "hasNextPage": False,
+                                            "endCursor": None,
+                                        },
+                                    }
+                                }
+                            }
+                        }
+                    ),
+                )
+                client.get_merged_prs_with_reviews(OWNER, REPO, since_days=90)
+
+                assert m.call_count == 1
+
+    def describe_given_named_repositories() -> None:
+        @pytest.fixture
+        def client() -> GitHubClient:
+            client = GitHubClient(ACCESS_TOKEN)
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=_two_pages)
+                assert (
+                    client.load_organization_merged_prs(
+                        OWNER, repositories=[REPO, OTHER_REPO]
+                    )
+                    is True
+                )
+            return client
+
+        def it_answers_those_repositories_from_memory(client: GitHubClient) -> None:
+            with requests_mock.Mocker() as m:
+                prs = client.get_merged_prs_with_reviews(OWNER, OTHER_REPO)
+
+                assert m.call_count == 0
+            assert [pr["number"] for pr in prs] == [2]
+
+        def it_scans_any_other_repository(client: GitHubClient) -> None:
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, status_code=HTTPStatus.FORBIDDEN, text="{}")
+                with pytest.raises(RuntimeError):
+                    client.get_merged_prs_with_reviews(OWNER, "Ed-Fi-Docs")
+
+        def it_searches_again_for_the_whole_organization(
+            client: GitHubClient,
+        ) -> None:
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=_two_pages)
+                assert client.load_organization_merged_prs(OWNER) is True
+
+                assert m.call_count == 2
+
+    def describe_given_the_search_fails() -> None:
+        def it_falls_back_to_per_repository_scans() -> None:
+            client = GitHubClient(ACCESS_TOKEN)
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, status_code=HTTPStatus.FORBIDDEN, text="{}")
+
+                assert client.load_organization_merged_prs(OWNER) is False
+                with pytest.raises(RuntimeError):
+                    client.get_merged_prs_with_reviews(OWNER, REPO)
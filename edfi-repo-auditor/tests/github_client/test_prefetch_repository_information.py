@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from json import dumps
+from typing import List
+
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import GRAPHQL_ENDPOINT, GitHubClient
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+MISSING = "Does-Not-Exist"
+
+
+def _information(name: str) -> dict:
+    return {"licenseInfo": {"key": "apache-2.0"}, "hasWikiEnabled": name == "wiki"}
+
+
+def _respond(request, context) -> str:
+    variables = request.json()["variables"]
+    names = {
+        key: value
+        for key, value in variables.items()
+        if key not in ("owner", "includeAlerts")
+    }
+    if "repository" in names:
+        # A single-repository query
+        if names["repository"] == MISSING:
+            return dumps(
+                {"data": {"repository": None}, "errors": [{"type": "NOT_FOUND"}]}
+            )
+        return dumps({"data": {"repository": _information(names["repository"])}})
+
+    if MISSING in names.values():
+        unresolved = {alias: None for alias in names}
+        return dumps({"data": unresolved, "errors": [{"type": "NOT_FOUND"}]})
+
+    data: dict = {alias: _information(name) for alias, name in names.items()}
+    # One rate-limit point per repository
+    data["rateLimit"] = {"cost": len(names)}
+    return dumps({"data": data})
+
+
+def _batch_sizes(m: requests_mock.Mocker) -> List[int]:
+    return [len(r.json()["variables"]) - 2 for r in m.request_history]
+
+
+def describe_when_prefetching_repository_information() -> None:
+    def describe_given_blank_owner() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient(ACCESS_TOKEN).prefetch_repository_information(" ", ["a"])
+
+    def describe_given_a_few_repositories() -> None:
+        def it_sends_a_single_aliased_query() -> None:
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=_respond)
+                result = GitHubClient(ACCESS_TOKEN).prefetch_repository_information(
+                    OWNER, ["ods", "wiki"]
+                )
+
+                assert m.call_count == 1
+                assert m.last_request.json()["variables"] == {
+                    "owner": OWNER,
+                    "includeAlerts": True,
+                    "r0": "ods",
+                    "r1": "wiki",
+                }
+            assert result == {"ods": _information("ods"), "wiki": _information("wiki")}
+
+        def it_answers_later_lookups_without_another_query() -> None:
+            client = GitHubClient(ACCESS_TOKEN)
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=_respond)
+                client.prefetch_repository_information(OWNER, ["ods", "wiki"])
+
+                information = client.get_repository_information(OWNER, "wiki")
+
+                assert m.call_count == 1
+            assert information == _information("wiki")
+
+    def describe_given_many_repositories() -> None:
+        def it_sizes_later_batches_from_the_reported_cost() -> None:
+            repositories = [f"repo-{index}" for index in range(45)]
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=_respond)
+                result = GitHubClient(ACCESS_TOKEN).prefetch_repository_information(
+                    OWNER, repositories
+                )
+
+                # The first batch costs 20 points; later ones target 10.
+                assert _batch_sizes(m) == [20, 10, 10, 5]
+            assert sorted(result) == sorted(repositories)
+
+    def describe_given_a_repository_that_cannot_be_resolved() -> None:
+        def it_fetches_the_others() -> None:
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=_respond)
+                result = GitHubClient(ACCESS_TOKEN).prefetch_repository_information(
+                    OWNER, ["ods", MISSING, "wiki", "admin"]
+                )
+
+            assert sorted(result) == ["admin", "ods", "wiki"]
+
+        def it_leaves_the_failure_to_the_single_lookup() -> None:
+            client = GitHubClient(ACCESS_TOKEN)
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=_respond)
+                client.prefetch_repository_information(OWNER, ["ods", MISSING])
+
+                with pytest.raises(RuntimeError):
+                    client.get_repository_information(OWNER, MISSING)
@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from http import HTTPStatus
+from typing import List
+
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import API_URL, GRAPHQL_ENDPOINT, GitHubClient
+from edfi_repo_auditor.rate_limit import RateLimiter
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+ACTIONS_URL = f"{API_URL}/repos/{OWNER}/{REPO}/actions/workflows"
+
+
+def _client(sleeps: List[float]) -> GitHubClient:
+    client = GitHubClient(ACCESS_TOKEN)
+    client.rate_limiter = RateLimiter(sleep=sleeps.append)
+    return client
+
+
+def describe_when_github_rate_limits_a_call() -> None:
+    def describe_given_a_secondary_limit_with_retry_after() -> None:
+        def it_waits_and_retries() -> None:
+            sleeps: List[float] = []
+            with requests_mock.Mocker() as m:
+                m.get(
+                    ACTIONS_URL,
+                    [
+                        {
+                            "status_code": HTTPStatus.FORBIDDEN,
+                            "headers": {"Retry-After": "7"},
+                            "text": '{"message": "secondary rate limit"}',
+                        },
+                        {"status_code": HTTPStatus.OK, "text": '{"total_count": 0}'},
+                    ],
+                )
+                result = _client(sleeps).get_actions(OWNER, REPO)
+
+            assert result == {"total_count": 0}
+            assert sleeps == [7.0]
+
+    def describe_given_a_graphql_rate_limited_error() -> None:
+        def it_waits_and_retries() -> None:
+            sleeps: List[float] = []
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    [
+                        {
+                            "status_code": HTTPStatus.OK,
+                            "text": '{"errors": [{"type": "RATE_LIMITED"}]}',
+                        },
+                        {
+                            "status_code": HTTPStatus.OK,
+                            "text": '{"data": {"repository": {"name": "x"}}}',
+                        },
+                    ],
+                )
+                result = _client(sleeps).get_repository_information(OWNER, REPO)
+
+            assert result == {"name": "x"}
+            assert sleeps == [60.0]
+
+    def describe_given_a_permissions_error() -> None:
+        def it_raises_without_waiting() -> None:
+            sleeps: List[float] = []
+            with requests_mock.Mocker() as m:
+                m.get(
+                    ACTIONS_URL,
+                    status_code=HTTPStatus.FORBIDDEN,
+                    text='{"message": "Resource not accessible"}',
+                )
+                with pytest.raises(RuntimeError):
+                    _client(sleeps).get_actions(OWNER, REPO)
+
+            assert sleeps == []
+
+    def describe_given_the_limit_never_lifts() -> None:
+        def it_gives_up_and_raises() -> None:
+            sleeps: List[float] = []
+            with requests_mock.Mocker() as m:
+                m.get(
+                    ACTIONS_URL,
+                    status_code=HTTPStatus.TOO_MANY_REQUESTS,
+                    headers={"Retry-After": "1"},
+                    text="{}",
+                )
+                with pytest.raises(RuntimeError):
+                    _client(sleeps).get_actions(OWNER, REPO)
+
+            assert len(sleeps) == 5
+
+
+def describe_when_a_response_reports_the_budget() -> None:
+    def it_tracks_rest_and_graphql_separately() -> None:
+        client = GitHubClient(ACCESS_TOKEN)
+        with requests_mock.Mocker() as m:
+            m.get(
+                ACTIONS_URL,
+                headers={
+                    "X-RateLimit-Limit": "5000",
+                    "X-RateLimit-Remaining": "4999",
+                    "X-RateLimit-Reset": "9999999999",
+                    "X-RateLimit-Resource": "core",
+                },
+                text='{"total_count": 0}',
+            )
+            m.post(
+                GRAPHQL_ENDPOINT,
+                headers={
+                    "X-RateLimit-Limit": "5000",
+                    "X-RateLimit-Remaining": "4990",
+                    "X-RateLimit-Reset": "9999999999",
+                    "X-RateLimit-Resource": "graphql",
+                },
+                text='{"data": {"repository": {}}}',
+            )
+            client.get_actions(OWNER, REPO)
+            client.get_repository_information(OWNER, REPO)
+
+        summary = client.rate_limiter.summary()
+        assert summary["core"]["remaining"] == 4999
+        assert summary["graphql"]["remaining"] == 4990
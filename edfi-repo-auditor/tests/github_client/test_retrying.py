@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from http import HTTPStatus
+from json import dumps
+from typing import List
+
+import pytest
+import requests
+import requests_mock
+
+from edfi_repo_auditor.github_client import (
+    API_URL,
+    GRAPHQL_ENDPOINT,
+    GitHubClient,
+    _is_transient_failure,
+)
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+ACTIONS_URL = f"{API_URL}/repos/{OWNER}/{REPO}/actions/workflows"
+GRAPHQL_TIMEOUT = (
+    '{"data": null, "errors": [{"message": "Something went wrong while executing '
+    'your query. This may be the result of a timeout."}]}'
+)
+
+
+def describe_when_github_fails_transiently() -> None:
+    def describe_given_a_bad_gateway_on_a_rest_read() -> None:
+        def it_retries_after_a_backoff(retry_sleeps: List[float]) -> None:
+            client = GitHubClient(ACCESS_TOKEN)
+            with requests_mock.Mocker() as m:
+                m.get(
+                    ACTIONS_URL,
+                    [
+                        {"status_code": HTTPStatus.BAD_GATEWAY, "text": ""},
+                        {"status_code": HTTPStatus.OK, "text": '{"total_count": 0}'},
+                    ],
+                )
+                result = client.get_actions(OWNER, REPO)
+
+            assert result == {"total_count": 0}
+            assert len(retry_sleeps) == 1
+            assert client.retrier.summary()["core"] == 1
+
+    def describe_given_a_dropped_connection() -> None:
+        def it_retries() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(
+                    ACTIONS_URL,
+                    [
+                        {"exc": requests.ConnectionError},
+                        {"status_code": HTTPStatus.OK, "text": '{"total_count": 0}'},
+                    ],
+                )
+                result = GitHubClient(ACCESS_TOKEN).get_actions(OWNER, REPO)
+
+            assert result == {"total_count": 0}
+
+    def describe_given_a_graphql_query_times_out() -> None:
+        def it_retries() -> None:
+            client = GitHubClient(ACCESS_TOKEN)
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    [
+                        {"status_code": HTTPStatus.OK, "text": GRAPHQL_TIMEOUT},
+                        {
+                            "status_code": HTTPStatus.OK,
+                            "text": '{"data": {"repository": {"name": "x"}}}',
+                        },
+                    ],
+                )
+                result = client.get_repository_information(OWNER, REPO)
+
+            assert result == {"name": "x"}
+            assert client.retrier.summary()["graphql"] == 1
+
+    def describe_given_workflow_file_text_mentioning_the_timeout_phrase() -> None:
+        def it_does_not_retry(retry_sleeps: List[float]) -> None:
+            client = GitHubClient(ACCESS_TOKEN)
+            blob = {
+                "isBinary": False,
+                "isTruncated": False,
+                "text": 'run: echo "Something went wrong while executing your query"',
+            }
+            body = {
+                "data": {
+                    "repository": {
+                        "object": {
+                            "entries": [
+                                {
+                                    "name": "ci.yml",
+                                    "path": ".github/workflows/ci.yml",
+                                    "type": "blob",
+                                    "object": blob,
+                                }
+                            ]
+                        }
+                    }
+                }
+            }
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, text=dumps(body))
+                result = client.get_workflow_files(OWNER, REPO)
+
+                assert m.call_count == 1
+
+            assert result == {".github/workflows/ci.yml": blob["text"]}
+            assert retry_sleeps == []
+            assert client.retrier.summary().get("graphql", 0) == 0
+
+    def describe_given_a_graphql_mutation() -> None:
+        def it_does_not_retry() -> None:
+            with requests_mock.Mocker() as m:
+                m.post(GRAPHQL_ENDPOINT, status_code=HTTPStatus.BAD_GATEWAY, text="")
+                with pytest.raises(RuntimeError):
+                    GitHubClient(ACCESS_TOKEN)._execute_graphql(
+                        "a mutation",
+                        "mutation { addStar(input: {}) { clientMutationId } }",
+                    )
+
+                assert m.call_count == 1
+
+    def describe_given_the_failure_persists() -> None:
+        def it_gives_up_after_the_policy_limit() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(ACTIONS_URL, status_code=HTTPStatus.SERVICE_UNAVAILABLE, text="")
+                with pytest.raises(RuntimeError):
+                    GitHubClient(ACCESS_TOKEN).get_actions(OWNER, REPO)
+
+                assert m.call_count == 4
+
+    def describe_given_a_client_error() -> None:
+        def it_does_not_retry() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(ACTIONS_URL, status_code=HTTPStatus.NOT_FOUND, text="")
+                with pytest.raises(RuntimeError):
+                    GitHubClient(ACCESS_TOKEN).get_actions(OWNER, REPO)
+
+                assert m.call_count == 1
+
+
+def describe_when_checking_a_graphql_response_for_a_timeout() -> None:
+    def it_does_not_decode_a_body_without_the_timeout_message(
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        response = requests.Response()
+        response.status_code = HTTPStatus.OK
+        response._content = b'{"data": {"repository": {"name": "x"}}}'
+
+        def fail() -> None:
+            raise AssertionError("decoded")
+
+        monkeypatch.setattr(response, "json", fail)
+
+        assert _is_transient_failure("graphql", response) is False
+
+    def it_recognizes_the_timeout_error() -> None:
+        response = requests.Response()
+        response.status_code = HTTPStatus.OK
+        response._content = GRAPHQL_TIMEOUT.encode()
+
+        assert _is_transient_failure("graphql", response) is True
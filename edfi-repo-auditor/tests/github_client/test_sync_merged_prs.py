@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from pathlib import Path
+from typing import List
+
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import GitHubClient, GRAPHQL_ENDPOINT
+from edfi_repo_auditor.state_store import PULL_REQUESTS, StateStore
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+
+
+def _days_ago(days: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+
+
+def _node(number: int, merged_days: int, updated_days: int, reviews: int = 0) -> dict:
+    return {
+        "number": number,
+        "updatedAt": _days_ago(updated_days),
+        "createdAt": _days_ago(merged_days + 1),
+        "mergedAt": _days_ago(merged_days),
+        "closedAt": _days_ago(merged_days),
+        "author": {"login": "alice"},
+        "additions": 10,
+        "deletions": 5,
+        "changedFiles": 2,
+        "reviews": {
+            "pageInfo": {"hasNextPage": False},
+            "nodes": [
+                {
+                    "author": {"login": f"reviewer{index}"},
+                    "state": "APPROVED",
+                    "submittedAt": _days_ago(updated_days),
+                }
+                for index in range(reviews)
+            ],
+        },
+    }
+
+
+def _page(nodes: List[dict], has_next_page: bool = False) -> dict:
+    return {
+        "json": {
+            "data": {
+                "repository": {
+                    "pullRequests": {
+                        "nodes": nodes,
+                        "pageInfo": {
+                            "hasNextPage": has_next_page,
+                            "endCursor": "next" if has_next_page else None,
+                        },
+                    }
+                }
+            }
+        },
+        "status_code": HTTPStatus.OK,
+    }
+
+
+def _sync(state_db: str, pages: List[dict]) -> dict:
+    client = GitHubClient(ACCESS_TOKEN, state_db=state_db)
+    try:
+        with requests_mock.Mocker() as m:
+            m.register_uri("POST", GRAPHQL_ENDPOINT, pages)
+            results = client.get_merged_prs_with_reviews(OWNER, REPO)
+            return {"results": results, "queries": m.call_count}
+    finally:
+        client.close()
+
+
+def describe_when_syncing_merged_prs_into_a_state_store() -> None:
+    @pytest.fixture
+    def state_db(tmp_path: Path) -> str:
+        return str(tmp_path / "audit.db")
+
+    @pytest.fixture
+    def first(state_db: str) -> dict:
+        return _sync(
+            state_db,
+            [_page([_node(2, merged_days=2, updated_days=2), _node(1, 10, 10)])],
+        )
+
+    def describe_given_no_earlier_sync() -> None:
+        def it_returns_every_merged_pr(first: dict) -> None:
+            assert [pr["number"] for pr in first["results"]] == [2, 1]
+
+        def it_sets_the_watermark_to_the_newest_merge(
+            state_db: str, first: dict
+        ) -> None:
+            state = StateStore(state_db).get_sync_state(OWNER, REPO, PULL_REQUESTS)
+
+            assert state is not None
+            assert state.watermark == first["results"][0]["merged_at"]
+
+    def describe_given_an_earlier_sync() -> None:
+        @pytest.fixture
+        def second(state_db: str, first: dict) -> dict:
+            return _sync(
+                state_db,
+                [
+                    _page(
+                        [
+                            _node(3, merged_days=1, updated_days=1),
+                            _node(2, merged_days=2, updated_days=0, reviews=1),
+                        ],
+                        has_next_page=True,
+                    ),
+                    _page([_node(1, 10, 10)], has_next_page=True),
+                    _page([]),
+                ],
+            )
+
+        def it_stops_at_the_first_page_updated_before_the_watermark(
+            second: dict,
+        ) -> None:
+            assert second["queries"] == 2
+
+        def it_merges_new_prs_with_stored_ones(second: dict) -> None:
+            assert [pr["number"] for pr in second["results"]] == [3, 2, 1]
+
+        def it_refreshes_the_reviews_of_prs_updated_since(second: dict) -> None:
+            assert [len(pr["reviews"]) for pr in second["results"]] == [0, 1, 0]
+
+    def describe_given_an_organization_load() -> None:
+        def it_leaves_each_repository_to_its_own_sync(state_db: str) -> None:
+            client = GitHubClient(ACCESS_TOKEN, state_db=state_db)
+            try:
+                with requests_mock.Mocker() as m:
+                    assert client.load_organization_merged_prs(OWNER) is False
+                    assert m.call_count == 0
+            finally:
+                client.close()
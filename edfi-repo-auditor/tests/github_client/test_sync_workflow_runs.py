@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from datetime import datetime, timedelta, timezone
+from json import dumps
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import GitHubClient, API_URL
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+RUNS_URL = f"{API_URL}/repos/{OWNER}/{REPO}/actions/runs"
+
+
+def _days_ago(days: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+
+
+def _run(id: int, days: int, status: str = "completed") -> dict:
+    return {
+        "id": id,
+        "name": "CI",
+        "status": status,
+        "conclusion": "success" if status == "completed" else None,
+        "created_at": _days_ago(days),
+        "path": ".github/workflows/ci.yml",
+    }
+
+
+def _sync(
+    state_db: str, runs: List[dict], since_days: int = 30
+) -> Tuple[list, Optional[str]]:
+    requested = {}
+
+    def respond(request, context) -> str:
+        requested["created"] = parse_qs(urlparse(request.url).query)["created"][0]
+        return dumps({"total_count": len(runs), "workflow_runs": runs})
+
+    client = GitHubClient(ACCESS_TOKEN, state_db=state_db)
+    try:
+        with requests_mock.Mocker() as m:
+            m.get(RUNS_URL, text=respond)
+            results = client.get_workflow_runs(OWNER, REPO, since_days=since_days)
+    finally:
+        client.close()
+    return results, requested.get("created")
+
+
+def describe_when_syncing_workflow_runs_into_a_state_store() -> None:
+    @pytest.fixture
+    def state_db(tmp_path: Path) -> str:
+        return str(tmp_path / "audit.db")
+
+    @pytest.fixture
+    def first(state_db: str) -> tuple:
+        return _sync(
+            state_db,
+            [_run(3, 1), _run(2, 3, status="in_progress"), _run(1, 10)],
+        )
+
+    def describe_given_no_earlier_sync() -> None:
+        def it_fetches_the_whole_window(first: tuple) -> None:
+            cutoff = (datetime.now(timezone.utc) - timedelta(days=30)).strftime(
+                "%Y-%m-%d"
+            )
+            assert first[1] == f">={cutoff}"
+
+        def it_returns_every_run_newest_first(first: tuple) -> None:
+            assert [run["id"] for run in first[0]] == [3, 2, 1]
+
+    def describe_given_an_earlier_sync() -> None:
+        @pytest.fixture
+        def second(state_db: str, first: tuple) -> tuple:
+            finished = {**_run(2, 3), "created_at": first[0][1]["created_at"]}
+            finished["conclusion"] = "failure"
+            return _sync(state_db, [_run(4, 0), _run(3, 1), finished])
+
+        def it_resumes_from_the_oldest_unfinished_run(
+            first: tuple, second: tuple
+        ) -> None:
+            assert second[1] == f">={first[0][1]['created_at']}"
+
+        def it_merges_new_runs_with_stored_ones(second: tuple) -> None:
+            assert [run["id"] for run in second[0]] == [4, 3, 2, 1]
+
+        def it_updates_runs_that_have_since_finished(second: tuple) -> None:
+            assert second[0][2]["status"] == "completed"
+            assert second[0][2]["conclusion"] == "failure"
+
+    def describe_given_a_window_wider_than_the_stored_one() -> None:
+        def it_fetches_the_whole_window(state_db: str, first: tuple) -> None:
+            _, created = _sync(state_db, [], since_days=60)
+
+            cutoff = (datetime.now(timezone.utc) - timedelta(days=60)).strftime(
+                "%Y-%m-%d"
+            )
+            assert created == f">={cutoff}"
+
+    def describe_given_every_stored_run_completed() -> None:
+        def it_resumes_from_the_watermark(state_db: str) -> None:
+            stored, _ = _sync(state_db, [_run(2, 2), _run(1, 5)])
+            # A sync that finds nothing new keeps the watermark.
+            _sync(state_db, [])
+
+            _, created = _sync(state_db, [])
+
+            assert created == f">={stored[0]['created_at']}"
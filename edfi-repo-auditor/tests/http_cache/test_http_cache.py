@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from pathlib import Path
+
+import pytest
+
+from edfi_repo_auditor.http_cache import CachedResponse, HttpCache
+
+URL = "https://api.github.com/repos/Ed-Fi-Alliance-OSS/Ed-Fi-ODS/actions/workflows"
+
+
+def describe_when_creating_a_cache() -> None:
+    def it_rejects_a_blank_directory() -> None:
+        with pytest.raises(ValueError):
+            HttpCache("  ")
+
+
+def describe_when_storing_a_response() -> None:
+    def describe_given_an_etag() -> None:
+        def it_can_be_read_back(tmp_path: Path) -> None:
+            HttpCache(str(tmp_path)).put(URL, '{"a": 1}', etag='W/"abc"')
+
+            assert HttpCache(str(tmp_path)).get(URL) == CachedResponse(
+                url=URL, body='{"a": 1}', etag='W/"abc"'
+            )
+
+    def describe_given_no_validator() -> None:
+        def it_is_not_stored(tmp_path: Path) -> None:
+            cache = HttpCache(str(tmp_path))
+
+            cache.put(URL, '{"a": 1}')
+
+            assert cache.get(URL) is None
+            assert cache.summary()["stores"] == 0
+
+
+def describe_when_reading_a_response() -> None:
+    def describe_given_nothing_was_stored() -> None:
+        def it_returns_none(tmp_path: Path) -> None:
+            assert HttpCache(str(tmp_path)).get(URL) is None
+
+    def describe_given_a_corrupt_entry() -> None:
+        def it_returns_none(tmp_path: Path) -> None:
+            cache = HttpCache(str(tmp_path))
+            cache.put(URL, "{}", etag='"abc"')
+            for entry in tmp_path.rglob("*.json"):
+                entry.write_text("{not json")
+
+            assert cache.get(URL) is None
+
+
+def describe_when_building_conditional_headers() -> None:
+    def it_sends_both_validators() -> None:
+        cached = CachedResponse(
+            url=URL,
+            body="{}",
+            etag='"abc"',
+            last_modified="Tue, 01 Oct 2024 00:00:00 GMT",
+        )
+
+        assert cached.conditional_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Tue, 01 Oct 2024 00:00:00 GMT",
+        }
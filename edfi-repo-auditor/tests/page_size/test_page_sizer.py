@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import pytest
+
+from edfi_repo_auditor.page_size import PageSizeLimits, PageSizer
+
+SHAPE = "pull_requests"
+
+
+@pytest.fixture
+def sizer() -> PageSizer:
+    return PageSizer(
+        {SHAPE: PageSizeLimits(initial=20, minimum=5, maximum=100)},
+        target_cost=10,
+        slow_seconds=5.0,
+        fast_seconds=2.0,
+    )
+
+
+def describe_when_creating_a_page_sizer() -> None:
+    def it_starts_at_the_initial_size(sizer: PageSizer) -> None:
+        assert sizer.size(SHAPE) == 20
+
+    def it_rejects_an_initial_size_outside_the_bounds() -> None:
+        with pytest.raises(ValueError):
+            PageSizer({SHAPE: PageSizeLimits(initial=200, minimum=5, maximum=100)})
+
+
+def describe_when_recording_a_page() -> None:
+    def describe_given_a_fast_full_page() -> None:
+        def it_doubles_the_size(sizer: PageSizer) -> None:
+            assert sizer.record(SHAPE, 20, cost=1, seconds=0.5, full=True) == 40
+            assert sizer.size(SHAPE) == 40
+
+        def it_stops_at_the_maximum(sizer: PageSizer) -> None:
+            sizer.record(SHAPE, 80, cost=1, seconds=0.5, full=True)
+
+            assert sizer.size(SHAPE) == 100
+
+    def describe_given_the_last_page() -> None:
+        def it_keeps_the_size(sizer: PageSizer) -> None:
+            assert sizer.record(SHAPE, 20, cost=1, seconds=0.5, full=False) == 20
+
+    def describe_given_a_full_page_of_moderate_latency() -> None:
+        def it_keeps_the_size(sizer: PageSizer) -> None:
+            assert sizer.record(SHAPE, 20, cost=1, seconds=3.0, full=True) == 20
+
+    def describe_given_a_slow_page() -> None:
+        def it_halves_the_size(sizer: PageSizer) -> None:
+            assert sizer.record(SHAPE, 20, cost=1, seconds=6.0, full=True) == 10
+
+        def it_stops_at_the_minimum(sizer: PageSizer) -> None:
+            assert sizer.record(SHAPE, 6, cost=1, seconds=6.0, full=True) == 5
+
+    def describe_given_an_expensive_page() -> None:
+        def it_scales_the_size_to_the_target_cost(sizer: PageSizer) -> None:
+            assert sizer.record(SHAPE, 40, cost=20, seconds=0.5, full=True) == 20
+
+    def describe_given_no_reported_cost() -> None:
+        def it_uses_latency_alone(sizer: PageSizer) -> None:
+            assert sizer.record(SHAPE, 20, cost=None, seconds=0.5, full=True) == 40
+
+
+def describe_when_a_page_times_out() -> None:
+    def it_halves_the_size(sizer: PageSizer) -> None:
+        assert sizer.record_timeout(SHAPE, 20) == 10
+        assert sizer.size(SHAPE) == 10
+
+    def it_stops_at_the_minimum(sizer: PageSizer) -> None:
+        assert sizer.record_timeout(SHAPE, 6) == 5
+        assert sizer.minimum(SHAPE) == 5
+
+    def it_counts_the_timeout(sizer: PageSizer) -> None:
+        sizer.record_timeout(SHAPE, 20)
+
+        assert sizer.summary()[SHAPE]["timeouts"] == 1
+
+
+def describe_when_summarizing() -> None:
+    def it_reports_the_averages_per_shape(sizer: PageSizer) -> None:
+        sizer.record(SHAPE, 20, cost=1, seconds=1.0, full=True)
+        sizer.record(SHAPE, 40, cost=3, seconds=3.0, full=False)
+
+        assert sizer.summary() == {
+            SHAPE: {
+                "size": 40,
+                "queries": 2,
+                "average_cost": 2.0,
+                "average_seconds": 2.0,
+                "changes": 1,
+                "timeouts": 0,
+            }
+        }
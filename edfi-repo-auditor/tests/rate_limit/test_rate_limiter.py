@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from typing import Dict, List
+
+import pytest
+
+from edfi_repo_auditor.rate_limit import RateLimiter, resource_for_url
+
+NOW = 1_700_000_000.0
+
+
+def _headers(
+    remaining: int, limit: int = 5000, reset: float = NOW + 600
+) -> Dict[str, str]:
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(reset)),
+        "X-RateLimit-Used": str(limit - remaining),
+    }
+
+
+@pytest.fixture
+def sleeps() -> List[float]:
+    return []
+
+
+@pytest.fixture
+def limiter(sleeps: List[float]) -> RateLimiter:
+    return RateLimiter(reserve=20, sleep=sleeps.append, clock=lambda: NOW)
+
+
+def describe_when_classifying_urls() -> None:
+    def it_charges_graphql_to_the_graphql_budget() -> None:
+        assert resource_for_url("https://api.github.com/graphql") == "graphql"
+
+    def it_charges_search_to_the_search_budget() -> None:
+        assert resource_for_url("https://api.github.com/search/issues?q=x") == "search"
+
+    def it_charges_everything_else_to_the_core_budget() -> None:
+        assert resource_for_url("https://api.github.com/repos/o/r") == "core"
+
+
+def describe_when_scheduling_a_request() -> None:
+    def describe_given_no_budget_reported_yet() -> None:
+        def it_does_not_wait(limiter: RateLimiter, sleeps: List[float]) -> None:
+            limiter.before_request("core")
+            assert sleeps == []
+
+    def describe_given_plenty_of_budget() -> None:
+        def it_does_not_wait(limiter: RateLimiter, sleeps: List[float]) -> None:
+            limiter.update("core", _headers(4000))
+            limiter.before_request("core")
+            assert sleeps == []
+
+    def describe_given_the_budget_is_running_low() -> None:
+        def it_spaces_requests_until_the_reset(
+            limiter: RateLimiter, sleeps: List[float]
+        ) -> None:
+            limiter.update("core", _headers(120))
+
+            limiter.before_request("core")
+            limiter.before_request("core")
+
+            # 601s until reset spread over 100 usable requests
+            assert sleeps == [pytest.approx(6.01)]
+
+    def describe_given_the_budget_is_nearly_exhausted() -> None:
+        def it_waits_for_the_reset(limiter: RateLimiter, sleeps: List[float]) -> None:
+            limiter.update("graphql", _headers(10))
+
+            limiter.before_request("graphql")
+
+            assert sleeps == [pytest.approx(601)]
+
+        def it_does_not_slow_other_budgets(
+            limiter: RateLimiter, sleeps: List[float]
+        ) -> None:
+            limiter.update("graphql", _headers(10))
+
+            limiter.before_request("core")
+
+            assert sleeps == []
+
+    def describe_given_the_reset_has_passed() -> None:
+        def it_does_not_wait(limiter: RateLimiter, sleeps: List[float]) -> None:
+            limiter.update("core", _headers(0, reset=NOW - 1))
+
+            limiter.before_request("core")
+
+            assert sleeps == []
+
+
+def describe_when_checking_for_throttling() -> None:
+    def it_honours_retry_after(limiter: RateLimiter) -> None:
+        assert limiter.throttle_delay("core", 403, {"Retry-After": "30"}) == 30
+
+    def it_waits_for_the_reset_when_the_budget_is_spent(limiter: RateLimiter) -> None:
+        delay = limiter.throttle_delay("core", 403, _headers(0, reset=NOW + 100))
+        assert delay == pytest.approx(101)
+
+    def it_backs_off_on_a_secondary_limit_without_retry_after(
+        limiter: RateLimiter,
+    ) -> None:
+        delay = limiter.throttle_delay(
+            "core", 403, {}, '{"message": "You have exceeded a secondary rate limit"}'
+        )
+        assert delay == 60
+
+    def it_ignores_a_permissions_403(limiter: RateLimiter) -> None:
+        assert (
+            limiter.throttle_delay("core", 403, {}, '{"message": "Forbidden"}') is None
+        )
+
+    def it_ignores_successful_responses(limiter: RateLimiter) -> None:
+        assert limiter.throttle_delay("core", 200, {"Retry-After": "30"}) is None
+
+
+def describe_when_summarizing() -> None:
+    def it_reports_each_budget_separately(limiter: RateLimiter) -> None:
+        limiter.before_request("core")
+        limiter.update("core", _headers(4990))
+        limiter.before_request("graphql")
+        limiter.update("graphql", _headers(4900))
+        limiter.throttle_delay("graphql", 429, {"Retry-After": "1"})
+
+        summary = limiter.summary()
+
+        assert summary["core"]["requests"] == 1
+        assert summary["core"]["consumed"] == 10
+        assert summary["graphql"]["consumed"] == 100
+        assert summary["graphql"]["throttled"] == 1
+
+    def it_adds_consumption_across_reset_windows(limiter: RateLimiter) -> None:
+        limiter.update("core", _headers(4000, reset=NOW - 10))
+        limiter.update("core", _headers(4900, reset=NOW + 600))
+
+        assert limiter.summary()["core"]["consumed"] == 1100
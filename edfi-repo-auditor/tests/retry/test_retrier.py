@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from json import dumps
+from typing import List
+
+import pytest
+
+from edfi_repo_auditor.retry import Retrier, RetryPolicy, is_idempotent
+
+POLICIES = {"core": RetryPolicy(max_retries=3, base_delay=1.0, max_delay=5.0)}
+
+
+@pytest.fixture
+def sleeps() -> List[float]:
+    return []
+
+
+def describe_when_checking_idempotency() -> None:
+    def it_allows_get() -> None:
+        assert is_idempotent("GET")
+
+    def it_allows_a_graphql_query() -> None:
+        assert is_idempotent("POST", dumps({"query": "query($a: String!) { x }"}))
+
+    def it_allows_a_graphql_shorthand_query() -> None:
+        assert is_idempotent("POST", dumps({"query": "{ viewer { login } }"}))
+
+    def it_refuses_a_graphql_mutation() -> None:
+        assert not is_idempotent("POST", dumps({"query": "  mutation { x }"}))
+
+    def it_refuses_other_writes() -> None:
+        assert not is_idempotent("PUT", dumps({"query": "{ x }"}))
+        assert not is_idempotent("POST", "not json")
+
+
+def describe_when_computing_backoff() -> None:
+    def it_doubles_the_ceiling_each_attempt() -> None:
+        retrier = Retrier(policies=POLICIES, random_fraction=lambda: 1.0)
+
+        assert [retrier.backoff("core", n) for n in range(3)] == [1.0, 2.0, 4.0]
+
+    def it_caps_the_ceiling() -> None:
+        retrier = Retrier(policies=POLICIES, random_fraction=lambda: 1.0)
+
+        assert retrier.backoff("core", 10) == 5.0
+
+    def it_applies_jitter() -> None:
+        retrier = Retrier(policies=POLICIES, random_fraction=lambda: 0.25)
+
+        assert retrier.backoff("core", 2) == 1.0
+
+    def it_uses_the_core_policy_for_unknown_resources() -> None:
+        retrier = Retrier(policies=POLICIES, random_fraction=lambda: 1.0)
+
+        assert retrier.backoff("code_search", 0) == 1.0
+
+
+def describe_when_retrying() -> None:
+    def it_waits_before_each_retry(sleeps: List[float]) -> None:
+        retrier = Retrier(
+            policies=POLICIES, sleep=sleeps.append, random_fraction=lambda: 1.0
+        )
+
+        assert retrier.retry("core", 0, "HTTP 502")
+        assert retrier.retry("core", 1, "HTTP 502")
+
+        assert sleeps == [1.0, 2.0]
+
+    def it_stops_after_the_policy_limit(sleeps: List[float]) -> None:
+        retrier = Retrier(policies=POLICIES, sleep=sleeps.append)
+
+        assert not retrier.retry("core", 3, "HTTP 502")
+        assert sleeps == []
+
+    def describe_given_the_budget_is_spent() -> None:
+        def it_refuses_further_retries(sleeps: List[float]) -> None:
+            retrier = Retrier(budget=2, policies=POLICIES, sleep=sleeps.append)
+
+            results = [retrier.retry("core", 0, "HTTP 502") for _ in range(3)]
+
+            assert results == [True, True, False]
+            assert retrier.summary() == {"core": 2, "total": 2, "refused": 1}
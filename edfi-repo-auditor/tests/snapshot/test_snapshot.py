@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import gzip
+from datetime import datetime, timezone
+from json import loads
+from pathlib import Path
+
+import pytest
+
+from edfi_repo_auditor.snapshot import read_snapshot, write_snapshot
+
+OWNER = "Ed-Fi-Alliance-OSS"
+COLLECTED_AT = datetime(2024, 1, 31, 12, 0, tzinfo=timezone.utc)
+
+
+def describe_when_writing_a_snapshot() -> None:
+    @pytest.fixture
+    def directory(tmp_path: Path) -> Path:
+        write_snapshot(
+            str(tmp_path),
+            OWNER,
+            COLLECTED_AT,
+            {
+                "Ed-Fi-ODS": {
+                    "actions": {"total_count": 0, "workflows": []},
+                    "root_files": ["LICENSE"],
+                },
+                "Ed-Fi-Admin": {"actions": {"total_count": 1, "workflows": []}},
+            },
+            windows={"merged_prs": 30},
+        )
+        return tmp_path
+
+    def it_writes_one_compressed_line_per_repository(directory: Path) -> None:
+        with gzip.open(directory / "actions.jsonl.gz", "rt") as file:
+            lines = [loads(line) for line in file]
+
+        assert [line["repository"] for line in lines] == ["Ed-Fi-ODS", "Ed-Fi-Admin"]
+
+    def it_reads_back_the_collected_data(directory: Path) -> None:
+        snapshot = read_snapshot(str(directory))
+
+        assert snapshot.organization == OWNER
+        assert snapshot.collected_at == COLLECTED_AT
+        assert snapshot.repositories == ["Ed-Fi-ODS", "Ed-Fi-Admin"]
+        assert snapshot.get("root_files", "Ed-Fi-ODS") == ["LICENSE"]
+
+    def it_records_the_collection_windows(directory: Path) -> None:
+        snapshot = read_snapshot(str(directory))
+
+        assert snapshot.windows == {"merged_prs": 30}
+
+    def it_tells_missing_entities_apart(directory: Path) -> None:
+        snapshot = read_snapshot(str(directory))
+
+        assert snapshot.has("root_files", "Ed-Fi-ODS")
+        assert not snapshot.has("root_files", "Ed-Fi-Admin")
+        assert snapshot.get("root_files", "Ed-Fi-Admin") is None
+
+    def it_replaces_an_earlier_snapshot(directory: Path) -> None:
+        write_snapshot(str(directory), OWNER, COLLECTED_AT, {"Ed-Fi-ODS": {}})
+
+        snapshot = read_snapshot(str(directory))
+
+        assert snapshot.repositories == ["Ed-Fi-ODS"]
+        assert not snapshot.has("actions", "Ed-Fi-Admin")
+        assert snapshot.windows == {}
+
+
+def describe_when_reading_a_snapshot() -> None:
+    def describe_given_no_snapshot() -> None:
+        def it_raises_a_ValueError(tmp_path: Path) -> None:
+            with pytest.raises(ValueError):
+                read_snapshot(str(tmp_path))
+
+    def describe_given_an_unknown_format() -> None:
+        def it_raises_a_ValueError(tmp_path: Path) -> None:
+            (tmp_path / "manifest.json").write_text('{"format": 99}')
+
+            with pytest.raises(ValueError):
+                read_snapshot(str(tmp_path))
@@ -0,0 +1,218 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from pathlib import Path
+
+import pytest
+
+from edfi_repo_auditor.state_store import (
+    PULL_REQUESTS,
+    WORKFLOW_RUNS,
+    StateStore,
+    SyncState,
+)
+
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+
+
+def _run(id: int, created_at: str, status: str = "completed") -> dict:
+    return {
+        "id": id,
+        "name": "CI",
+        "status": status,
+        "conclusion": "success" if status == "completed" else None,
+        "created_at": created_at,
+        "path": ".github/workflows/ci.yml",
+    }
+
+
+def _pull_request(number: int, merged_at: str, reviewers: int = 1) -> dict:
+    return {
+        "number": number,
+        "created_at": "2024-01-01T08:00:00Z",
+        "closed_at": merged_at,
+        "merged_at": merged_at,
+        "user": "alice",
+        "additions": 10,
+        "deletions": 5,
+        "changed_files": 2,
+        "reviews": [
+            {
+                "user": f"reviewer{index}",
+                "state": "APPROVED",
+                "submitted_at": merged_at,
+            }
+            for index in range(reviewers)
+        ],
+    }
+
+
+def describe_when_creating_a_store() -> None:
+    def it_rejects_a_blank_path() -> None:
+        with pytest.raises(ValueError):
+            StateStore("  ")
+
+    def it_creates_the_parent_directory(tmp_path: Path) -> None:
+        path = tmp_path / "state" / "audit.db"
+
+        StateStore(str(path)).close()
+
+        assert path.exists()
+
+
+def describe_when_recording_workflow_runs() -> None:
+    @pytest.fixture
+    def store(tmp_path: Path) -> StateStore:
+        store = StateStore(str(tmp_path / "audit.db"))
+        store.record_workflow_runs(
+            OWNER,
+            REPO,
+            [_run(1, "2024-01-01T10:00:00Z"), _run(2, "2024-01-02T10:00:00Z")],
+            covered_from="2024-01-01T00:00:00Z",
+            watermark="2024-01-02T10:00:00Z",
+        )
+        return store
+
+    def it_keeps_the_runs_after_reopening(store: StateStore) -> None:
+        store.close()
+        reopened = StateStore(store.path)
+
+        runs = reopened.get_workflow_runs(OWNER, REPO, "2024-01-01T00:00:00Z")
+
+        assert [run["id"] for run in runs] == [2, 1]
+        assert runs[1] == _run(1, "2024-01-01T10:00:00Z")
+
+    def it_records_the_sync_state(store: StateStore) -> None:
+        assert store.get_sync_state(OWNER, REPO, WORKFLOW_RUNS) == SyncState(
+            covered_from="2024-01-01T00:00:00Z", watermark="2024-01-02T10:00:00Z"
+        )
+
+    def it_replaces_a_run_with_the_same_id(store: StateStore) -> None:
+        store.record_workflow_runs(
+            OWNER,
+            REPO,
+            [{**_run(2, "2024-01-02T10:00:00Z"), "conclusion": "failure"}],
+            covered_from="2024-01-01T00:00:00Z",
+            watermark="2024-01-02T10:00:00Z",
+        )
+
+        runs = store.get_workflow_runs(OWNER, REPO, "2024-01-01T00:00:00Z")
+
+        assert [(run["id"], run["conclusion"]) for run in runs] == [
+            (2, "failure"),
+            (1, "success"),
+        ]
+
+    def it_prunes_runs_before_the_covered_period(store: StateStore) -> None:
+        store.record_workflow_runs(
+            OWNER,
+            REPO,
+            [],
+            covered_from="2024-01-02T00:00:00Z",
+            watermark="2024-01-02T10:00:00Z",
+        )
+
+        runs = store.get_workflow_runs(OWNER, REPO, "2023-12-01T00:00:00Z")
+
+        assert [run["id"] for run in runs] == [2]
+
+    def it_keeps_repositories_apart(store: StateStore) -> None:
+        assert store.get_workflow_runs(OWNER, "other", "2024-01-01T00:00:00Z") == []
+        assert store.get_sync_state(OWNER, "other", WORKFLOW_RUNS) is None
+
+    def it_counts_the_sync(store: StateStore) -> None:
+        assert store.summary() == {WORKFLOW_RUNS: {"syncs": 1, "fetched": 2}}
+
+
+def describe_when_finding_the_earliest_unfinished_run() -> None:
+    def describe_given_every_run_completed() -> None:
+        def it_returns_none(tmp_path: Path) -> None:
+            store = StateStore(str(tmp_path / "audit.db"))
+            store.record_workflow_runs(
+                OWNER,
+                REPO,
+                [_run(1, "2024-01-01T10:00:00Z")],
+                covered_from="2024-01-01T00:00:00Z",
+                watermark="2024-01-01T10:00:00Z",
+            )
+
+            assert store.earliest_unfinished_run(OWNER, REPO) is None
+
+    def describe_given_runs_in_progress() -> None:
+        def it_returns_the_oldest_creation_time(tmp_path: Path) -> None:
+            store = StateStore(str(tmp_path / "audit.db"))
+            store.record_workflow_runs(
+                OWNER,
+                REPO,
+                [
+                    _run(1, "2024-01-01T10:00:00Z"),
+                    _run(2, "2024-01-02T10:00:00Z", status="in_progress"),
+                    _run(3, "2024-01-03T10:00:00Z", status="queued"),
+                ],
+                covered_from="2024-01-01T00:00:00Z",
+                watermark="2024-01-03T10:00:00Z",
+            )
+
+            assert store.earliest_unfinished_run(OWNER, REPO) == "2024-01-02T10:00:00Z"
+
+
+def describe_when_recording_pull_requests() -> None:
+    @pytest.fixture
+    def store(tmp_path: Path) -> StateStore:
+        store = StateStore(str(tmp_path / "audit.db"))
+        store.record_pull_requests(
+            OWNER,
+            REPO,
+            [
+                _pull_request(1, "2024-01-01T10:00:00Z"),
+                _pull_request(2, "2024-01-02T10:00:00Z", reviewers=2),
+            ],
+            covered_from="2024-01-01T00:00:00Z",
+            watermark="2024-01-02T10:00:00Z",
+        )
+        return store
+
+    def it_returns_the_prs_with_their_reviews(store: StateStore) -> None:
+        prs = store.get_pull_requests(OWNER, REPO, "2024-01-01T00:00:00Z")
+
+        assert prs == [
+            _pull_request(2, "2024-01-02T10:00:00Z", reviewers=2),
+            _pull_request(1, "2024-01-01T10:00:00Z"),
+        ]
+
+    def it_records_the_sync_state(store: StateStore) -> None:
+        assert store.get_sync_state(OWNER, REPO, PULL_REQUESTS) == SyncState(
+            covered_from="2024-01-01T00:00:00Z", watermark="2024-01-02T10:00:00Z"
+        )
+
+    def it_replaces_the_reviews_of_a_pr_fetched_again(store: StateStore) -> None:
+        store.record_pull_requests(
+            OWNER,
+            REPO,
+            [_pull_request(2, "2024-01-02T10:00:00Z", reviewers=3)],
+            covered_from="2024-01-01T00:00:00Z",
+            watermark="2024-01-02T10:00:00Z",
+        )
+
+        prs = store.get_pull_requests(OWNER, REPO, "2024-01-01T00:00:00Z")
+
+        assert [len(pr["reviews"]) for pr in prs] == [3, 1]
+
+    def it_prunes_prs_merged_before_the_covered_period(store: StateStore) -> None:
+        store.record_pull_requests(
+            OWNER,
+            REPO,
+            [],
+            covered_from="2024-01-02T00:00:00Z",
+            watermark="2024-01-02T10:00:00Z",
+        )
+
+        prs = store.get_pull_requests(OWNER, REPO, "2023-12-01T00:00:00Z")
+
+        assert [pr["number"] for pr in prs] == [2]
+
+    def it_counts_the_sync(store: StateStore) -> None:
+        assert store.summary() == {PULL_REQUESTS: {"syncs": 1, "fetched": 2}}
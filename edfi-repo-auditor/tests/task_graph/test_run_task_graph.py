@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import threading
+import time
+
+import pytest
+
+from edfi_repo_auditor.task_graph import Task, TaskTimeoutError, run_task_graph
+
+
+def describe_when_running_a_task_graph() -> None:
+    def describe_given_no_tasks() -> None:
+        def it_returns_no_results() -> None:
+            assert run_task_graph([]) == {}
+
+    def describe_given_independent_tasks() -> None:
+        def it_returns_each_result_by_name() -> None:
+            results = run_task_graph([Task("a", lambda: 1), Task("b", lambda: 2)])
+
+            assert results == {"a": 1, "b": 2}
+
+        def it_runs_them_concurrently() -> None:
+            # Neither task can pass the barrier unless both are running.
+            barrier = threading.Barrier(2, timeout=2)
+
+            results = run_task_graph(
+                [
+                    Task("a", lambda: barrier.wait() >= 0),
+                    Task("b", lambda: barrier.wait() >= 0),
+                ]
+            )
+
+            assert results == {"a": True, "b": True}
+
+    def describe_given_dependent_tasks() -> None:
+        def it_passes_dependency_results_in_order() -> None:
+            results = run_task_graph(
+                [
+                    Task("sum", lambda a, b: a + b, depends_on=("a", "b")),
+                    Task("a", lambda: 1),
+                    Task("b", lambda: 10),
+                ]
+            )
+
+            assert results["sum"] == 11
+
+    def describe_given_an_invalid_graph() -> None:
+        def it_rejects_an_unknown_dependency() -> None:
+            with pytest.raises(ValueError):
+                run_task_graph([Task("a", lambda x: x, depends_on=("missing",))])
+
+        def it_rejects_a_cycle() -> None:
+            with pytest.raises(ValueError):
+                run_task_graph(
+                    [
+                        Task("a", lambda b: b, depends_on=("b",)),
+                        Task("b", lambda a: a, depends_on=("a",)),
+                    ]
+                )
+
+        def it_rejects_duplicate_names() -> None:
+            with pytest.raises(ValueError):
+                run_task_graph([Task("a", lambda: 1), Task("a", lambda: 2)])
+
+    def describe_given_a_task_that_times_out() -> None:
+        def it_uses_the_fallback_result() -> None:
+            release = threading.Event()
+            try:
+                results = run_task_graph(
+                    [
+                        Task("fast", lambda: 1),
+                        Task(
+                            "slow",
+                            lambda: release.wait(2),
+                            timeout=0.05,
+                            on_error=lambda e: type(e).__name__,
+                        ),
+                    ]
+                )
+            finally:
+                release.set()
+
+            assert results == {"fast": 1, "slow": "TaskTimeoutError"}
+
+        def it_raises_without_a_fallback() -> None:
+            release = threading.Event()
+            try:
+                with pytest.raises(TaskTimeoutError):
+                    run_task_graph(
+                        [Task("slow", lambda: release.wait(2), timeout=0.05)]
+                    )
+            finally:
+                release.set()
+
+    def describe_given_a_task_that_fails() -> None:
+        def it_cancels_tasks_that_have_not_started() -> None:
+            ran = []
+
+            def fail() -> None:
+                raise RuntimeError("boom")
+
+            with pytest.raises(RuntimeError):
+                run_task_graph(
+                    [
+                        Task("fail", fail),
+                        Task(
+                            "after", lambda _: ran.append("after"), depends_on=("fail",)
+                        ),
+                    ]
+                )
+
+            time.sleep(0.01)
+            assert ran == []
+
+        def it_uses_the_fallback_result_when_given() -> None:
+            def fail() -> None:
+                raise RuntimeError("boom")
+
+            results = run_task_graph([Task("fail", fail, on_error=lambda e: str(e))])
+
+            assert results == {"fail": "boom"}
@@ -9,6 +9,7 @@ from edfi_repo_auditor.config import (
     Configuration,
     load_configuration,
     DEFAULT_LOG_LEVEL,
+    DEFAULT_POOL_SIZE,
 )
 
 ORGANIZATION_1 = "$$Ed-Fi-Alliance-OSS"
@@ -236,3 +237,204 @@ def describe_when_loading_configuration() -> None:
             clear_env, capsys, result: Configuration
         ) -> None:
             assert_no_error_reported(capsys)
+
+    def describe_given_pool_size_via_cli() -> None:
+        @pytest.fixture
+        def result() -> Configuration:
+            args_in = [
+                "-o",
+                ORGANIZATION_1,
+                "-p",
+                PERSONAL_ACCESS_TOKEN_1,
+                "--pool_size",
+                "4",
+            ]
+
+            return load_configuration(args_in)
+
+        def config_should_include_the_pool_size(
+            clear_env, result: Configuration
+        ) -> None:
+            assert result.pool_size == 4
+
+    def describe_given_no_pool_size() -> None:
+        @pytest.fixture
+        def result() -> Configuration:
+            return load_configuration(
+                ["-o", ORGANIZATION_1, "-p", PERSONAL_ACCESS_TOKEN_1]
+            )
+
+        def config_should_use_the_default_pool_size(
+            clear_env, result: Configuration
+        ) -> None:
+            assert result.pool_size == DEFAULT_POOL_SIZE
+
+    def describe_given_async_options_via_cli() -> None:
+        @pytest.fixture
+        def result() -> Configuration:
+            args_in = [
+                "-o",
+                ORGANIZATION_1,
+                "-p",
+                PERSONAL_ACCESS_TOKEN_1,
+                "--use_async",
+                "--max_concurrency",
+                "16",
+            ]
+
+            return load_configuration(args_in)
+
+        def config_should_enable_async_mode(clear_env, result: Configuration) -> None:
+            assert result.use_async is True
+
+        def config_should_include_the_max_concurrency(
+            clear_env, result: Configuration
+        ) -> None:
+            assert result.max_concurrency == 16
+
+    def describe_given_jobs_via_cli() -> None:
+        @pytest.fixture
+        def result() -> Configuration:
+            return load_configuration(
+                ["-o", ORGANIZATION_1, "-p", PERSONAL_ACCESS_TOKEN_1, "-j", "4"]
+            )
+
+        def config_should_include_the_jobs(clear_env, result: Configuration) -> None:
+            assert result.jobs == 4
+
+    def describe_given_zero_jobs() -> None:
+        def it_should_exit_with_an_error(clear_env) -> None:
+            with pytest.raises(SystemExit):
+                load_configuration(
+                    ["-o", ORGANIZATION_1, "-p", PERSONAL_ACCESS_TOKEN_1, "-j", "0"]
+                )
+
+    def describe_given_task_timeout_via_cli() -> None:
+        @pytest.fixture
+        def result() -> Configuration:
+            return load_configuration(
+                [
+                    "-o",
+                    ORGANIZATION_1,
+                    "-p",
+                    PERSONAL_ACCESS_TOKEN_1,
+                    "--task_timeout",
+                    "30",
+                ]
+            )
+
+        def config_should_include_the_task_timeout(
+            clear_env, result: Configuration
+        ) -> None:
+            assert result.task_timeout == 30.0
+
+    def describe_given_cache_dir_via_cli() -> None:
+        @pytest.fixture
+        def result() -> Configuration:
+            return load_configuration(
+                [
+                    "-o",
+                    ORGANIZATION_1,
+                    "-p",
+                    PERSONAL_ACCESS_TOKEN_1,
+                    "--cache_dir",
+                    ".cache/github",
+                ]
+            )
+
+        def config_should_include_the_cache_dir(
+            clear_env, result: Configuration
+        ) -> None:
+            assert result.cache_dir == ".cache/github"
+
+    def describe_given_state_db_via_cli() -> None:
+        @pytest.fixture
+        def result() -> Configuration:
+            return load_configuration(
+                [
+                    "-o",
+                    ORGANIZATION_1,
+                    "-p",
+                    PERSONAL_ACCESS_TOKEN_1,
+                    "--state_db",
+                    ".cache/state.db",
+                ]
+            )
+
+        def config_should_include_the_state_db(
+            clear_env, result: Configuration
+        ) -> None:
+            assert result.state_db == ".cache/state.db"
+
+    def describe_given_a_phase_and_snapshot_dir_via_cli() -> None:
+        @pytest.fixture
+        def result() -> Configuration:
+            return load_configuration(
+                [
+                    "-o",
+                    ORGANIZATION_1,
+                    "-p",
+                    PERSONAL_ACCESS_TOKEN_1,
+                    "--phase",
+                    "compute",
+                    "--snapshot_dir",
+                    "snapshots/2024-01-31",
+                ]
+            )
+
+        def config_should_include_the_phase(clear_env, result: Configuration) -> None:
+            assert result.phase == "compute"
+
+        def config_should_include_the_snapshot_dir(
+            clear_env, result: Configuration
+        ) -> None:
+            assert result.snapshot_dir == "snapshots/2024-01-31"
+
+    def describe_given_a_phase_without_snapshot_dir() -> None:
+        def it_should_exit_with_an_error(clear_env) -> None:
+            with pytest.raises(SystemExit):
+                load_configuration(
+                    [
+                        "-o",
+                        ORGANIZATION_1,
+                        "-p",
+                        PERSONAL_ACCESS_TOKEN_1,
+                        "--phase",
+                        "collect",
+                    ]
+                )
+
+    def describe_given_the_compute_phase_without_organization_or_token() -> None:
+        @pytest.fixture
+        def result(clear_env) -> Configuration:
+            return load_configuration(
+                ["--phase", "compute", "--snapshot_dir", "snapshots/2024-01-31"]
+            )
+
+        def config_should_have_a_blank_organization(result: Configuration) -> None:
+            assert result.organization == ""
+
+        def config_should_have_a_blank_access_token(result: Configuration) -> None:
+            assert result.personal_access_token == ""
+
+    def describe_given_the_collect_phase_without_access_token() -> None:
+        def it_should_exit_with_an_error(clear_env) -> None:
+            with pytest.raises(SystemExit):
+                load_configuration(
+                    [
+                        "-o",
+                        ORGANIZATION_1,
+                        "--phase",
+                        "collect",
+                        "--snapshot_dir",
+                        "snapshots/2024-01-31",
+                    ]
+                )
+
+    def describe_given_no_phase() -> None:
+        def it_should_run_the_whole_audit(clear_env) -> None:
+            result = load_configuration(
+                ["-o", ORGANIZATION_1, "-p", PERSONAL_ACCESS_TOKEN_1]
+            )
+
+            assert result.phase == "all"
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from edfi_repo_auditor.checklist import CHECKLIST, CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+from edfi_repo_auditor.workflow_scan import WorkflowScan
+
+SCANNER = (
+    "uses: Ed-Fi-Alliance-OSS/Ed-Fi-Actions/.github/workflows/repository-scanner.yml"
+)
+REPORTER = "uses: dorny/test-reporter@v1"
+UNIT_TESTS = "name: Run Unit Tests"
+CODEQL = "uses: github/codeql-action/analyze@v3"
+
+
+def _scan(*files: str) -> WorkflowScan:
+    scan = WorkflowScan()
+    for file in files:
+        scan.add(file)
+    return scan
+
+
+def describe_when_scanning_workflows() -> None:
+    def describe_given_no_file_could_be_read() -> None:
+        def it_reports_no_workflow_checks() -> None:
+            assert _scan("", None).results() == {}  # type: ignore[arg-type]
+
+    def describe_given_one_file_matches_every_check() -> None:
+        def it_is_complete() -> None:
+            scan = WorkflowScan()
+
+            assert scan.add("\n".join([CODEQL, UNIT_TESTS, REPORTER, SCANNER]))
+            assert all(
+                result == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+                for result in scan.results().values()
+            )
+
+    def describe_given_checks_spread_across_files() -> None:
+        def it_passes_each_check_matched_by_any_file() -> None:
+            scan = _scan(SCANNER, CODEQL, "on: push")
+
+            results = scan.results()
+
+            assert not scan.complete
+            assert (
+                results[CHECKLIST.APPROVED_ACTIONS["description"]]
+                == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+            )
+            assert (
+                results[CHECKLIST.CODEQL["description"]]
+                == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+            )
+            assert (
+                results[CHECKLIST.TEST_REPORTER["description"]]
+                == CHECKLIST.TEST_REPORTER["fail"]
+            )
+
+    def describe_given_one_match_contains_another() -> None:
+        def it_reports_both() -> None:
+            scan = _scan("uses: EnricoMi/publish-unit-test-result-action@v2")
+
+            assert scan.matched == {"test_reporter", "unit_tests"}
+
+    def describe_given_different_letter_case() -> None:
+        def it_ignores_case_for_the_scanner_and_unit_tests() -> None:
+            scan = _scan(SCANNER.upper(), "UNIT_TEST")
+
+            assert scan.matched == {"approved_actions", "unit_tests"}
+
+        def it_respects_case_for_reporter_and_codeql() -> None:
+            scan = _scan(REPORTER.upper(), CODEQL.upper())
+
+            assert scan.matched == set()
+
+    def it_reports_results_in_checklist_order() -> None:
+        assert list(_scan(CODEQL).results()) == [
+            CHECKLIST.APPROVED_ACTIONS["description"],
+            CHECKLIST.TEST_REPORTER["description"],
+            CHECKLIST.UNIT_TESTS["description"],
+            CHECKLIST.CODEQL["description"],
+        ]